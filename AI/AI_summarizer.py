@@ -1,21 +1,77 @@
 # AI 요약 기능
 
 from openai import OpenAI
-from config import OPENAI_API_KEY
+import openai
+import httpx
+from config import (OPENAI_API_KEY, SUMMARY_BATCH_SIZE, SUMMARY_BATCH_TOKEN_BUDGET, PIPELINE_SUMMARY_WORKERS,
+                    SUMMARY_STREAMING, SUMMARY_DEADLINE, SUMMARY_BACKEND)
 from crawler.notice_crawler import fetch_notice_content
+import time
 import sys
 import os
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import get_logger
+from AI.summary_cache import get_summary_cache, make_cache_key
+from AI.prompts import SUMMARY_MODEL, PROMPT_VERSION, SYSTEM_PROMPT, build_prompt
+from AI.text_preprocessor import prepare_content
+from AI.local_summarizer import summarize_notice_local, summarize_notices_local
+from AI.async_summarizer import summarize_notices_async, run_async, finish_partial_summary, metrics
 
 logger = get_logger("ai")
 
 # OpenAI 클라이언트 설정
-client = OpenAI(api_key=OPENAI_API_KEY)
+# SDK 자동 재시도는 요청마다 timeout을 새로 적용해 요약당 마감 시간을 몇 배로 늘리므로 끔 (비동기 경로와 같음)
+client = OpenAI(api_key=OPENAI_API_KEY, max_retries=0)
 
-def summarize_notice(title, content, max_length=250):
+def stream_summary(request, deadline=SUMMARY_DEADLINE):
+    """
+    요약을 스트리밍으로 받으며 마감 시간이 지나거나 도중에 연결이 끊기면 받은 부분까지만 반환합니다.
+    
+    Args:
+        request (dict): chat.completions.create 인자
+        deadline (float): 최대 대기 시간(초)
+    
+    Returns:
+        tuple: (받은 텍스트, 마감 시간 초과 또는 중단 여부)
+    """
+    parts = []
+    started = time.monotonic()
+    ttft, usage = None, None
+    timed_out = interrupted = False
+    
+    # 청크 사이가 멈춰도 마감 시간을 넘기지 않도록 읽기 타임아웃도 같이 설정
+    stream = client.chat.completions.create(stream=True, stream_options={"include_usage": True},
+                                            timeout=deadline, **request)
+    try:
+        for chunk in stream:
+            if getattr(chunk, 'usage', None) is not None:
+                usage = chunk.usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                if ttft is None:
+                    ttft = time.monotonic() - started
+                parts.append(chunk.choices[0].delta.content)
+            if time.monotonic() - started > deadline:
+                timed_out = True
+                break
+    except (httpx.TransportError, openai.APIConnectionError) as e:
+        # 읽기 타임아웃/연결 끊김은 받은 부분까지 사용 (SDK는 스트림 도중 오류를 httpx 예외 그대로 전달)
+        logger.warning(f"AI 스트리밍 중단: {e}")
+        timed_out = isinstance(e, (httpx.TimeoutException, openai.APITimeoutError))
+        interrupted = True
+    finally:
+        stream.close()
+    
+    total = time.monotonic() - started
+    metrics.record_stream(ttft, usage)
+    if timed_out:
+        metrics.record_deadline_miss()
+    ttft_text = f"{ttft:.2f}초" if ttft is not None else "없음"
+    logger.info(f"AI 스트리밍 응답: 첫 토큰 {ttft_text}, 전체 {total:.2f}초")
+    return ''.join(parts), timed_out or interrupted
+
+def summarize_notice(title, content, max_length=250, deadline=SUMMARY_DEADLINE, backend=None, body=None):
     """
     공지사항을 AI로 요약합니다.
     
@@ -23,43 +79,118 @@ def summarize_notice(title, content, max_length=250):
         title (str): 공지사항 제목
         content (str): 공지사항 내용
         max_length (int): 요약 최대 길이
+        deadline (float): 최대 대기 시간(초, 초과 시 부분 요약 또는 로컬 요약 사용)
+        backend (str): 요약 방식 ('openai' 또는 'local', 없으면 SUMMARY_BACKEND)
+        body (str): 로컬 요약에 사용할 본문 (없으면 content)
     
     Returns:
         str: 요약된 내용
     """
+    if (backend or SUMMARY_BACKEND) == "local":
+        return summarize_notice_local(title, body or content, max_length)
+    
+    cache = get_summary_cache()
+    cache_key = make_cache_key(title, content, SUMMARY_MODEL, max_length, PROMPT_VERSION)
+    cached_summary = cache.get(cache_key)
+    if cached_summary is not None:
+        logger.info(f"AI 요약 캐시 사용: {title}")
+        return cached_summary
+    
     logger.start("AI 요약 생성 중...")
     try:
-        prompt = f"""
-다음 공지사항을 간단하고 명확하게 요약해주세요:
-
-제목: {title}
-내용: {content}
-
-요구사항:
-- 핵심 내용만 추출
-- {max_length}자 이내로 요약
-- 학생들이 알아야 할 중요한 정보 위주로
-- 카테고리, 분야, 마감일, 신청기간 등 중요 정보 포함
-"""
-
-        # OpenAI API 호출
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
+        prompt = build_prompt(title, prepare_content(content), max_length)
+        request = dict(
+            model=SUMMARY_MODEL,
             messages=[
-                {"role": "system", "content": "당신은 대학교 공지사항을 간결하게 요약하는 전문가입니다."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt}
             ],
             max_tokens=max_length,
             temperature=0.3
         )
         
-        summary = response.choices[0].message.content.strip()
+        # OpenAI API 호출
+        if SUMMARY_STREAMING:
+            summary, timed_out = stream_summary(request, deadline)
+            if timed_out:
+                logger.warning(f"AI 요약 마감 시간 초과 ({title}), 부분 요약 사용")
+                return finish_partial_summary(summary, title, body or content, max_length)
+            summary = summary.strip()
+        else:
+            response = client.chat.completions.create(timeout=deadline, **request)
+            summary = response.choices[0].message.content.strip()
+        
+        cache.set(cache_key, summary)
+        cache.flush()
         logger.success(f"AI 요약 완료: {len(summary)}자")
         return summary
         
+    except openai.APITimeoutError:
+        metrics.record_deadline_miss()
+        logger.warning(f"AI 요약 마감 시간 초과 ({title}), 로컬 요약 사용")
+        return summarize_notice_local(title, body or content, max_length)
     except Exception as e:
-        logger.error(f"AI 요약 오류: {e}")
-        return f"요약 실패: {title}"
+        logger.error(f"AI 요약 오류, 로컬 요약 사용: {e}")
+        return summarize_notice_local(title, body or content, max_length)
+
+def summarize_notices_openai(notices, max_length=250, batch_size=SUMMARY_BATCH_SIZE,
+                             token_budget=SUMMARY_BATCH_TOKEN_BUDGET, concurrency=PIPELINE_SUMMARY_WORKERS,
+                             deadline=SUMMARY_DEADLINE):
+    """
+    여러 공지사항을 묶어서 동시에 요약합니다. (비동기 요약 경로를 동기 코드에서 사용)
+    
+    Args:
+        notices (list): [{'title', 'content'}] 목록
+        max_length (int): 공지사항별 요약 최대 길이
+        batch_size (int): 한 요청에 담을 최대 공지사항 수
+        token_budget (int): 한 요청에 담을 입력의 최대 추정 토큰 수
+        concurrency (int): 동시에 보낼 최대 요청 수
+        deadline (float): 요청 하나당 최대 대기 시간(초)
+    
+    Returns:
+        list: 요약 목록 (입력 순서 유지)
+    """
+    return run_async(summarize_notices_async(notices, max_length, batch_size, token_budget, concurrency, deadline))
+
+def _summarize_notices_local(notices, max_length=250, **options):
+    """로컬 요약은 네트워크 요청이 없으므로 묶음/동시성 옵션을 무시"""
+    return summarize_notices_local(notices, max_length)
+
+# 요약 방식 목록: 이름 -> summarize(notices, max_length, **options) 함수
+SUMMARIZER_BACKENDS = {
+    "openai": summarize_notices_openai,
+    "local": _summarize_notices_local,
+}
+
+def get_summarizer(backend=None):
+    """
+    요약 방식에 맞는 요약 함수를 반환합니다.
+    
+    Args:
+        backend (str): 요약 방식 이름 (없으면 SUMMARY_BACKEND)
+    
+    Returns:
+        function: summarize(notices, max_length, **options) -> list
+    """
+    name = backend or SUMMARY_BACKEND
+    if name not in SUMMARIZER_BACKENDS:
+        raise ValueError(f"알 수 없는 요약 방식: {name} (가능: {', '.join(SUMMARIZER_BACKENDS)})")
+    return SUMMARIZER_BACKENDS[name]
+
+def summarize_notices(notices, max_length=250, backend=None, **options):
+    """
+    여러 공지사항을 선택한 방식으로 요약합니다.
+    
+    Args:
+        notices (list): [{'title', 'content', 'body'(선택, 로컬 요약에 사용할 본문)}] 목록
+        max_length (int): 공지사항별 요약 최대 길이
+        backend (str): 요약 방식 ('openai' 또는 'local', 없으면 SUMMARY_BACKEND)
+        **options: 요약 방식별 옵션 (batch_size, token_budget, concurrency, deadline)
+    
+    Returns:
+        list: 요약 목록 (입력 순서 유지)
+    """
+    return get_summarizer(backend)(notices, max_length, **options)
 
 if __name__ == "__main__":
     # 테스트용 코드
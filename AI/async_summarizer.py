@@ -0,0 +1,438 @@
+# 비동기 AI 요약
+# AsyncOpenAI 클라이언트로 여러 요약을 동시에 요청하되, 동시 요청 수를 제한하고
+# 429/5xx 응답은 retry-after 헤더와 지터를 섞은 지수 백오프로 재시도
+# 요약마다 마감 시간을 두어 느린 응답 하나가 전체 알림을 붙잡지 않도록 함
+
+from openai import AsyncOpenAI, APIStatusError, APIConnectionError, APITimeoutError
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import threading
+import asyncio
+import httpx
+import random
+import time
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (OPENAI_API_KEY, SUMMARY_BATCH_SIZE, SUMMARY_BATCH_TOKEN_BUDGET, PIPELINE_SUMMARY_WORKERS,
+                    SUMMARY_MAX_RETRIES, SUMMARY_REQUEST_TIMEOUT, SUMMARY_STREAMING, SUMMARY_DEADLINE)
+from utils.logger import get_logger
+from AI.summary_cache import get_summary_cache, make_cache_key
+from AI.prompts import (SUMMARY_MODEL, PROMPT_VERSION, SYSTEM_PROMPT, build_prompt, build_batch_prompt,
+                        parse_batch_response, plan_batches)
+from AI.text_preprocessor import prepare_content
+from AI.local_summarizer import summarize_notice_local
+
+logger = get_logger("ai")
+
+BACKOFF_BASE = 1.0   # 첫 재시도 대기 시간(초)
+BACKOFF_MAX = 30.0   # 최대 대기 시간(초)
+PARTIAL_MIN_LENGTH = 40  # 마감 시간 초과 시 이보다 짧은 부분 응답은 버리고 로컬 요약 사용
+
+class SummaryMetrics:
+    """요약 요청의 지연 시간과 토큰 사용량 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.failures = 0
+            self.retries = 0
+            self.total_latency = 0.0
+            self.max_latency = 0.0
+            self.prompt_tokens = 0
+            self.completion_tokens = 0
+            self.streams = 0
+            self.total_ttft = 0.0
+            self.max_ttft = 0.0
+            self.deadline_misses = 0
+
+    def record_success(self, latency, usage):
+        with self._lock:
+            self.requests += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            if usage is not None:
+                self.prompt_tokens += getattr(usage, 'prompt_tokens', 0) or 0
+                self.completion_tokens += getattr(usage, 'completion_tokens', 0) or 0
+
+    def record_retry(self):
+        with self._lock:
+            self.retries += 1
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+
+    def record_stream(self, ttft, usage):
+        with self._lock:
+            self.streams += 1
+            if ttft is not None:
+                self.total_ttft += ttft
+                self.max_ttft = max(self.max_ttft, ttft)
+            if usage is not None:
+                self.prompt_tokens += getattr(usage, 'prompt_tokens', 0) or 0
+                self.completion_tokens += getattr(usage, 'completion_tokens', 0) or 0
+
+    def record_deadline_miss(self):
+        with self._lock:
+            self.deadline_misses += 1
+
+    def snapshot(self):
+        """
+        현재까지의 집계를 반환합니다.
+
+        Returns:
+            dict: 요청 수, 실패/재시도 수, 평균/최대 지연 시간(초), 토큰 사용량,
+                  스트리밍 첫 토큰까지의 평균/최대 시간(초), 마감 시간 초과 수
+        """
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'failures': self.failures,
+                'retries': self.retries,
+                'avg_latency': round(self.total_latency / self.requests, 3) if self.requests else 0.0,
+                'max_latency': round(self.max_latency, 3),
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'avg_ttft': round(self.total_ttft / self.streams, 3) if self.streams else 0.0,
+                'max_ttft': round(self.max_ttft, 3),
+                'deadline_misses': self.deadline_misses
+            }
+
+metrics = SummaryMetrics()
+
+
+# 클라이언트와 이벤트 루프는 백그라운드 스레드에 하나만 유지 (연결 재사용)
+_client = None
+_loop = None
+_loop_lock = threading.Lock()
+
+def get_async_client():
+    """공유 AsyncOpenAI 클라이언트를 반환합니다. (재시도는 직접 처리하므로 SDK 재시도는 끔)"""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=0, timeout=SUMMARY_REQUEST_TIMEOUT)
+    return _client
+
+def _get_loop():
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="gn-ai-loop", daemon=True).start()
+        return _loop
+
+def run_async(coro):
+    """
+    동기 코드에서 코루틴을 공유 이벤트 루프에서 실행하고 결과를 기다립니다.
+
+    Args:
+        coro (coroutine): 실행할 코루틴
+
+    Returns:
+        코루틴의 결과
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+def _is_retryable(error):
+    if isinstance(error, (APIConnectionError, APITimeoutError)):
+        return True
+    return isinstance(error, APIStatusError) and (error.status_code == 429 or error.status_code >= 500)
+
+def _retry_delay(error, attempt):
+    """
+    재시도 대기 시간을 계산합니다. retry-after 헤더가 있으면 따르고, 없으면 지터를 섞은 지수 백오프를 사용합니다.
+
+    Args:
+        error (Exception): 발생한 오류
+        attempt (int): 지금까지 시도한 횟수 (1부터)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None) or {}
+
+    retry_after = None
+    try:
+        if headers.get('retry-after-ms'):
+            retry_after = float(headers['retry-after-ms']) / 1000
+        elif headers.get('retry-after'):
+            value = headers['retry-after']
+            try:
+                retry_after = float(value)
+            except ValueError:
+                retry_after = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+    except Exception:
+        retry_after = None
+
+    if retry_after is not None and retry_after >= 0:
+        return min(retry_after, BACKOFF_MAX) + random.uniform(0, 0.5)
+
+    backoff = min(BACKOFF_BASE * (2 ** (attempt - 1)), BACKOFF_MAX)
+    return random.uniform(backoff / 2, backoff)
+
+async def create_completion(semaphore, max_retries=SUMMARY_MAX_RETRIES, **kwargs):
+    """
+    동시 요청 수를 제한하고 재시도하며 Chat Completion을 요청합니다.
+
+    Args:
+        semaphore (asyncio.Semaphore): 동시 요청 수 제한
+        max_retries (int): 최대 재시도 횟수
+        **kwargs: chat.completions.create 인자
+
+    Returns:
+        ChatCompletion: 모델 응답
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            async with semaphore:
+                started = time.monotonic()
+                response = await get_async_client().chat.completions.create(**kwargs)
+            metrics.record_success(time.monotonic() - started, getattr(response, 'usage', None))
+            return response
+        except Exception as e:
+            if not _is_retryable(e) or attempt > max_retries:
+                metrics.record_failure()
+                raise
+            delay = _retry_delay(e, attempt)
+            metrics.record_retry()
+            logger.warning(f"AI 요청 재시도 ({attempt}/{max_retries}), {delay:.1f}초 후: {e}")
+            await asyncio.sleep(delay)
+
+async def stream_completion(semaphore, deadline=SUMMARY_DEADLINE, **kwargs):
+    """
+    Chat Completion을 스트리밍으로 받으며 마감 시간을 지킵니다. (요청 대기와 재시도 시간 포함, 도중에 연결이 끊기면 받은 부분까지)
+
+    Args:
+        semaphore (asyncio.Semaphore): 동시 요청 수 제한
+        deadline (float): 최대 대기 시간(초)
+        **kwargs: chat.completions.create 인자
+
+    Returns:
+        tuple: (받은 텍스트, 마감 시간 초과 또는 중단 여부)
+    """
+    parts = []
+    started = time.monotonic()
+    state = {'ttft': None, 'usage': None, 'interrupted': False}
+
+    async def consume():
+        stream = await create_completion(semaphore, stream=True, stream_options={"include_usage": True}, **kwargs)
+        try:
+            async for chunk in stream:
+                if getattr(chunk, 'usage', None) is not None:
+                    state['usage'] = chunk.usage
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if state['ttft'] is None:
+                        state['ttft'] = time.monotonic() - started
+                    parts.append(delta)
+        except (httpx.TransportError, APIConnectionError) as e:
+            # 읽기 오류/연결 끊김은 받은 부분까지 사용 (SDK는 스트림 도중 오류를 httpx 예외 그대로 전달)
+            logger.warning(f"AI 스트리밍 중단: {e}")
+            state['interrupted'] = True
+        finally:
+            await stream.close()
+
+    timed_out = False
+    try:
+        await asyncio.wait_for(consume(), timeout=deadline)
+    except asyncio.TimeoutError:
+        timed_out = True
+        metrics.record_deadline_miss()
+    timed_out = timed_out or state['interrupted']
+
+    total = time.monotonic() - started
+    metrics.record_stream(state['ttft'], state['usage'])
+    ttft_text = f"{state['ttft']:.2f}초" if state['ttft'] is not None else "없음"
+    logger.info(f"AI 스트리밍 응답: 첫 토큰 {ttft_text}, 전체 {total:.2f}초{' (마감 시간 초과)' if timed_out else ''}")
+    return ''.join(parts), timed_out
+
+def finish_partial_summary(partial, title, content, max_length=250):
+    """
+    마감 시간 안에 끝나지 않은 요약을 정리합니다. 받은 부분이 너무 짧으면 로컬 요약을 사용합니다.
+
+    Args:
+        partial (str): 마감 시간까지 받은 요약
+        title (str): 공지사항 제목
+        content (str): 공지사항 내용 (로컬 요약에 사용)
+        max_length (int): 요약 최대 길이
+
+    Returns:
+        str: 요약
+    """
+    partial = partial.strip()
+    if len(partial) < PARTIAL_MIN_LENGTH:
+        return summarize_notice_local(title, content, max_length)
+
+    # 마지막 완결 문장까지만 남김
+    cut = max(partial.rfind(mark) for mark in ('.', '!', '?', '\n'))
+    if cut >= PARTIAL_MIN_LENGTH:
+        partial = partial[:cut + 1].rstrip()
+    return partial + ' …'
+
+async def summarize_notice_async(title, content, semaphore, max_length=250, deadline=SUMMARY_DEADLINE, body=None,
+                                 check_cache=True):
+    """
+    공지사항 하나를 비동기로 요약합니다.
+
+    Args:
+        title (str): 공지사항 제목
+        content (str): 공지사항 내용
+        semaphore (asyncio.Semaphore): 동시 요청 수 제한
+        max_length (int): 요약 최대 길이
+        deadline (float): 최대 대기 시간(초)
+        body (str): 로컬 요약에 사용할 본문 (없으면 content)
+        check_cache (bool): 캐시를 먼저 확인 (이미 캐시에 없다고 확인한 공지사항이면 False, 적중/실패를 두 번 세지 않도록)
+
+    Returns:
+        str: 요약된 내용 (마감 시간 초과나 오류 시 부분 요약 또는 로컬 요약, 캐시하지 않음)
+    """
+    cache = get_summary_cache()
+    cache_key = make_cache_key(title, content, SUMMARY_MODEL, max_length, PROMPT_VERSION)
+    if check_cache:
+        cached_summary = cache.get(cache_key)
+        if cached_summary is not None:
+            return cached_summary
+
+    request = dict(
+        model=SUMMARY_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_prompt(title, prepare_content(content), max_length)}
+        ],
+        max_tokens=max_length,
+        temperature=0.3
+    )
+    try:
+        if SUMMARY_STREAMING:
+            summary, timed_out = await stream_completion(semaphore, deadline, **request)
+            if timed_out:
+                logger.warning(f"AI 요약 마감 시간 초과 ({title}), 부분 요약 사용")
+                return finish_partial_summary(summary, title, body or content, max_length)
+            summary = summary.strip()
+        else:
+            response = await asyncio.wait_for(create_completion(semaphore, **request), timeout=deadline)
+            summary = response.choices[0].message.content.strip()
+        cache.set(cache_key, summary)
+        return summary
+    except asyncio.TimeoutError:
+        metrics.record_deadline_miss()
+        logger.warning(f"AI 요약 마감 시간 초과 ({title}), 로컬 요약 사용")
+        return summarize_notice_local(title, body or content, max_length)
+    except Exception as e:
+        logger.error(f"AI 요약 오류 ({title}), 로컬 요약 사용: {e}")
+        return summarize_notice_local(title, body or content, max_length)
+
+async def summarize_batch_async(notices, semaphore, max_length=250):
+    """
+    여러 공지사항을 한 번의 요청으로 요약합니다.
+
+    Returns:
+        dict: {묶음 내 위치: 요약} (해석에 실패한 공지사항은 빠짐)
+    """
+    try:
+        response = await create_completion(
+            semaphore,
+            model=SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": build_batch_prompt(notices, max_length)}
+            ],
+            max_tokens=(max_length + 50) * len(notices),
+            temperature=0.3,
+            response_format={"type": "json_object"}
+        )
+    except Exception as e:
+        logger.error(f"AI 묶음 요약 오류: {e}")
+        return {}
+    return parse_batch_response(response.choices[0].message.content, len(notices))
+
+async def summarize_notices_async(notices, max_length=250, batch_size=SUMMARY_BATCH_SIZE,
+                                  token_budget=SUMMARY_BATCH_TOKEN_BUDGET, concurrency=PIPELINE_SUMMARY_WORKERS,
+                                  deadline=SUMMARY_DEADLINE):
+    """
+    여러 공지사항을 동시에 요약합니다. 캐시에 없는 공지사항만 묶음으로 요청하고,
+    묶음 응답을 해석할 수 없으면 개별 요약으로 대체합니다.
+
+    Args:
+        notices (list): [{'title', 'content', 'body'(선택, 로컬 요약에 사용할 본문)}] 목록
+        max_length (int): 공지사항별 요약 최대 길이
+        batch_size (int): 한 요청에 담을 최대 공지사항 수
+        token_budget (int): 한 요청에 담을 입력의 최대 추정 토큰 수
+        concurrency (int): 동시에 보낼 최대 요청 수
+        deadline (float): 요청 하나당 최대 대기 시간(초, 초과 시 로컬 요약 사용)
+
+    Returns:
+        list: 요약 목록 (입력 순서 유지)
+    """
+    cache = get_summary_cache()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    summaries = [None] * len(notices)
+
+    pending = []  # 캐시에 없는 공지사항의 인덱스
+    for i, notice in enumerate(notices):
+        cached_summary = cache.get(make_cache_key(notice['title'], notice['content'], SUMMARY_MODEL, max_length, PROMPT_VERSION))
+        if cached_summary is not None:
+            summaries[i] = cached_summary
+        else:
+            pending.append(i)
+
+    if not pending:
+        logger.info(f"AI 요약 캐시 사용: {len(notices)}개 전체")
+        return summaries
+
+    # 긴 본문은 토큰 한도 안으로 줄인 뒤 묶음을 나눔 (캐시 키는 원문 기준)
+    prepared = {i: {'title': notices[i]['title'], 'content': prepare_content(notices[i]['content'])} for i in pending}
+    batches = [[pending[j] for j in batch] for batch in plan_batches([prepared[i] for i in pending], batch_size, token_budget)]
+    logger.start(f"AI 요약 생성 중: {len(pending)}개 공지사항, {len(batches)}개 요청 (동시 {concurrency}개)")
+
+    async def run_batch(batch):
+        if len(batch) == 1:
+            i = batch[0]
+            summaries[i] = await summarize_notice_async(notices[i]['title'], notices[i]['content'], semaphore, max_length, deadline,
+                                                        notices[i].get('body'), check_cache=False)
+            return
+
+        try:
+            results = await asyncio.wait_for(summarize_batch_async([prepared[i] for i in batch], semaphore, max_length), timeout=deadline)
+        except asyncio.TimeoutError:
+            # 묶음 응답은 JSON이라 부분 결과를 쓸 수 없으므로 로컬 요약으로 대체
+            metrics.record_deadline_miss()
+            logger.warning(f"묶음 요약 마감 시간 초과, {len(batch)}개를 로컬 요약으로 대체합니다.")
+            for i in batch:
+                summaries[i] = summarize_notice_local(notices[i]['title'], notices[i].get('body') or notices[i]['content'], max_length)
+            return
+        missing = [i for position, i in enumerate(batch) if position not in results]
+        if missing:
+            logger.warning(f"묶음 요약 응답을 해석하지 못해 {len(missing)}개를 개별 요약합니다.")
+
+        for position, i in enumerate(batch):
+            if position in results:
+                cache.set(make_cache_key(notices[i]['title'], notices[i]['content'], SUMMARY_MODEL, max_length, PROMPT_VERSION), results[position])
+                summaries[i] = results[position]
+        fallback = await asyncio.gather(*[
+            summarize_notice_async(notices[i]['title'], notices[i]['content'], semaphore, max_length, deadline, notices[i].get('body'),
+                                   check_cache=False)
+            for i in missing
+        ])
+        for i, summary in zip(missing, fallback):
+            summaries[i] = summary
+
+    try:
+        await asyncio.gather(*[run_batch(batch) for batch in batches])
+    finally:
+        # 새 요약은 묶음이 끝난 뒤 한 번에 저장 (파일 쓰기는 스레드에서 해 이벤트 루프를 막지 않음)
+        await asyncio.to_thread(cache.flush)
+    logger.success(f"AI 요약 완료: {len(pending)}개")
+    return summaries
@@ -0,0 +1,114 @@
+# 로컬 추출 요약
+# 네트워크 없이 본문에서 기간·대상·장소·문의처를 정규식으로 뽑고 핵심 문장을 골라 요약
+# OpenAI를 쓸 수 없거나 마감 시간을 넘겼을 때의 대체 요약으로도 사용
+
+import re
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from AI.text_preprocessor import strip_boilerplate, split_sentences, score_sentence
+
+# 날짜 표현 (2024. 3. 4.(월), 2024-03-04, 3월 4일, 3. 4.(월), 10:00)
+DATE = r'(?:\d{4}\s*[.\-/년]\s*)?\d{1,2}\s*(?:[.\-/]\s*\d{1,2}\s*\.?|월\s*\d{1,2}\s*일)(?:\s*\([월화수목금토일]\))?(?:\s*\d{1,2}\s*:\s*\d{2})?'
+PERIOD_PATTERN = re.compile(rf'{DATE}\s*(?:~|～|-|부터)\s*{DATE}(?:\s*까지)?|{DATE}\s*까지')
+
+# "항목: 값" 형태의 안내 (예: "□ 신청대상 : 재학생", "2. 장소: 대학 본관")
+FIELD_LABELS = {
+    '대상': r'(?:신청|지원|모집|참여|참가)?\s*(?:대상|자격)',
+    '기간': r'(?:신청|접수|모집|운영|교육|행사|제출)?\s*(?:기간|일시|일정|마감)',
+    '장소': r'장\s*소',
+    '문의': r'문\s*의(?:처)?',
+}
+FIELD_PATTERNS = {
+    name: re.compile(rf'^[\s\-·•○●□■※◎▶▷\d.)]*{label}\s*[:：]\s*(.+)$') for name, label in FIELD_LABELS.items()
+}
+
+def _clean_value(value, limit=60):
+    value = re.sub(r'\s+', ' ', value).strip(' .,:')
+    return value if len(value) <= limit else value[:limit - 1].rstrip() + '…'
+
+def extract_key_info(content):
+    """
+    본문에서 기간, 대상, 장소, 문의처를 추출합니다.
+
+    Args:
+        content (str): 공지사항 본문
+
+    Returns:
+        dict: {'기간', '대상', '장소', '문의'} 중 찾은 항목
+    """
+    info = {}
+    lines = strip_boilerplate(content).splitlines()
+
+    for name, pattern in FIELD_PATTERNS.items():
+        for line in lines:
+            match = pattern.match(line)
+            if match and match.group(1).strip():
+                info[name] = _clean_value(match.group(1))
+                break
+
+    # 항목 형태로 적혀 있지 않으면 본문에서 기간 표현을 찾음
+    if '기간' not in info:
+        match = PERIOD_PATTERN.search(content or '')
+        if match:
+            info['기간'] = _clean_value(match.group(0))
+
+    if '대상' not in info:
+        match = re.search(r'([가-힣A-Za-z0-9 ,·]{2,30}?)\s*(?:을|를)?\s*대상으로', content or '')
+        if match:
+            info['대상'] = _clean_value(match.group(1))
+    return info
+
+def summarize_notice_local(title, content, max_length=250):
+    """
+    공지사항을 네트워크 없이 요약합니다.
+
+    Args:
+        title (str): 공지사항 제목
+        content (str): 공지사항 내용
+        max_length (int): 요약 최대 길이(자)
+
+    Returns:
+        str: 요약 (핵심 정보 한 줄 + 중요 문장)
+    """
+    info = extract_key_info(content)
+    header = ' | '.join(f"{name}: {value}" for name, value in info.items())
+
+    sentences = split_sentences(strip_boilerplate(content))
+    ranked = sorted(range(len(sentences)), key=lambda i: (-score_sentence(sentences[i], i), i))
+
+    # 핵심 정보 줄에 이미 담긴 항목 줄과 제목을 그대로 반복하는 문장은 제외
+    budget = max_length - len(header) - (1 if header else 0)
+    selected = []
+    for i in ranked:
+        sentence = sentences[i]
+        if sentence == title.strip() or any(FIELD_PATTERNS[name].match(sentence) for name in info):
+            continue
+        if len(sentence) + 1 > budget:
+            continue
+        selected.append(i)
+        budget -= len(sentence) + 1
+
+    body = ' '.join(sentences[i] for i in sorted(selected))
+    summary = '\n'.join(part for part in (header, body) if part)
+    if not summary:
+        # 고를 문장이 없으면 본문 앞부분을 사용
+        summary = ' '.join(sentences) or title
+    if len(summary) > max_length:
+        summary = summary[:max_length - 1].rstrip() + '…'
+    return summary
+
+def summarize_notices_local(notices, max_length=250):
+    """
+    여러 공지사항을 네트워크 없이 요약합니다.
+
+    Args:
+        notices (list): [{'title', 'content', 'body'(선택, 있으면 content 대신 요약할 본문)}] 목록
+        max_length (int): 공지사항별 요약 최대 길이
+
+    Returns:
+        list: 요약 목록 (입력 순서 유지)
+    """
+    return [summarize_notice_local(notice['title'], notice.get('body') or notice['content'], max_length) for notice in notices]
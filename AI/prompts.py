@@ -0,0 +1,119 @@
+# AI 요약 프롬프트
+# 동기/비동기 요약 경로가 같은 프롬프트와 캐시 키 구성을 쓰도록 한 곳에서 관리
+
+import json
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from AI.text_preprocessor import count_tokens
+
+SUMMARY_MODEL = "gpt-3.5-turbo"
+PROMPT_VERSION = 1  # 프롬프트를 바꾸면 올려서 이전 캐시를 무효화
+SYSTEM_PROMPT = "당신은 대학교 공지사항을 간결하게 요약하는 전문가입니다."
+
+def estimate_tokens(text):
+    """텍스트의 토큰 수 (tiktoken이 없으면 약 2자당 1토큰으로 추정)"""
+    return count_tokens(text)
+
+def build_prompt(title, content, max_length):
+    """
+    공지사항 하나를 요약하는 프롬프트를 생성합니다.
+
+    Returns:
+        str: 사용자 프롬프트
+    """
+    return f"""
+다음 공지사항을 간단하고 명확하게 요약해주세요:
+
+제목: {title}
+내용: {content}
+
+요구사항:
+- 핵심 내용만 추출
+- {max_length}자 이내로 요약
+- 학생들이 알아야 할 중요한 정보 위주로
+- 카테고리, 분야, 마감일, 신청기간 등 중요 정보 포함
+"""
+
+def build_batch_prompt(notices, max_length):
+    """
+    여러 공지사항을 한 번에 요약하는 프롬프트를 생성합니다.
+
+    Args:
+        notices (list): [{'title', 'content'}] 목록
+        max_length (int): 공지사항별 요약 최대 길이
+
+    Returns:
+        str: 사용자 프롬프트
+    """
+    sections = "\n\n".join(
+        f"[공지 {position + 1}]\n제목: {notice['title']}\n내용: {notice['content']}"
+        for position, notice in enumerate(notices)
+    )
+    return f"""
+다음 {len(notices)}개의 공지사항을 각각 간단하고 명확하게 요약해주세요:
+
+{sections}
+
+요구사항:
+- 공지사항마다 핵심 내용만 추출
+- 공지사항마다 {max_length}자 이내로 요약
+- 학생들이 알아야 할 중요한 정보 위주로
+- 카테고리, 분야, 마감일, 신청기간 등 중요 정보 포함
+- 반드시 다음 JSON 형식으로만 응답: {{"summaries": [{{"id": 공지 번호, "summary": "요약"}}]}}
+"""
+
+def parse_batch_response(text, count):
+    """
+    묶음 요약 응답(JSON)을 해석합니다.
+
+    Args:
+        text (str): 모델 응답
+        count (int): 묶음에 담은 공지사항 수
+
+    Returns:
+        dict: {묶음 내 위치: 요약} (해석에 실패한 공지사항은 빠짐)
+    """
+    try:
+        data = json.loads(text)
+    except (TypeError, ValueError):
+        return {}
+
+    items = data.get('summaries', []) if isinstance(data, dict) else data
+    results = {}
+    for item in items if isinstance(items, list) else []:
+        try:
+            position = int(item['id']) - 1
+            summary = str(item['summary']).strip()
+        except (KeyError, TypeError, ValueError):
+            continue
+        if 0 <= position < count and summary:
+            results[position] = summary
+    return results
+
+def plan_batches(notices, batch_size, token_budget):
+    """
+    공지사항을 개수와 토큰 예산 안에서 묶습니다.
+
+    Args:
+        notices (list): [{'title', 'content'}] 목록
+        batch_size (int): 묶음당 최대 공지사항 수
+        token_budget (int): 묶음당 입력의 최대 추정 토큰 수
+
+    Returns:
+        list: 인덱스 묶음 목록
+    """
+    batches = []
+    current, current_tokens = [], 0
+    for i, notice in enumerate(notices):
+        tokens = estimate_tokens(notice['title'] + notice['content'])
+        if current and (len(current) >= batch_size or current_tokens + tokens > token_budget):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
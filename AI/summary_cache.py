@@ -0,0 +1,164 @@
+# AI 요약 캐시
+# 같은 공지사항(제목, 내용, 모델, 길이, 프롬프트 버전)은 다시 요약하지 않도록 디스크에 저장
+# 저장은 항목마다 하지 않고 요약 묶음이 끝날 때(flush)와 프로세스 종료 시 한 번에 함
+
+from collections import OrderedDict
+import hashlib
+import atexit
+import threading
+import json
+import re
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import SUMMARY_CACHE_MAX_BYTES
+from utils.logger import get_logger
+
+logger = get_logger("ai")
+
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "summary_cache.json")
+
+def normalize_content(content):
+    """공백 차이로 캐시가 빗나가지 않도록 내용을 정규화"""
+    return re.sub(r'\s+', ' ', content or '').strip()
+
+def make_cache_key(title, content, model, max_length, prompt_version):
+    """
+    요약 캐시 키를 생성합니다. (공지사항 ID는 넣지 않아 같은 내용으로 다시 올라온 공지사항도 캐시 사용)
+
+    Returns:
+        str: sha256 해시
+    """
+    raw = json.dumps([title.strip(), normalize_content(content), model, max_length, prompt_version], ensure_ascii=False)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+class SummaryCache:
+    """크기 기준 LRU로 관리되는 디스크 요약 캐시"""
+
+    def __init__(self, cache_file=CACHE_FILE, max_bytes=SUMMARY_CACHE_MAX_BYTES):
+        """
+        Args:
+            cache_file (str): 캐시 파일 경로
+            max_bytes (int): 저장할 요약의 최대 총 크기 (초과 시 오래 사용하지 않은 항목부터 삭제)
+        """
+        self.cache_file = cache_file
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 키 -> 요약 (앞쪽일수록 오래 사용하지 않은 항목)
+        self._size = 0
+        self._dirty = False  # 저장하지 않은 변경이 있는지
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 파일 쓰기는 한 번에 하나만 (쓰는 동안에도 조회는 가능)
+        self._load()
+
+    @staticmethod
+    def _entry_size(key, summary):
+        return len(key) + len(summary.encode('utf-8'))
+
+    def _load(self):
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                for key, summary in data.get('entries', []):
+                    self._entries[key] = summary
+                    self._size += self._entry_size(key, summary)
+                self._evict()
+        except Exception as e:
+            logger.warning(f"요약 캐시 로드 실패, 빈 캐시로 시작: {e}")
+            self._entries.clear()
+            self._size = 0
+
+    def _save(self, entries):
+        """임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({'entries': entries}, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+            return True
+        except Exception as e:
+            logger.error(f"요약 캐시 저장 오류: {e}")
+            return False
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._entries:
+            key, summary = self._entries.popitem(last=False)
+            self._size -= self._entry_size(key, summary)
+
+    def get(self, key):
+        """
+        캐시된 요약을 가져옵니다.
+
+        Returns:
+            str: 요약 (없으면 None)
+        """
+        with self._lock:
+            summary = self._entries.get(key)
+            if summary is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return summary
+
+    def set(self, key, summary):
+        """요약을 캐시에 저장합니다. (파일에는 flush 때 기록)"""
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entry_size(key, self._entries.pop(key))
+            self._entries[key] = summary
+            self._size += self._entry_size(key, summary)
+            self._evict()
+            self._dirty = True
+
+    def flush(self):
+        """
+        저장하지 않은 변경이 있으면 캐시 파일에 기록합니다.
+
+        Returns:
+            bool: 파일에 기록했으면 True
+        """
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return False
+                entries = list(self._entries.items())
+                self._dirty = False
+            if self._save(entries):
+                return True
+            with self._lock:
+                self._dirty = True  # 다음 flush에서 다시 시도
+            return False
+
+    def stats(self):
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            dict: {'hits', 'misses', 'entries', 'bytes'}
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries), 'bytes': self._size}
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_summary_cache():
+    """
+    공유 요약 캐시를 반환합니다.
+
+    Returns:
+        SummaryCache: 요약 캐시
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SummaryCache()
+            # 마지막 묶음 이후 남은 변경은 종료 시 저장
+            atexit.register(_cache.flush)
+        return _cache
@@ -0,0 +1,156 @@
+# 요약 전 공지사항 본문 전처리
+# 토큰 수를 세고 상투적인 문구를 걷어낸 뒤, 그래도 길면 날짜·마감·신청 관련 문장 위주로 추출
+
+import re
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import SUMMARY_INPUT_MAX_TOKENS
+from utils.logger import get_logger
+
+logger = get_logger("ai")
+
+# tiktoken이 설치되어 있으면 정확한 토큰 수를, 없으면 추정값을 사용
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _encoding = None
+
+# 본문에서 제거할 상투 문구 (사이트 공통 영역, 저작권 안내 등)
+# 줄 전체를 지우므로 짧은 독립된 줄에만 적용 (본문이 한 줄로 이어진 공지사항에서 내용 전체가 사라지지 않도록)
+BOILERPLATE_MAX_LINE_LENGTH = 100
+BOILERPLATE_PATTERNS = [
+    re.compile(r'^(목록|이전글|다음글|인쇄|공유하기|스크랩|첨부파일\s*미리보기)\b.*$'),
+    re.compile(r'^(copyright|ⓒ|©).*$', re.IGNORECASE),
+    re.compile(r'.*무단\s*(전재|복제|배포).*'),
+]
+
+# 핵심 문장 판별용 패턴
+DATE_PATTERN = re.compile(r'\d{4}\s*[.\-/년]\s*\d{1,2}|\d{1,2}\s*[./]\s*\d{1,2}\s*\.?\s*\(|\d{1,2}\s*월\s*\d{1,2}\s*일|\d{1,2}\s*:\s*\d{2}')
+DEADLINE_PATTERN = re.compile(r'마감|까지|기한|기간|~|～|일시|일정')
+APPLY_PATTERN = re.compile(r'신청|접수|모집|제출|지원|대상|자격|선발|장소|방법|문의')
+
+# 문장 경계 (줄바꿈, 또는 마침표/물음표/느낌표 뒤 공백). "2024. 3. 4." 같은 날짜는 나누지 않음
+SENTENCE_SPLIT = re.compile(r'\n+|(?<=[^\d\s][.!?。])\s+|(?<=다\.)(?=\S)')
+
+def count_tokens(text):
+    """
+    텍스트의 토큰 수를 셉니다.
+
+    Args:
+        text (str): 텍스트
+
+    Returns:
+        int: 토큰 수 (tiktoken이 없으면 한국어 기준 약 2자당 1토큰으로 추정)
+    """
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // 2 + 1
+
+def strip_boilerplate(text):
+    """
+    상투적인 문구(BOILERPLATE_MAX_LINE_LENGTH자 이하의 줄)와 중복 줄을 제거하고 공백을 정리합니다.
+
+    Args:
+        text (str): 공지사항 본문
+
+    Returns:
+        str: 정리된 본문
+    """
+    lines = []
+    seen = set()
+    for line in (text or '').splitlines():
+        line = re.sub(r'[ \t ]+', ' ', line).strip()
+        if not line or line in seen:
+            continue
+        if len(line) <= BOILERPLATE_MAX_LINE_LENGTH and any(pattern.match(line) for pattern in BOILERPLATE_PATTERNS):
+            continue
+        seen.add(line)
+        lines.append(line)
+    return '\n'.join(lines)
+
+def split_sentences(text):
+    """본문을 문장 단위로 나눕니다."""
+    return [sentence.strip() for sentence in SENTENCE_SPLIT.split(text) if sentence and sentence.strip()]
+
+def score_sentence(sentence, position):
+    """
+    문장의 중요도를 계산합니다. 날짜, 마감, 신청 관련 표현이 있을수록, 앞쪽 문장일수록 높습니다.
+
+    Args:
+        sentence (str): 문장
+        position (int): 본문 내 문장 순서
+
+    Returns:
+        float: 중요도
+    """
+    score = 0.0
+    if DATE_PATTERN.search(sentence):
+        score += 3
+    if DEADLINE_PATTERN.search(sentence):
+        score += 2
+    score += min(len(APPLY_PATTERN.findall(sentence)), 3)
+    if position < 3:
+        score += 1.5 - position * 0.5
+    return score
+
+def truncate_tokens(text, max_tokens):
+    """토큰 수 기준으로 텍스트를 자릅니다."""
+    if count_tokens(text) <= max_tokens:
+        return text
+    if _encoding is not None:
+        return _encoding.decode(_encoding.encode(text)[:max_tokens])
+    return text[:max(0, (max_tokens - 1) * 2)]
+
+def compress_extractive(text, max_tokens):
+    """
+    중요도가 높은 문장을 원래 순서대로 골라 토큰 한도 안으로 줄입니다.
+
+    Args:
+        text (str): 본문
+        max_tokens (int): 최대 토큰 수
+
+    Returns:
+        str: 추출 요약된 본문
+    """
+    sentences = split_sentences(text)
+    ranked = sorted(range(len(sentences)), key=lambda i: (-score_sentence(sentences[i], i), i))
+
+    selected = set()
+    used_tokens = 0
+    for i in ranked:
+        tokens = count_tokens(sentences[i]) + 1
+        if used_tokens + tokens > max_tokens:
+            continue
+        selected.add(i)
+        used_tokens += tokens
+
+    if not selected:
+        # 한 문장조차 한도를 넘으면 앞부분을 잘라서 사용
+        return truncate_tokens(text, max_tokens)
+    return '\n'.join(sentences[i] for i in sorted(selected))
+
+def prepare_content(text, max_tokens=SUMMARY_INPUT_MAX_TOKENS):
+    """
+    요약 모델에 보낼 본문을 준비합니다.
+
+    Args:
+        text (str): 공지사항 본문
+        max_tokens (int): 최대 토큰 수
+
+    Returns:
+        str: 전처리된 본문 (항상 max_tokens 이하)
+    """
+    cleaned = strip_boilerplate(text)
+    original_tokens = count_tokens(cleaned)
+    if original_tokens <= max_tokens:
+        return cleaned
+
+    compressed = compress_extractive(cleaned, max_tokens)
+    logger.info(f"요약 입력 압축: {original_tokens} → {count_tokens(compressed)} 토큰")
+    return compressed
@@ -0,0 +1,299 @@
+# GachonNotifier (GN) ASGI API 서버
+# server.py와 같은 경로, JSON 응답, CORS 동작을 이벤트 루프 하나로 처리 (uvicorn으로 실행)
+# 저장소 접근과 메일 큐 등록은 스레드로 넘겨 가입이 몰려도 이벤트 루프가 막히지 않도록 함
+
+from urllib.parse import parse_qs
+import asyncio
+import json
+import io
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+
+# 환경변수 로드 (공통 처리 모듈이 환경변수를 읽기 전에)
+load_dotenv()
+
+from subscribers.subscription_service import (
+    ENVIRONMENT, IS_PRODUCTION, SUBSCRIBER_COUNT_MAX_AGE, get_cors_settings,
+    health_status, subscriber_count, subscribe, unsubscribe, error_response,
+    check_admin_token, bulk_import, batch_subscribe, bulk_export
+)
+from subscribers.bulk import FORMATS, format_from_content_type
+from notifier.mail_queue import get_mail_queue, close_mail_queue
+
+CORS_SETTINGS = get_cors_settings()
+
+# 요청 본문 최대 크기 (바이트, 일괄 가져오기/일괄 구독은 BULK_MAX_BODY_SIZE)
+MAX_BODY_SIZE = 64 * 1024
+BULK_MAX_BODY_SIZE = int(os.getenv('BULK_MAX_BODY_SIZE', str(16 * 1024 * 1024)))
+
+class RequestTooLarge(ValueError):
+    """요청 본문이 최대 크기를 넘음 (413)"""
+
+async def read_body(receive, max_size=MAX_BODY_SIZE, headers=None):
+    """
+    요청 본문을 읽습니다.
+
+    Args:
+        receive: ASGI receive 함수
+        max_size (int): 최대 크기 (바이트)
+        headers (dict): 요청 헤더 (Content-Length가 최대 크기를 넘으면 본문을 읽지 않음)
+
+    Returns:
+        bytes: 요청 본문
+
+    Raises:
+        RequestTooLarge: 본문이 최대 크기를 넘을 때
+    """
+    content_length = (headers or {}).get('content-length', '')
+    if content_length.isdigit() and int(content_length) > max_size:
+        raise RequestTooLarge("요청 본문이 너무 큽니다.")
+    body = bytearray()
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+        if len(body) > max_size:
+            raise RequestTooLarge("요청 본문이 너무 큽니다.")
+    return bytes(body)
+
+async def read_json(receive, max_size=MAX_BODY_SIZE, headers=None):
+    """
+    요청 본문을 읽어 JSON으로 해석합니다.
+
+    Args:
+        receive: ASGI receive 함수
+        max_size (int): 최대 크기 (바이트)
+        headers (dict): 요청 헤더
+
+    Returns:
+        dict: 요청 JSON (본문이 없으면 None)
+    """
+    body = await read_body(receive, max_size, headers)
+    return json.loads(body) if body else None
+
+def body_error(e):
+    """요청 본문 읽기 오류를 응답으로 변환 (크기 초과는 413)"""
+    if isinstance(e, RequestTooLarge):
+        return 413, {'success': False, 'error': str(e)}, []
+    return (*error_response(e), [])
+
+def cors_headers(headers, preflight=False):
+    """
+    CORS 응답 헤더를 만듭니다. (server.py의 flask_cors 설정과 같은 동작)
+
+    Args:
+        headers (dict): 요청 헤더 (소문자 키)
+        preflight (bool): OPTIONS 사전 요청 여부
+
+    Returns:
+        list: (이름, 값) 헤더 목록 (허용되지 않은 출처면 빈 리스트)
+    """
+    origin = headers.get('origin')
+    origins = CORS_SETTINGS['origins']
+    if not origin or (origins != "*" and origin not in origins):
+        return []
+
+    # flask_cors 기본 동작과 같이 모든 도메인을 허용해도 '*' 대신 요청 출처를 그대로 돌려줌
+    response_headers = [('access-control-allow-origin', origin), ('vary', 'Origin')]
+    if CORS_SETTINGS.get('supports_credentials'):
+        response_headers.append(('access-control-allow-credentials', 'true'))
+    if preflight:
+        response_headers.append(('access-control-allow-methods', ', '.join(sorted(CORS_SETTINGS['methods']))))
+        allowed = {name.lower() for name in CORS_SETTINGS['allow_headers']}
+        requested = [name.strip() for name in headers.get('access-control-request-headers', '').split(',')]
+        requested = [name for name in requested if name.lower() in allowed]
+        if requested:
+            response_headers.append(('access-control-allow-headers', ', '.join(requested)))
+        if CORS_SETTINGS.get('max_age'):
+            response_headers.append(('access-control-max-age', str(CORS_SETTINGS['max_age'])))
+    return response_headers
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or any(tag.removeprefix('W/').strip('"') == etag for tag in tags)
+
+async def send_response(send, status, body=None, headers=(), head=False):
+    """
+    응답을 전송합니다.
+
+    Args:
+        send: ASGI send 함수
+        status (int): 상태 코드
+        body (dict): 응답 JSON (없으면 빈 본문)
+        headers (list): 추가 헤더
+        head (bool): HEAD 요청이면 True (헤더만 전송)
+    """
+    payload = b'' if body is None else json.dumps(body, ensure_ascii=False).encode('utf-8')
+    response_headers = [(b'content-length', str(len(payload)).encode())]
+    if body is not None:
+        response_headers.append((b'content-type', b'application/json'))
+    response_headers += [(name.encode(), value.encode()) for name, value in headers]
+    await send({'type': 'http.response.start', 'status': status, 'headers': response_headers})
+    await send({'type': 'http.response.body', 'body': b'' if head else payload})
+
+async def send_stream(send, status, chunks, headers=(), head=False):
+    """
+    내용을 만들어지는 대로 나누어 전송합니다. (다음 내용은 스레드에서 만들어 이벤트 루프가 막히지 않도록 함)
+
+    Args:
+        send: ASGI send 함수
+        status (int): 상태 코드
+        chunks (iterator): 전송할 문자열
+        headers (list): 추가 헤더
+        head (bool): HEAD 요청이면 True (헤더만 전송)
+    """
+    response_headers = [(name.encode(), value.encode()) for name, value in headers]
+    await send({'type': 'http.response.start', 'status': status, 'headers': response_headers})
+    if not head:
+        while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+            await send({'type': 'http.response.body', 'body': chunk.encode('utf-8'), 'more_body': True})
+    await send({'type': 'http.response.body', 'body': b''})
+
+async def handle_health(headers, receive, query):
+    """서버 상태 확인"""
+    body, status = await asyncio.to_thread(health_status, 'GN API Server (ASGI)')
+    return status, body, []
+
+async def handle_count(headers, receive, query):
+    """구독자 수 조회 (ETag가 같으면 304)"""
+    body, status, etag = await asyncio.to_thread(subscriber_count)
+    if etag is None:
+        return status, body, []
+    cache_headers = [('etag', f'"{etag}"'), ('cache-control', f'public, max-age={SUBSCRIBER_COUNT_MAX_AGE}')]
+    if etag_matches(headers.get('if-none-match'), etag):
+        return 304, None, cache_headers
+    return status, body, cache_headers
+
+async def handle_subscribe(headers, receive, query):
+    """구독자 추가 (저장소 쓰기와 환영 이메일 등록은 스레드에서)"""
+    try:
+        data = await read_json(receive, headers=headers)
+    except Exception as e:
+        return body_error(e)
+    body, status = await asyncio.to_thread(subscribe, data)
+    return status, body, []
+
+async def handle_unsubscribe(headers, receive, query):
+    """구독자 제거"""
+    try:
+        data = await read_json(receive, headers=headers)
+    except Exception as e:
+        return body_error(e)
+    body, status = await asyncio.to_thread(unsubscribe, data)
+    return status, body, []
+
+async def handle_import(headers, receive, query):
+    """구독자 일괄 가져오기 (형식은 format 또는 Content-Type)"""
+    denied = check_admin_token(headers.get('authorization'))
+    if denied:
+        return denied[1], denied[0], []
+    try:
+        body = await read_body(receive, BULK_MAX_BODY_SIZE, headers)
+    except Exception as e:
+        return body_error(e)
+    fmt = query.get('format', [None])[0] or format_from_content_type(headers.get('content-type'))
+    lines = io.TextIOWrapper(io.BytesIO(body), encoding='utf-8-sig', newline='')
+    body, status = await asyncio.to_thread(bulk_import, lines, fmt)
+    return status, body, []
+
+async def handle_batch(headers, receive, query):
+    """이메일 목록 일괄 구독"""
+    denied = check_admin_token(headers.get('authorization'))
+    if denied:
+        return denied[1], denied[0], []
+    try:
+        data = await read_json(receive, BULK_MAX_BODY_SIZE, headers)
+    except Exception as e:
+        return body_error(e)
+    body, status = await asyncio.to_thread(batch_subscribe, data)
+    return status, body, []
+
+async def handle_export(headers, receive, query):
+    """구독자 내보내기 (저장소를 페이지 단위로 읽어 바로 전송)"""
+    denied = check_admin_token(headers.get('authorization'))
+    if denied:
+        return denied[1], denied[0], []
+    fmt = query.get('format', ['csv'])[0]
+    body, status, chunks = bulk_export(fmt, query.get('active_only', [''])[0])
+    if chunks is None:
+        return status, body, []
+    return status, chunks, [('content-type', FORMATS[fmt]),
+                            ('content-disposition', f'attachment; filename="subscribers.{fmt}"')]
+
+# 경로별 (메서드, 처리 함수)
+ROUTES = {
+    '/api/health': ('GET', handle_health),
+    '/api/subscriber/count': ('GET', handle_count),
+    '/api/subscribe': ('POST', handle_subscribe),
+    '/api/unsubscribe': ('POST', handle_unsubscribe),
+    '/api/admin/subscribers/import': ('POST', handle_import),
+    '/api/admin/subscribers/batch': ('POST', handle_batch),
+    '/api/admin/subscribers/export': ('GET', handle_export),
+}
+
+async def lifespan(receive, send):
+    """시작 시 메일 작업 큐를 띄워 스풀에 남은 메일부터 보내고, 종료 시 작업 스레드를 멈춤"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await asyncio.to_thread(get_mail_queue)
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await asyncio.to_thread(close_mail_queue)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+async def app(scope, receive, send):
+    """ASGI 애플리케이션"""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+    method = scope['method']
+    route = ROUTES.get(scope['path'])
+
+    if route is None:
+        await send_response(send, 404, {'success': False, 'error': 'Not Found'}, cors_headers(headers))
+        return
+
+    allowed_method, handler = route
+    if method == 'OPTIONS':
+        allow = [('allow', f"{allowed_method}, OPTIONS")]
+        await send_response(send, 200, None, allow + cors_headers(headers, preflight=True))
+        return
+    if method != allowed_method and not (method == 'HEAD' and allowed_method == 'GET'):
+        allow = [('allow', f"{allowed_method}, OPTIONS")]
+        await send_response(send, 405, {'success': False, 'error': 'Method Not Allowed'}, allow + cors_headers(headers))
+        return
+
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    status, body, response_headers = await handler(headers, receive, query)
+    if body is not None and not isinstance(body, dict):
+        # 내보내기처럼 내용을 나누어 보내는 응답
+        await send_stream(send, status, body, response_headers + cors_headers(headers), head=method == 'HEAD')
+        return
+    await send_response(send, status, body, response_headers + cors_headers(headers), head=method == 'HEAD')
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    # 환경변수에서 설정 가져오기 (server.py와 같은 기본 포트)
+    port = int(os.getenv('PORT', 5000 if IS_PRODUCTION else 5001))
+
+    print("\n🚀 ASGI API 서버 시작")
+    print(f"📅 시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🌐 서버 주소: http://0.0.0.0:{port}")
+    print(f"🌍 환경: {ENVIRONMENT}")
+    print(f"🔒 CORS 모드: {'프로덕션' if IS_PRODUCTION else '개발'}")
+
+    # 프로세스 하나가 이벤트 루프로 동시 요청을 처리 (예: uvicorn asgi_server:app --host 0.0.0.0 --port 5001)
+    uvicorn.run(app, host='0.0.0.0', port=port)
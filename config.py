@@ -8,6 +8,33 @@ load_dotenv()
 # TARGET_URL = "https://www.gachon.ac.kr/kor/3104/subview.do" #학사공지
 TARGET_URL = "https://www.gachon.ac.kr/kor/7986/subview.do" #전체 공지
 
+# 공지사항 게시판 목록
+# 키는 기록 구분 이름(네임스페이스), poll_interval은 게시판별 최소 확인 간격(초, 0이면 실행할 때마다 확인)
+# 게시판마다 목록 행/링크 선택자와 작성자·작성일 열 위치를 따로 지정할 수 있음
+BOARD_ROW_SELECTOR = "div.scroll-table > table.board-table.horizon > tbody > tr.thumb"
+NOTICE_BOARDS = {
+    "general": {
+        "name": "전체공지",
+        "url": TARGET_URL,
+        "row_selector": BOARD_ROW_SELECTOR,
+        "link_selector": "td.td-subject a",
+        "writer_column": 2,
+        "date_column": 3,
+        "poll_interval": 0,
+    },
+    "academic": {
+        "name": "학사공지",
+        "url": "https://www.gachon.ac.kr/kor/3104/subview.do",
+        "row_selector": BOARD_ROW_SELECTOR,
+        "link_selector": "td.td-subject a",
+        "writer_column": 2,
+        "date_column": 3,
+        "poll_interval": 0,
+    },
+}
+# 확인할 게시판 키 (쉼표로 구분)
+ENABLED_BOARDS = [key.strip() for key in os.getenv("ENABLED_BOARDS", "general").split(",") if key.strip()]
+
 # OpenAI API 키
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
@@ -23,4 +50,82 @@ EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
 EMAIL_RECEIVER = os.getenv("EMAIL_RECEIVER")
 
 # 디스코드 봇 설정
-DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
\ No newline at end of file
+DISCORD_BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
+
+# 크롤러 브라우저 풀 설정
+# Chromium은 프로세스당 하나(브라우저 전용 스레드)만 실행하고 브라우저 작업은 한 번에 하나씩 처리
+# (PIPELINE_FETCH_WORKERS, CRAWLER_BOARD_WORKERS 작업 스레드는 브라우저 스레드에 작업을 넘기고 기다림)
+BROWSER_POOL_MAX_CONTEXTS = int(os.getenv("BROWSER_POOL_MAX_CONTEXTS", "2"))
+BROWSER_POOL_PAGES_PER_CONTEXT = int(os.getenv("BROWSER_POOL_PAGES_PER_CONTEXT", "20"))
+
+# 크롤러 수집 방식 (auto: 정적 HTTP 우선 후 브라우저 대체, http: HTTP만, browser: 브라우저만)
+CRAWLER_FETCH_MODE = os.getenv("CRAWLER_FETCH_MODE", "auto")
+CRAWLER_HTTP_TIMEOUT = int(os.getenv("CRAWLER_HTTP_TIMEOUT", "10"))
+
+# 공지사항 처리 파이프라인 동시 작업 수 (상세 크롤링 / AI 요약)
+PIPELINE_FETCH_WORKERS = int(os.getenv("PIPELINE_FETCH_WORKERS", "4"))
+PIPELINE_SUMMARY_WORKERS = int(os.getenv("PIPELINE_SUMMARY_WORKERS", "3"))
+
+# SMTP 연결 풀 설정
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "3"))
+SMTP_MAX_MESSAGES_PER_CONNECTION = int(os.getenv("SMTP_MAX_MESSAGES_PER_CONNECTION", "100"))
+SMTP_TIMEOUT = int(os.getenv("SMTP_TIMEOUT", "30"))
+SMTP_MAX_RETRIES = int(os.getenv("SMTP_MAX_RETRIES", "2"))
+SMTP_IDLE_CHECK_AFTER = int(os.getenv("SMTP_IDLE_CHECK_AFTER", "30"))  # 이 시간(초) 넘게 쉰 연결은 NOOP으로 확인 후 재사용
+
+# 이메일 발송 동시 작업 수 및 초당 최대 전송 수 (0이면 제한 없음)
+EMAIL_SEND_WORKERS = int(os.getenv("EMAIL_SEND_WORKERS", str(SMTP_POOL_SIZE)))
+EMAIL_RATE_LIMIT = float(os.getenv("EMAIL_RATE_LIMIT", "10"))
+
+# 묶음(BCC) 전송 시 한 번의 SMTP 트랜잭션에 담을 수신자 수 (0이면 수신자별 개별 전송)
+EMAIL_BATCH_SIZE = int(os.getenv("EMAIL_BATCH_SIZE", "0"))
+
+# AI 요약 캐시 최대 크기 (바이트)
+SUMMARY_CACHE_MAX_BYTES = int(os.getenv("SUMMARY_CACHE_MAX_BYTES", str(5 * 1024 * 1024)))
+
+# 여러 공지사항을 한 번의 요청으로 요약할 때의 최대 개수와 입력 토큰 예산
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "5"))
+SUMMARY_BATCH_TOKEN_BUDGET = int(os.getenv("SUMMARY_BATCH_TOKEN_BUDGET", "6000"))
+
+# AI 요약 요청 재시도 설정 (429/5xx/연결 오류 시 지수 백오프)
+SUMMARY_MAX_RETRIES = int(os.getenv("SUMMARY_MAX_RETRIES", "4"))
+SUMMARY_REQUEST_TIMEOUT = float(os.getenv("SUMMARY_REQUEST_TIMEOUT", "60"))
+
+# 요약 모델에 보낼 공지사항 본문의 최대 토큰 수 (초과 시 핵심 문장만 추출)
+SUMMARY_INPUT_MAX_TOKENS = int(os.getenv("SUMMARY_INPUT_MAX_TOKENS", "1500"))
+
+# AI 요약 스트리밍 여부와 요약 하나당 최대 대기 시간(초, 초과 시 받은 부분까지 또는 본문 추출 요약 사용)
+SUMMARY_STREAMING = os.getenv("SUMMARY_STREAMING", "true").lower() == "true"
+SUMMARY_DEADLINE = float(os.getenv("SUMMARY_DEADLINE", "20"))
+
+# 요약 방식 ('openai': OpenAI 요약, 'local': 네트워크 없이 본문에서 추출)
+SUMMARY_BACKEND = os.getenv("SUMMARY_BACKEND", "openai")
+
+# 증분 크롤링 (마지막으로 본 공지사항 ID까지만 목록을 넘김) 여부와 한 번에 넘길 최대 페이지 수
+CRAWLER_INCREMENTAL = os.getenv("CRAWLER_INCREMENTAL", "true").lower() == "true"
+CRAWLER_MAX_PAGES = int(os.getenv("CRAWLER_MAX_PAGES", "5"))
+
+# 목록 크롤링 전에 게시판 변경 여부를 가벼운 HTTP 요청으로 먼저 확인할지 여부
+CRAWLER_CHANGE_PROBE = os.getenv("CRAWLER_CHANGE_PROBE", "true").lower() == "true"
+
+# 데몬 모드 폴링 간격(초): 평일 업무 시간 / 평일 업무 외 시간 / 야간·주말 / 새 공지사항 직후
+DAEMON_ACTIVE_INTERVAL = int(os.getenv("DAEMON_ACTIVE_INTERVAL", "300"))
+DAEMON_IDLE_INTERVAL = int(os.getenv("DAEMON_IDLE_INTERVAL", "1200"))
+DAEMON_QUIET_INTERVAL = int(os.getenv("DAEMON_QUIET_INTERVAL", "3600"))
+DAEMON_RECENT_INTERVAL = int(os.getenv("DAEMON_RECENT_INTERVAL", "120"))
+# 새 공지사항 발견 후 짧은 간격을 유지할 시간(초)
+DAEMON_RECENT_WINDOW = int(os.getenv("DAEMON_RECENT_WINDOW", "1800"))
+# 업무 시간과 야간 시간 (한국 시간, 시 단위)
+DAEMON_OFFICE_HOURS = tuple(int(hour) for hour in os.getenv("DAEMON_OFFICE_HOURS", "9-18").split("-"))
+DAEMON_NIGHT_HOURS = tuple(int(hour) for hour in os.getenv("DAEMON_NIGHT_HOURS", "22-7").split("-"))
+
+# 여러 게시판을 동시에 확인할 작업 수와 호스트별 최대 동시 HTTP 연결 수
+CRAWLER_BOARD_WORKERS = int(os.getenv("CRAWLER_BOARD_WORKERS", "4"))
+CRAWLER_MAX_CONNECTIONS_PER_HOST = int(os.getenv("CRAWLER_MAX_CONNECTIONS_PER_HOST", "4"))
+
+# 환영 이메일 작업 큐 (작업 수, 최대 대기 작업 수, 최대 시도 횟수, 처리 중 작업 임대 시간(초), 스풀 확인 간격(초))
+MAIL_QUEUE_WORKERS = int(os.getenv("MAIL_QUEUE_WORKERS", "2"))
+MAIL_QUEUE_MAX_SIZE = int(os.getenv("MAIL_QUEUE_MAX_SIZE", "1000"))
+MAIL_QUEUE_MAX_ATTEMPTS = int(os.getenv("MAIL_QUEUE_MAX_ATTEMPTS", "3"))
+MAIL_QUEUE_LEASE = int(os.getenv("MAIL_QUEUE_LEASE", "120"))
+MAIL_QUEUE_POLL_INTERVAL = float(os.getenv("MAIL_QUEUE_POLL_INTERVAL", "5"))
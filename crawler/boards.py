@@ -0,0 +1,35 @@
+# 공지사항 게시판 목록
+# config.NOTICE_BOARDS에 등록된 게시판 설정을 조회
+
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import NOTICE_BOARDS, ENABLED_BOARDS
+
+DEFAULT_BOARD = "general"
+
+def get_board(key=DEFAULT_BOARD):
+    """
+    게시판 설정을 반환합니다.
+
+    Args:
+        key (str): 게시판 키
+
+    Returns:
+        dict: 게시판 설정 ('key', 'name', 'url', 'row_selector', 'link_selector',
+              'writer_column', 'date_column', 'poll_interval')
+    """
+    if key not in NOTICE_BOARDS:
+        raise ValueError(f"알 수 없는 게시판: {key} (가능: {', '.join(NOTICE_BOARDS)})")
+    return {'key': key, **NOTICE_BOARDS[key]}
+
+def get_enabled_boards():
+    """
+    확인할 게시판 목록을 반환합니다.
+
+    Returns:
+        list: 게시판 설정 목록 (ENABLED_BOARDS 순서)
+    """
+    return [get_board(key) for key in ENABLED_BOARDS]
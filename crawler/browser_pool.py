@@ -0,0 +1,207 @@
+# 공유 Playwright 브라우저 풀
+# 크롤링 호출마다 Chromium을 새로 띄우지 않도록 브라우저와 컨텍스트를 재사용
+# Playwright sync API 객체는 만든 스레드에서만 쓸 수 있으므로 브라우저 전용 스레드 하나가 풀을 소유하고,
+# 다른 스레드(상세 크롤링/게시판 작업 스레드)는 run_in_browser로 작업을 넘김
+# → 작업 스레드 수와 관계없이 프로세스당 Chromium은 하나, 브라우저 작업은 한 번에 하나씩 처리
+#   (대부분의 요청은 정적 HTTP로 처리되고 브라우저는 대체 경로이므로 동시 페이지는 늘리지 않음)
+
+from playwright.sync_api import sync_playwright
+from concurrent.futures import Future
+from contextlib import contextmanager
+import threading
+import queue
+import atexit
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import BROWSER_POOL_MAX_CONTEXTS, BROWSER_POOL_PAGES_PER_CONTEXT
+from utils.logger import get_logger
+
+logger = get_logger("crawler")
+
+class BrowserPool:
+    """헤드리스 Chromium 하나와 재사용 가능한 브라우저 컨텍스트 묶음을 관리하는 풀"""
+
+    def __init__(self, max_contexts=BROWSER_POOL_MAX_CONTEXTS,
+                 max_pages_per_context=BROWSER_POOL_PAGES_PER_CONTEXT, headless=True):
+        """
+        Args:
+            max_contexts (int): 유휴 상태로 보관할 최대 컨텍스트 수
+            max_pages_per_context (int): 컨텍스트 하나에서 열 수 있는 최대 페이지 수 (초과 시 재생성)
+            headless (bool): 브라우저를 보이지 않게 실행할지 여부
+        """
+        self.max_contexts = max_contexts
+        self.max_pages_per_context = max_pages_per_context
+        self.headless = headless
+        self._playwright = None
+        self._browser = None
+        self._idle_contexts = []  # [(context, 사용한 페이지 수)]
+
+    def _ensure_browser(self):
+        """브라우저가 없거나 연결이 끊어졌으면 새로 실행"""
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        if self._browser is not None:
+            logger.warning("브라우저 연결이 끊어져 다시 실행합니다.")
+        self.close()
+
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(headless=self.headless)
+        logger.info("Chromium 브라우저 실행")
+        return self._browser
+
+    def _acquire_context(self):
+        """유휴 컨텍스트를 꺼내거나 새로 생성"""
+        browser = self._ensure_browser()
+        if self._idle_contexts:
+            return self._idle_contexts.pop()
+        return browser.new_context(), 0
+
+    def _release_context(self, context, used_pages, broken):
+        """사용이 끝난 컨텍스트를 반납 (오류 발생 또는 사용 한도 초과 시 폐기)"""
+        if broken or used_pages >= self.max_pages_per_context or len(self._idle_contexts) >= self.max_contexts:
+            self._close_quietly(context)
+            return
+        self._idle_contexts.append((context, used_pages))
+
+    @contextmanager
+    def page(self):
+        """
+        풀에서 페이지를 하나 빌려옵니다.
+
+        Yields:
+            Page: Playwright 페이지 (블록을 벗어나면 자동으로 닫힘)
+        """
+        context, used_pages = self._acquire_context()
+        page = None
+        broken = False
+        try:
+            page = context.new_page()
+            yield page
+        except Exception:
+            # 크래시 등으로 컨텍스트 상태를 신뢰할 수 없으므로 재생성 대상으로 표시
+            broken = True
+            raise
+        finally:
+            if page is not None:
+                try:
+                    page.close()
+                except Exception:
+                    broken = True
+            self._release_context(context, used_pages + 1, broken)
+
+    def close(self):
+        """모든 컨텍스트와 브라우저를 종료"""
+        for context, _ in self._idle_contexts:
+            self._close_quietly(context)
+        self._idle_contexts = []
+
+        if self._browser is not None:
+            self._close_quietly(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+    @staticmethod
+    def _close_quietly(target):
+        try:
+            target.close()
+        except Exception:
+            pass
+
+
+class BrowserThread:
+    """브라우저 풀을 소유하고 넘겨받은 작업을 순서대로 실행하는 전용 스레드"""
+
+    def __init__(self, pool_factory=BrowserPool):
+        """
+        Args:
+            pool_factory (callable): 스레드 안에서 브라우저 풀을 만드는 함수
+        """
+        self._pool_factory = pool_factory
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="gn-browser", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        pool = self._pool_factory()
+        while True:
+            item = self._jobs.get()
+            if item is None:
+                break
+            job, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                with pool.page() as page:
+                    result = job(page)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        pool.close()
+
+    def submit(self, job):
+        """
+        작업을 넘깁니다.
+
+        Args:
+            job (callable): job(page) -> 결과 (브라우저 스레드에서 풀의 페이지로 실행)
+
+        Returns:
+            Future: 작업 결과
+        """
+        future = Future()
+        self._jobs.put((job, future))
+        return future
+
+    def close(self, timeout=30):
+        """
+        남은 작업을 마친 뒤 브라우저 풀을 닫고 스레드를 멈춥니다.
+
+        Args:
+            timeout (float): 최대 대기 시간(초)
+        """
+        self._jobs.put(None)
+        self._thread.join(timeout)
+
+
+# 프로세스 전체에서 공유하는 브라우저 스레드 (처음 작업을 넘길 때 시작)
+_browser_thread = None
+_browser_lock = threading.Lock()
+
+def run_in_browser(job):
+    """
+    공유 브라우저의 페이지로 작업을 실행하고 결과를 기다립니다. (어느 스레드에서 호출해도 같은 Chromium 사용)
+
+    Args:
+        job (callable): job(page) -> 결과 (페이지는 작업이 끝나면 자동으로 닫힘)
+
+    Returns:
+        job의 반환값
+
+    Raises:
+        Exception: job 또는 브라우저 실행 중 발생한 예외
+    """
+    global _browser_thread
+    with _browser_lock:
+        if _browser_thread is None:
+            _browser_thread = BrowserThread()
+        future = _browser_thread.submit(job)
+    return future.result()
+
+@atexit.register
+def close_browser_pool():
+    """공유 브라우저(Chromium)를 브라우저 스레드에서 종료합니다. (다음 작업 때 다시 실행)"""
+    global _browser_thread
+    with _browser_lock:
+        browser_thread, _browser_thread = _browser_thread, None
+    if browser_thread is not None:
+        browser_thread.close()
@@ -0,0 +1,71 @@
+# 게시판 변경 감지
+# 목록 전체를 크롤링하기 전에 가벼운 HTTP 요청 한 번으로 게시판이 바뀌었는지 확인
+# 서버가 ETag/Last-Modified를 주면 조건부 GET(304)을, 아니면 게시글 링크 영역의 해시를 비교
+
+from bs4 import BeautifulSoup
+import hashlib
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.logger import get_logger
+from crawler.http_client import fetch_html_conditional
+from crawler.boards import get_board
+
+logger = get_logger("crawler")
+
+def board_fragment_hash(html_content, board=None):
+    """
+    게시판 목록에서 게시글 링크 영역만 골라 해시합니다.
+    조회수처럼 자주 바뀌지만 새 공지사항과 무관한 값은 해시에 넣지 않습니다.
+
+    Args:
+        html_content (str): 게시판 목록 HTML
+        board (dict): 게시판 설정 (없으면 전체공지)
+
+    Returns:
+        str: sha256 해시 (게시글 영역을 찾지 못하면 None)
+    """
+    board = board or get_board()
+    soup = BeautifulSoup(html_content, "html.parser")
+    links = soup.select(f"{board['row_selector']} {board['link_selector']}")
+    if not links:
+        return None
+    fragment = "\n".join(f"{link.get('href', '')}|{link.get('onclick', '')}|{link.get_text(strip=True)}" for link in links)
+    return hashlib.sha256(fragment.encode("utf-8")).hexdigest()
+
+def probe_board(previous_state=None, board=None):
+    """
+    게시판이 이전 확인 이후 바뀌었는지 확인합니다.
+
+    Args:
+        previous_state (dict): 이전 확인 결과 ({'etag', 'last_modified', 'fragment_hash'})
+        board (dict): 게시판 설정 (없으면 전체공지)
+
+    Returns:
+        dict: {'changed': 바뀌었거나 판단할 수 없으면 True, 'state': 이번 확인 결과 (처리 성공 후 저장)}
+    """
+    board = board or get_board()
+    previous_state = previous_state or {}
+    response = fetch_html_conditional(board['url'], previous_state.get('etag'), previous_state.get('last_modified'))
+    if response is None:
+        # 확인에 실패하면 전체 크롤링으로 넘김
+        return {'changed': True, 'state': previous_state}
+
+    if response['not_modified']:
+        logger.info(f"{board['name']} 변경 없음 (304 Not Modified)")
+        return {'changed': False, 'state': previous_state}
+
+    state = {
+        'etag': response['etag'],
+        'last_modified': response['last_modified'],
+        'fragment_hash': board_fragment_hash(response['html'] or '', board)
+    }
+    # 정적 HTML에 목록이 없으면(스크립트 렌더링) 판단할 수 없으므로 바뀐 것으로 처리
+    if state['fragment_hash'] is None:
+        return {'changed': True, 'state': state}
+
+    changed = state['fragment_hash'] != previous_state.get('fragment_hash')
+    logger.info(f"{board['name']} 변경 감지" if changed else f"{board['name']} 변경 없음 (목록 해시 동일)")
+    return {'changed': changed, 'state': state}
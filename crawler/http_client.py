@@ -0,0 +1,112 @@
+# 정적 HTML 수집용 HTTP 클라이언트
+# 브라우저 없이 requests 세션(keep-alive)으로 페이지를 가져온다
+# 여러 게시판을 동시에 확인해도 같은 호스트로의 동시 연결 수는 제한한다
+
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+import requests
+import threading
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CRAWLER_HTTP_TIMEOUT, CRAWLER_MAX_CONNECTIONS_PER_HOST
+from utils.logger import get_logger
+
+logger = get_logger("crawler")
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; GachonNotifier/1.0)",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+# 연결 재사용을 위한 공유 세션
+session = requests.Session()
+session.headers.update(HEADERS)
+# 호스트별 연결 풀 크기를 동시 요청 제한에 맞춤 (초과 연결이 버려지지 않도록)
+_adapter = HTTPAdapter(pool_connections=8, pool_maxsize=CRAWLER_MAX_CONNECTIONS_PER_HOST)
+session.mount("https://", _adapter)
+session.mount("http://", _adapter)
+
+# 호스트별 동시 요청 제한
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+@contextmanager
+def host_slot(url):
+    """
+    URL의 호스트로 보낼 요청 자리를 하나 확보합니다. (CRAWLER_MAX_CONNECTIONS_PER_HOST개까지 동시 허용)
+
+    Args:
+        url (str): 요청할 URL
+    """
+    host = urlsplit(url).netloc
+    with _host_slots_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(CRAWLER_MAX_CONNECTIONS_PER_HOST)
+    with slot:
+        yield
+
+def fetch_html(url, params=None):
+    """
+    URL의 정적 HTML을 가져옵니다.
+
+    Args:
+        url (str): 요청할 URL
+        params (dict): 쿼리 파라미터
+
+    Returns:
+        str: HTML 문자열 (실패 시 None)
+    """
+    try:
+        with host_slot(url):
+            response = session.get(url, params=params, timeout=CRAWLER_HTTP_TIMEOUT)
+        if response.status_code != 200:
+            logger.warning(f"HTTP 요청 실패: {response.status_code} - {url}")
+            return None
+        # 인코딩 헤더가 없으면 본문에서 추정
+        if not response.encoding or response.encoding.lower() == "iso-8859-1":
+            response.encoding = response.apparent_encoding
+        return response.text
+    except Exception as e:
+        logger.warning(f"HTTP 요청 오류: {e}")
+        return None
+
+def fetch_html_conditional(url, etag=None, last_modified=None):
+    """
+    조건부 GET으로 페이지가 바뀌었을 때만 HTML을 가져옵니다.
+
+    Args:
+        url (str): 요청할 URL
+        etag (str): 이전 응답의 ETag
+        last_modified (str): 이전 응답의 Last-Modified
+
+    Returns:
+        dict: {'not_modified', 'html', 'etag', 'last_modified'} (실패 시 None)
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    try:
+        with host_slot(url):
+            response = session.get(url, headers=headers, timeout=CRAWLER_HTTP_TIMEOUT)
+        if response.status_code not in (200, 304):
+            logger.warning(f"HTTP 요청 실패: {response.status_code} - {url}")
+            return None
+        if response.status_code == 200 and (not response.encoding or response.encoding.lower() == "iso-8859-1"):
+            response.encoding = response.apparent_encoding
+        return {
+            'not_modified': response.status_code == 304,
+            'html': response.text if response.status_code == 200 else None,
+            'etag': response.headers.get("ETag") or etag,
+            'last_modified': response.headers.get("Last-Modified") or last_modified
+        }
+    except Exception as e:
+        logger.warning(f"HTTP 요청 오류: {e}")
+        return None
@@ -1,6 +1,5 @@
 # 공지사항 내용 크롤링
 
-from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
 import re
 import sys
@@ -8,7 +7,11 @@ import os
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CRAWLER_FETCH_MODE
 from utils.logger import get_logger
+from crawler.browser_pool import run_in_browser
+from crawler.http_client import fetch_html
+from crawler.notice_url import get_view_url
 
 logger = get_logger("crawler")
 
@@ -22,82 +25,130 @@ def fetch_notice_content(url):
     Returns:
         dict: 공지사항 정보 (제목, 내용, 날짜, 작성자 등)
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        try:
+    # 1. 정적 HTML 우선 시도 (artclView.do 직접 요청)
+    if CRAWLER_FETCH_MODE != "browser":
+        notice_info = fetch_notice_content_http(url)
+        if notice_info:
+            return notice_info
+        if CRAWLER_FETCH_MODE == "http":
+            logger.error(f"정적 HTML에서 공지사항 내용을 찾지 못했습니다: {url}")
+            return None
+        logger.info("정적 HTML에서 본문을 찾지 못해 브라우저로 재시도합니다.")
+
+    # 2. Playwright 브라우저로 대체
+    try:
+        # 공유 브라우저에서 페이지 렌더링
+        def render(page):
             page.goto(url, wait_until="networkidle")
             # 페이지 로딩 대기
             page.wait_for_timeout(3000)
-            html_content = page.content()
-            
-        except Exception as e:
-            logger.error(f"공지사항 크롤링 오류: {e}")
-            return None
-        finally:
-            browser.close()
+            return page.content()
+        
+        html_content = run_in_browser(render)
+        
+    except Exception as e:
+        logger.error(f"공지사항 크롤링 오류: {e}")
+        return None
 
     if not html_content:
         return None
 
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-
-        
-        # 공지사항 정보 추출
-        notice_info = {}
-        
-        # 제목 추출 (h2.view-title)
-        title_element = soup.select_one("h2.view-title")
-        if title_element:
-            notice_info['title'] = title_element.get_text(strip=True)
-        
-        # 작성자 추출
-        writer_element = soup.select_one("dl.writer dd")
-        if writer_element:
-            notice_info['writer'] = writer_element.get_text(strip=True)
-        
-        # 등록일 추출
-        write_element = soup.select_one("dl.write dd")
-        if write_element:
-            notice_info['date'] = write_element.get_text(strip=True)
-        
-        # 수정일 추출
-        modify_element = soup.select_one("dl.modify dd")
-        if modify_element:
-            notice_info['modified_date'] = modify_element.get_text(strip=True)
-        
-        # 조회수 추출
-        count_element = soup.select_one("dl.count dd")
-        if count_element:
-            notice_info['views'] = count_element.get_text(strip=True)
-        
-        # 내용 추출 (view-con div)
-        content_element = soup.select_one("div.view-con")
-        if content_element:
-            # HTML 태그 제거하고 텍스트만 추출
-            content_text = content_element.get_text(strip=True)
-            # 여러 줄 공백 정리
-            content_text = re.sub(r'\n\s*\n', '\n', content_text)
-            content_text = re.sub(r' +', ' ', content_text)
-            notice_info['content'] = content_text.strip()
-        
-        # 첨부파일 추출
-        attachments = []
-        attachment_elements = soup.select("div.view-file a[href*='download']")
-        for attachment in attachment_elements:
-            attachments.append({
-                'name': attachment.get_text(strip=True),
-                'url': attachment.get('href', '')
-            })
-        notice_info['attachments'] = attachments
-        return notice_info
-        
+        return parse_notice_content(html_content)
     except Exception as e:
         logger.error(f"공지사항 파싱 오류: {e}")
         return None
 
+def fetch_notice_content_http(url):
+    """
+    브라우저 없이 정적 HTML로 공지사항 내용을 가져옵니다.
+    
+    Args:
+        url (str): 공지사항 URL
+    
+    Returns:
+        dict: 공지사항 정보 (본문을 찾지 못하면 None)
+    """
+    view_url = get_view_url(url)
+    if not view_url:
+        return None
+
+    html_content = fetch_html(view_url)
+    if not html_content:
+        return None
+
+    try:
+        notice_info = parse_notice_content(html_content)
+    except Exception as e:
+        logger.warning(f"정적 본문 파싱 오류: {e}")
+        return None
+
+    # 본문이 없으면 스크립트 렌더링이 필요한 페이지로 간주
+    if not notice_info.get('content'):
+        return None
+    return notice_info
+
+def parse_notice_content(html_content):
+    """
+    공지사항 상세 HTML에서 정보를 추출합니다.
+    
+    Args:
+        html_content (str): 공지사항 상세 HTML
+    
+    Returns:
+        dict: 공지사항 정보 (제목, 내용, 날짜, 작성자 등)
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+    
+    # 공지사항 정보 추출
+    notice_info = {}
+    
+    # 제목 추출 (h2.view-title)
+    title_element = soup.select_one("h2.view-title")
+    if title_element:
+        notice_info['title'] = title_element.get_text(strip=True)
+    
+    # 작성자 추출
+    writer_element = soup.select_one("dl.writer dd")
+    if writer_element:
+        notice_info['writer'] = writer_element.get_text(strip=True)
+    
+    # 등록일 추출
+    write_element = soup.select_one("dl.write dd")
+    if write_element:
+        notice_info['date'] = write_element.get_text(strip=True)
+    
+    # 수정일 추출
+    modify_element = soup.select_one("dl.modify dd")
+    if modify_element:
+        notice_info['modified_date'] = modify_element.get_text(strip=True)
+    
+    # 조회수 추출
+    count_element = soup.select_one("dl.count dd")
+    if count_element:
+        notice_info['views'] = count_element.get_text(strip=True)
+    
+    # 내용 추출 (view-con div)
+    content_element = soup.select_one("div.view-con")
+    if content_element:
+        # HTML 태그 제거하고 텍스트만 추출
+        content_text = content_element.get_text(strip=True)
+        # 여러 줄 공백 정리
+        content_text = re.sub(r'\n\s*\n', '\n', content_text)
+        content_text = re.sub(r' +', ' ', content_text)
+        notice_info['content'] = content_text.strip()
+    
+    # 첨부파일 추출
+    attachments = []
+    attachment_elements = soup.select("div.view-file a[href*='download']")
+    for attachment in attachment_elements:
+        attachments.append({
+            'name': attachment.get_text(strip=True),
+            'url': attachment.get('href', '')
+        })
+    notice_info['attachments'] = attachments
+    return notice_info
+
 
 
 
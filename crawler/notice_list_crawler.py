@@ -1,102 +1,168 @@
 # 공지사항 크롤링 코드
 # 고정 공지사항 제외하고 일반 공지사항만 필터링
 
-from playwright.sync_api import sync_playwright
 from bs4 import BeautifulSoup
-import re
 import sys
 import os
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CRAWLER_FETCH_MODE, CRAWLER_MAX_PAGES
 from utils.logger import get_logger
+from crawler.browser_pool import run_in_browser
+from crawler.http_client import fetch_html
+from crawler.notice_url import parse_view_artcl, build_notice_url
+from crawler.boards import get_board
 
 logger = get_logger("crawler")
 
-NOTICE_URL = "https://www.gachon.ac.kr/kor/7986/subview.do" #전체공지
-TARGET_CLASS = "div.scroll-table > table.board-table.horizon > tbody > tr.thumb" #전체공지 데이터 위치
+NOTICE_URL = get_board()['url'] #전체공지
+TARGET_CLASS = get_board()['row_selector'] #전체공지 데이터 위치
 
-def fetch_notice_list(limit=10):
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True) #크롬 브라우저를 보이지 않게(headless)
-        page = browser.new_page() #새로운 웹 페이지
-        logger.start("공지사항 리스트 크롤링 시작")
-        try:
-            page.goto(NOTICE_URL, wait_until="networkidle") #URL 페이지로 이동
-            page.wait_for_selector("div.scroll-table > table.board-table.horizon", timeout=15000) #목표 데이터 나올때까지 대기(최대 15초)
-            
-            # 공지사항 목록을 파싱하면서 각 공지사항의 실제 URL을 얻기
-            notice_list = []
-            
-            # JavaScript로 공지사항 목록의 모든 링크를 가져와서 실제 URL로 변환
-            notice_links = page.evaluate("""
-                () => {
-                    const links = document.querySelectorAll('div.scroll-table table.board-table.horizon tbody tr.thumb td.td-subject a');
-                    return Array.from(links).map(link => {
-                        const href = link.getAttribute('href');
-                        const title = link.textContent.trim();
-                        const row = link.closest('tr');
-                        const cells = row.querySelectorAll('td');
-                        return {
-                            href: href,
-                            title: title,
-                            writer: cells[2] ? cells[2].textContent.trim() : '',
-                            date: cells[3] ? cells[3].textContent.trim() : ''
-                        };
-                    }).slice(0, """ + str(limit) + """);
-                }
-            """)
-            
-            # 각 공지사항에 대해 실제 URL 얻기
-            for i, notice_link in enumerate(notice_links):
-                try:
-                    # JavaScript 함수 호출로 실제 URL 얻기
-                    artcl_match = re.search(r"jf_viewArtcl\('kor',\s*'(\d+)'\)", notice_link['href'])
-                    if artcl_match:
-                        artcl_id = artcl_match.group(1)
-                        
-                        # JavaScript 함수 호출하여 실제 URL 얻기
-                        actual_url = page.evaluate(f"jf_viewArtcl('kor', '{artcl_id}')")
-                        
-                        # 페이지 이동 대기
-                        page.wait_for_timeout(1000)
-                        
-                        # 현재 URL 가져오기
-                        current_url = page.url
-                        
-                        # URL이 변경되었는지 확인
-                        if current_url != NOTICE_URL:
-                            url = current_url
-                        else:
-                            # URL이 변경되지 않았다면 기본 URL 사용
-                            url = f"https://www.gachon.ac.kr/kor/7986/subview.do?artclId={artcl_id}"
-                        
-                        # 제목에서 'N' 표시 제거
-                        title = notice_link['title'].replace('N', '').strip()
-                        
-                        notice_list.append({
-                            "title": title, 
-                            "url": url, 
-                            "date": notice_link['date'], 
-                            "writer": notice_link['writer']
-                        })
-                        
-                        # 목록 페이지로 돌아가기
-                        page.goto(NOTICE_URL, wait_until="networkidle")
-                        page.wait_for_selector("div.scroll-table > table.board-table.horizon", timeout=5000)
-                        
-                except Exception as e:
-                    logger.error(f"공지사항 {i+1} URL 생성 오류: {e}")
-                    continue
-            
-        except Exception as e:
-            logger.error(f"크롤링 오류: {e}") #문제가 생기면 에러 메시지 출력하고 빈 리스트 돌려주기
-            return []
-        finally:
-            browser.close() #브라우저 창 닫기
+def parse_notice_list(html_content, limit=10, board=None):
+    """
+    게시판 목록 HTML에서 공지사항 목록을 추출합니다.
+    
+    Args:
+        html_content (str): 게시판 목록 HTML
+        limit (int): 최대 공지사항 수 (None이면 페이지 전체)
+        board (dict): 게시판 설정 (없으면 전체공지)
+    
+    Returns:
+        list: 공지사항 목록 (id, board, title, url, date, writer)
+    """
+    board = board or get_board()
+    soup = BeautifulSoup(html_content, "html.parser")
+    notice_list = []
+    writer_column, date_column = board['writer_column'], board['date_column']
+    
+    for link in soup.select(f"{board['row_selector']} {board['link_selector']}")[:limit]:
+        # href 또는 onclick의 jf_viewArtcl 호출에서 게시글 ID 추출
+        artcl = parse_view_artcl(link.get('href')) or parse_view_artcl(link.get('onclick'))
+        if not artcl:
+            continue
+        
+        row = link.find_parent('tr')
+        cells = row.find_all('td') if row else []
+        notice_list.append({
+            "id": int(artcl['artcl_id']), # 기록/캐시에 쓰는 공지사항 고유 ID
+            "board": board['key'],
+            "title": link.get_text(strip=True).replace('N', '').strip(), # 제목에서 'N' 표시 제거
+            "url": build_notice_url(board['url'], artcl['artcl_id'], artcl['site'], artcl['bbs_id']),
+            "date": cells[date_column].get_text(strip=True) if len(cells) > date_column else '',
+            "writer": cells[writer_column].get_text(strip=True) if len(cells) > writer_column else ''
+        })
+    
+    return notice_list
 
-        logger.success(f"공지사항 리스트 크롤링 완료: {len(notice_list)}개")
-        return notice_list
+def get_page_url(page=1, board=None):
+    """게시판 목록 페이지 URL"""
+    url = (board or get_board())['url']
+    return url if page <= 1 else f"{url}?page={page}"
+
+def fetch_notice_list_http(limit=10, page=1, board=None):
+    """
+    브라우저 없이 정적 HTML로 공지사항 목록을 가져옵니다.
+    
+    Returns:
+        list: 공지사항 목록 (실패하거나 결과가 없으면 빈 리스트)
+    """
+    html_content = fetch_html(get_page_url(page, board))
+    if not html_content:
+        return []
+    try:
+        return parse_notice_list(html_content, limit, board)
+    except Exception as e:
+        logger.warning(f"정적 목록 파싱 오류: {e}")
+        return []
+
+def fetch_notice_page(page=1, limit=None, board=None):
+    """
+    게시판 목록 한 페이지를 가져옵니다. 정적 HTML을 먼저 시도하고, 결과가 없으면 브라우저로 재시도합니다.
+    
+    Args:
+        page (int): 페이지 번호 (1부터)
+        limit (int): 최대 공지사항 수 (None이면 페이지 전체)
+        board (dict): 게시판 설정 (없으면 전체공지)
+    
+    Returns:
+        list: 공지사항 목록 (실패 시 None)
+    """
+    # 1. 정적 HTML 우선 시도 (브라우저 실행 없이)
+    if CRAWLER_FETCH_MODE != "browser":
+        notice_list = fetch_notice_list_http(limit, page, board)
+        if notice_list:
+            logger.info(f"{(board or get_board())['name']} {page}페이지 목록 수집 (HTTP): {len(notice_list)}개")
+            return notice_list
+        if CRAWLER_FETCH_MODE == "http":
+            logger.error("정적 HTML에서 공지사항을 찾지 못했습니다.")
+            return None
+        logger.info("정적 HTML에서 공지사항을 찾지 못해 브라우저로 재시도합니다.")
+    
+    # 2. Playwright 브라우저로 대체
+    row_selector = (board or get_board())['row_selector']
+    try:
+        def render(browser_page): #공유 브라우저 스레드에서 실행
+            browser_page.goto(get_page_url(page, board), wait_until="networkidle") #URL 페이지로 이동
+            browser_page.wait_for_selector(row_selector, timeout=15000) #게시판 설정의 목록 행이 나올때까지 대기(최대 15초)
+            return browser_page.content()
+        
+        html_content = run_in_browser(render)
+        
+        # 렌더링된 목록에서 artclId로 URL을 바로 생성 (게시글별 페이지 이동 없음)
+        return parse_notice_list(html_content, limit, board)
+    except Exception as e:
+        logger.error(f"크롤링 오류: {e}") #문제가 생기면 에러 메시지 출력하고 None 돌려주기
+        return None
+
+def fetch_notice_list(limit=10, board=None):
+    logger.start("공지사항 리스트 크롤링 시작")
+    
+    notice_list = fetch_notice_page(1, limit, board)
+    if notice_list is None:
+        return []
+
+    logger.success(f"공지사항 리스트 크롤링 완료: {len(notice_list)}개")
+    return notice_list
+
+def fetch_notice_list_since(since_id, max_pages=CRAWLER_MAX_PAGES, board=None):
+    """
+    마지막으로 본 공지사항 ID(기준점)보다 새로운 공지사항만 가져옵니다.
+    첫 페이지부터 넘기다가 기준점에 도달하면 멈추므로, 변화가 없으면 요청 한 번으로 끝나고
+    오래 멈춰 있었다면 여러 페이지를 따라잡습니다.
+    
+    Args:
+        since_id (int): 기준점 (이미 처리한 가장 큰 공지사항 ID)
+        max_pages (int): 최대로 넘길 페이지 수
+        board (dict): 게시판 설정 (없으면 전체공지)
+    
+    Returns:
+        list: 새로운 공지사항 목록, 최신순 (첫 페이지를 가져오지 못하면 None)
+    """
+    logger.start(f"공지사항 증분 크롤링 시작 (기준 ID {since_id})")
+    
+    new_notices = []
+    seen_ids = set()
+    for page in range(1, max_pages + 1):
+        notice_list = fetch_notice_page(page, board=board)
+        if notice_list is None:
+            if page == 1:
+                return None
+            break
+        
+        # 크롤링 중 새 글이 올라와 다음 페이지로 밀린 공지사항은 한 번만 포함
+        for notice in notice_list:
+            if notice['id'] > since_id and notice['id'] not in seen_ids:
+                seen_ids.add(notice['id'])
+                new_notices.append(notice)
+        
+        if not notice_list or any(notice['id'] <= since_id for notice in notice_list):
+            break # 기준점 도달
+    else:
+        logger.warning(f"{max_pages}페이지 안에서 기준점에 도달하지 못했습니다. 더 오래된 새 공지사항은 건너뜁니다.")
+    
+    logger.success(f"공지사항 증분 크롤링 완료: {len(new_notices)}개 ({page}페이지 확인)")
+    return new_notices
 
 # 테스트 코드
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+# 공지사항 URL 생성 및 해석
+# 게시판의 jf_viewArtcl(...) 링크로부터 브라우저 이동 없이 게시글 URL을 직접 만든다
+
+from urllib.parse import quote, unquote, urlparse, parse_qs
+import hashlib
+import base64
+import re
+
+BASE_URL = "https://www.gachon.ac.kr"
+
+# jf_viewArtcl('kor', '111860') (통합공지) 또는 jf_viewArtcl('kor', '475', '111600') (게시판)
+VIEW_ARTCL_PATTERN = re.compile(r"jf_viewArtcl\(\s*'(\w+)'\s*,\s*'(\d+)'\s*(?:,\s*'(\d+)'\s*)?\)")
+
+# 사이트 스크립트(jf_viewArtcl)가 enc 파라미터를 만들 때 붙이는 쿼리 문자열
+COMMON_NOTICE_QUERY = "page=1&srchColumn=&srchWord=&"
+BBS_QUERY = "page=1&srchColumn=&srchWrd=&bbsClSeq=&bbsOpenWrdSeq=&rgsBgndeStr=&rgsEnddeStr=&isViewMine=false&password=&"
+ENC_PREFIX = "fnct1|@@|"
+
+# /commonNotice/kor/111860/artclView.do 또는 /bbs/kor/475/111600/artclView.do
+ARTICLE_PATH_PATTERN = re.compile(r"/(?:commonNotice/(\w+)|bbs/(\w+)/(\d+))/(\d+)/artclView\.do")
+
+def parse_view_artcl(href):
+    """
+    게시판 링크의 jf_viewArtcl 호출에서 게시글 정보를 추출합니다.
+
+    Args:
+        href (str): 링크의 href 또는 onclick 값
+
+    Returns:
+        dict: {'site', 'bbs_id', 'artcl_id'} (통합공지는 bbs_id가 None), 해석 실패 시 None
+    """
+    if not href:
+        return None
+    match = VIEW_ARTCL_PATTERN.search(href)
+    if not match:
+        return None
+    site, first, second = match.groups()
+    if second:
+        return {'site': site, 'bbs_id': first, 'artcl_id': second}
+    return {'site': site, 'bbs_id': None, 'artcl_id': first}
+
+def build_article_path(artcl_id, site="kor", bbs_id=None, with_query=True):
+    """
+    게시글 본문(artclView.do) 경로를 생성합니다.
+
+    Args:
+        artcl_id (str): 게시글 ID
+        site (str): 사이트 코드
+        bbs_id (str): 게시판 ID (통합공지는 None)
+        with_query (bool): 사이트 스크립트와 같은 쿼리 문자열을 붙일지 여부
+
+    Returns:
+        str: /commonNotice/... 또는 /bbs/... 경로
+    """
+    if bbs_id:
+        path = f"/bbs/{site}/{bbs_id}/{artcl_id}/artclView.do"
+        query = BBS_QUERY
+    else:
+        path = f"/commonNotice/{site}/{artcl_id}/artclView.do"
+        query = COMMON_NOTICE_QUERY
+    return f"{path}?{query}" if with_query else path
+
+def build_notice_url(list_url, artcl_id, site="kor", bbs_id=None):
+    """
+    jf_viewArtcl이 이동하는 것과 같은 subview.do?enc=... URL을 생성합니다.
+
+    Args:
+        list_url (str): 게시판 목록 URL (subview.do)
+        artcl_id (str): 게시글 ID
+        site (str): 사이트 코드
+        bbs_id (str): 게시판 ID (통합공지는 None)
+
+    Returns:
+        str: 공지사항 URL
+    """
+    article_path = build_article_path(artcl_id, site, bbs_id)
+    raw = ENC_PREFIX + quote(article_path, safe="")
+    enc = base64.b64encode(raw.encode("utf-8")).decode("ascii")
+    return f"{list_url}?enc={quote(enc, safe='')}"
+
+def get_view_url(notice_url):
+    """
+    공지사항 URL을 정적 HTML을 바로 받을 수 있는 artclView.do URL로 변환합니다.
+
+    Args:
+        notice_url (str): subview.do?enc=... 또는 subview.do?artclId=... 형태의 URL
+
+    Returns:
+        str: artclView.do URL (변환할 수 없으면 None)
+    """
+    try:
+        parsed = urlparse(notice_url)
+        query = parse_qs(parsed.query)
+
+        if parsed.path.endswith("artclView.do"):
+            return notice_url
+
+        if 'enc' in query:
+            raw = base64.b64decode(query['enc'][0]).decode("utf-8")
+            if raw.startswith(ENC_PREFIX):
+                return BASE_URL + unquote(raw[len(ENC_PREFIX):])
+
+        if 'artclId' in query:
+            site = parsed.path.strip("/").split("/")[0] or "kor"
+            return BASE_URL + build_article_path(query['artclId'][0], site, with_query=False)
+    except Exception:
+        return None
+    return None
+
+def parse_notice_url(notice_url):
+    """
+    공지사항 URL에서 게시글 정보를 추출합니다. (enc 값을 풀거나 artclId 파라미터를 해석)
+
+    Args:
+        notice_url (str): subview.do?enc=..., subview.do?artclId=... 또는 artclView.do URL
+
+    Returns:
+        dict: {'site', 'bbs_id', 'artcl_id'} (통합공지는 bbs_id가 None), 해석 실패 시 None
+    """
+    view_url = get_view_url(notice_url) if notice_url else None
+    match = ARTICLE_PATH_PATTERN.search(view_url or '')
+    if not match:
+        return None
+    common_site, bbs_site, bbs_id, artcl_id = match.groups()
+    return {'site': common_site or bbs_site, 'bbs_id': bbs_id, 'artcl_id': artcl_id}
+
+def get_notice_id(notice):
+    """
+    공지사항의 고유 ID를 반환합니다. 통합공지와 게시판 URL, enc와 artclId URL 중 어느 형태로
+    가져왔든 같은 게시글이면 같은 ID가 되며, 기록과 캐시의 키로 사용합니다.
+
+    Args:
+        notice (dict | str): 공지사항('id' 또는 'url') 또는 공지사항 URL
+
+    Returns:
+        int: 게시글 ID(artclId). 게시판 URL이 아니면 URL 해시로 만든 음수 ID
+    """
+    if isinstance(notice, dict):
+        if notice.get('id') is not None:
+            return int(notice['id'])
+        notice = notice.get('url', '')
+
+    info = parse_notice_url(notice)
+    if info:
+        return int(info['artcl_id'])
+
+    # artclId는 양수이므로 겹치지 않도록 음수 영역 사용 (sqlite 정수 범위 안)
+    digest = hashlib.sha1((notice or '').encode('utf-8')).hexdigest()
+    return -(int(digest[:15], 16) + 1)
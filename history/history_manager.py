@@ -2,110 +2,176 @@
 
 import json
 import os
-from datetime import datetime
 import sys
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import get_logger
+from history.history_store import get_history_store, DEFAULT_NAMESPACE
 
 logger = get_logger("history")
 
-def load_history(history_file=None):
-    if history_file is None:
-        # 현재 파일의 디렉토리를 기준으로 절대 경로 생성
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        history_file = os.path.join(current_dir, "history.json")
+def _meta_name(name, namespace):
+    """게시판별 메타데이터 이름 (기본 게시판은 이전 이름을 그대로 사용)"""
+    return name if namespace == DEFAULT_NAMESPACE else f"{name}:{namespace}"
+
+def load_history(history_file=None, limit=None):
     """
-    기록 파일에서 이전 공지사항 목록을 로드.
+    기록 저장소에서 이전 공지사항 목록을 로드.
+    
+    Args:
+        history_file (str): 기록 저장소 경로 (없으면 history/history.db)
+        limit (int): 최대 개수 (없으면 전체)
     
     Returns:
-        list: 이전 공지사항 목록 (없으면 빈 리스트)
+        list: 이전 공지사항 목록, 최신순 (없으면 빈 리스트)
     """
     try:
-        if os.path.exists(history_file):
-            with open(history_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('notices', [])
-        return []
+        return get_history_store(history_file).load(limit)
     except Exception as e:
         logger.error(f"기록 로드 오류: {e}")
         return []
 
 def save_history(notices, history_file=None):
-    if history_file is None:
-        # 현재 파일의 디렉토리를 기준으로 절대 경로 생성
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        history_file = os.path.join(current_dir, "history.json")
     """
-    현재 공지사항 목록을 기록 파일에 저장.
+    기록 저장소의 내용을 현재 공지사항 목록으로 교체.
     
     Args:
         notices (list): 저장할 공지사항 목록
-        history_file (str): 기록 파일 경로
+        history_file (str): 기록 저장소 경로
     """
     try:
-        data = {
-            'notices': notices,
-            'last_updated': datetime.now().isoformat()
-        }
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        get_history_store(history_file).replace(notices)
         logger.success(f"기록 저장 완료: {len(notices)}개 공지사항")
     except Exception as e:
         logger.error(f"기록 저장 오류: {e}")
 
 def update_history(new_notices, history_file=None):
-    if history_file is None:
-        # 현재 파일의 디렉토리를 기준으로 절대 경로 생성
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        history_file = os.path.join(current_dir, "history.json")
     """
-    새로운 공지사항을 기록에 추가.
+    새로운 공지사항을 기록에 추가. (개수 제한 없이 보관)
     
     Args:
         new_notices (list): 추가할 새로운 공지사항 목록
-        history_file (str): 기록 파일 경로
+        history_file (str): 기록 저장소 경로
+    """
+    try:
+        added = get_history_store(history_file).add(new_notices)
+        logger.success(f"기록 추가 완료: {added}개 공지사항")
+    except Exception as e:
+        logger.error(f"기록 저장 오류: {e}")
+
+def compact_history(history_file=None):
+    """
+    기록 저장소 파일의 빈 공간을 정리.
+    
+    Args:
+        history_file (str): 기록 저장소 경로
+    """
+    get_history_store(history_file).compact()
+
+def get_high_water_mark(history_file=None, namespace=DEFAULT_NAMESPACE):
+    """
+    게시판에서 지금까지 기록한 가장 큰 공지사항 ID를 반환.
+    
+    Args:
+        history_file (str): 기록 저장소 경로
+        namespace (str): 기록 구분 이름 (게시판 키)
+    
+    Returns:
+        int: 증분 크롤링 기준점 (기록이 없거나 읽지 못하면 None)
+    """
+    try:
+        return get_history_store(history_file).high_water_mark(namespace)
+    except Exception as e:
+        logger.error(f"기록 로드 오류: {e}")
+        return None
+
+def load_board_state(history_file=None, namespace=DEFAULT_NAMESPACE):
+    """
+    마지막 게시판 변경 확인 결과를 로드.
+    
+    Args:
+        history_file (str): 기록 저장소 경로
+        namespace (str): 기록 구분 이름 (게시판 키)
+    
+    Returns:
+        dict: {'etag', 'last_modified', 'fragment_hash'} (없으면 빈 dict)
+    """
+    try:
+        return json.loads(get_history_store(history_file).get_meta(_meta_name('board_probe', namespace)) or '{}')
+    except Exception as e:
+        logger.error(f"게시판 상태 로드 오류: {e}")
+        return {}
+
+def save_board_state(state, history_file=None, namespace=DEFAULT_NAMESPACE):
+    """
+    게시판 변경 확인 결과를 기록과 함께 저장. (공지사항 처리가 끝난 뒤 호출)
+    
+    Args:
+        state (dict): crawler.change_probe.probe_board의 'state'
+        history_file (str): 기록 저장소 경로
+        namespace (str): 기록 구분 이름 (게시판 키)
+    """
+    try:
+        get_history_store(history_file).set_meta(_meta_name('board_probe', namespace), json.dumps(state))
+    except Exception as e:
+        logger.error(f"게시판 상태 저장 오류: {e}")
+
+def load_last_polled(history_file=None, namespace=DEFAULT_NAMESPACE):
+    """
+    게시판을 마지막으로 확인한 시각을 로드.
+    
+    Args:
+        history_file (str): 기록 저장소 경로
+        namespace (str): 기록 구분 이름 (게시판 키)
+    
+    Returns:
+        float: UNIX 시각 (확인한 적이 없거나 읽지 못하면 None)
+    """
+    try:
+        value = get_history_store(history_file).get_meta(_meta_name('last_polled', namespace))
+        return float(value) if value else None
+    except Exception as e:
+        logger.error(f"게시판 확인 시각 로드 오류: {e}")
+        return None
+
+def save_last_polled(polled_at, history_file=None, namespace=DEFAULT_NAMESPACE):
     """
-    current_notices = load_history(history_file)
-    updated_notices = new_notices + current_notices
-    if len(updated_notices) > 50:
-        updated_notices = updated_notices[:50]
+    게시판을 확인한 시각을 저장.
     
-    save_history(updated_notices, history_file)
+    Args:
+        polled_at (float): UNIX 시각
+        history_file (str): 기록 저장소 경로
+        namespace (str): 기록 구분 이름 (게시판 키)
+    """
+    try:
+        get_history_store(history_file).set_meta(_meta_name('last_polled', namespace), str(polled_at))
+    except Exception as e:
+        logger.error(f"게시판 확인 시각 저장 오류: {e}")
 
-def get_new_notices(crawled_notices, history_file=None):
-    if history_file is None:
-        # 현재 파일의 디렉토리를 기준으로 절대 경로 생성
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        history_file = os.path.join(current_dir, "history.json")
+def get_new_notices(crawled_notices, history_file=None, namespace=DEFAULT_NAMESPACE):
     """
     현재 공지사항과 기록을 비교하여 새로운 공지사항만 반환.
+    여러 게시판에 함께 올라온 공지사항은 처음 발견한 게시판에서만 반환.
     
     Args:
         crawled_notices (list): 현재 크롤링한 공지사항 목록
-        history_file (str): 기록 파일 경로
+        history_file (str): 기록 저장소 경로
+        namespace (str): 기록 구분 이름 (게시판 키)
     
     Returns:
         list: 새로운 공지사항 목록
     """
-    previous_notices = load_history(history_file)
+    store = get_history_store(history_file)
     
-    if not previous_notices: # 기록이 없으면 모든 공지사항을 저장 후 종료
-        logger.info("첫 실행: 모든 공지사항을 저장")
-        update_history(crawled_notices, history_file)
+    if store.count(namespace) == 0: # 이 게시판 기록이 없으면 모든 공지사항을 저장 후 종료
+        logger.info(f"첫 실행 ({namespace}): 모든 공지사항을 저장")
+        store.add(crawled_notices, namespace)
         return []
     
-    
-    new_notices = [] # 새로운 공지사항
-    previous_urls = {notice['url'] for notice in previous_notices}
-    
-    for notice in crawled_notices:
-        if notice['url'] not in previous_urls:
-            new_notices.append(notice)
+    new_notices = store.claim(crawled_notices, namespace) # 새로운 공지사항
 
     if new_notices:
-        update_history(new_notices, history_file)
         logger.success(f"{len(new_notices)}개의 새로운 공지사항 발견!")
     else:
         logger.info("새로운 공지사항이 없습니다.")
@@ -0,0 +1,325 @@
+# 공지사항 기록 저장소 (sqlite)
+# 공지사항 고유 ID(정수)로 색인하여 기록이 쌓여도 새 공지사항 판별 비용이 늘지 않도록 하고,
+# 모든 쓰기는 트랜잭션으로 처리해 중간에 중단되어도 기록이 깨지지 않도록 함
+# 게시판마다 기록 구분 이름(네임스페이스)을 두어 게시판별 첫 실행/기준점을 따로 관리하고,
+# 여러 게시판에 함께 올라온 공지사항은 공지사항 ID로 한 번만 알림
+
+from contextlib import contextmanager, closing
+from datetime import datetime
+import threading
+import sqlite3
+import json
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from crawler.notice_url import get_notice_id
+from crawler.boards import DEFAULT_BOARD
+from utils.logger import get_logger
+
+logger = get_logger("history")
+
+HISTORY_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_FILE = os.path.join(HISTORY_DIR, "history.db")
+LEGACY_FILE = os.path.join(HISTORY_DIR, "history.json")
+
+DEFAULT_NAMESPACE = DEFAULT_BOARD
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS notices (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    namespace TEXT NOT NULL,
+    notice_id INTEGER NOT NULL,
+    url TEXT,
+    title TEXT,
+    data TEXT NOT NULL,
+    seen_at TEXT NOT NULL,
+    UNIQUE (namespace, notice_id)
+);
+CREATE INDEX IF NOT EXISTS notices_notice_id ON notices (notice_id);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+def notice_key(notice):
+    """
+    공지사항의 기록 키를 반환합니다.
+
+    Args:
+        notice (dict): 공지사항 ('id' 또는 'url')
+
+    Returns:
+        int: 공지사항 고유 ID (crawler.notice_url.get_notice_id)
+    """
+    return get_notice_id(notice)
+
+def _create_schema(conn):
+    # executescript는 진행 중인 트랜잭션을 커밋하므로 문장별로 실행
+    for statement in SCHEMA.split(';'):
+        if statement.strip():
+            conn.execute(statement)
+
+def _read_legacy(path):
+    """JSON 기록 파일에서 공지사항 목록을 읽습니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('notices', [])
+
+class HistoryStore:
+    """sqlite 기반 공지사항 기록 저장소"""
+
+    def __init__(self, db_file=DB_FILE, legacy_file=None):
+        """
+        Args:
+            db_file (str): 데이터베이스 파일 경로
+            legacy_file (str): 비어 있는 저장소에 처음 한 번 가져올 JSON 기록 파일 (파일은 바꾸지 않음)
+        """
+        self.db_file = db_file
+        with self._connect() as conn:
+            self._upgrade_legacy_rows(conn)
+            _create_schema(conn)
+        if legacy_file and os.path.exists(legacy_file):
+            self._import_legacy(legacy_file)
+
+    @contextmanager
+    def _connect(self):
+        """트랜잭션 하나를 여는 연결 (블록이 끝나면 커밋, 오류 시 롤백)"""
+        with closing(sqlite3.connect(self.db_file, timeout=30)) as conn:
+            conn.execute("PRAGMA synchronous=FULL")
+            with conn:
+                yield conn
+
+    def _upgrade_legacy_rows(self, conn):
+        """
+        이전 형식의 기록(URL/문자열 키, 네임스페이스 없는 공지사항 ID 키)을 현재 형식으로 옮김
+        (이전 기록은 모두 기본 게시판 기록으로 보고, 같은 게시글은 처음 본 기록만 유지)
+        """
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(notices)")]
+        if not columns or 'namespace' in columns:
+            return
+
+        # DDL은 자동으로 트랜잭션을 시작하지 않으므로 직접 시작해 변환 전체를 원자적으로 처리
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        rows = conn.execute("SELECT url, title, data, seen_at FROM notices ORDER BY seq").fetchall()
+        conn.execute("ALTER TABLE notices RENAME TO notices_legacy")
+        _create_schema(conn)
+        conn.executemany(
+            "INSERT OR IGNORE INTO notices (namespace, notice_id, url, title, data, seen_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [(DEFAULT_NAMESPACE, notice_key(json.loads(data)), url, title, data, seen_at) for url, title, data, seen_at in rows]
+        )
+        conn.execute("DROP TABLE notices_legacy")
+        logger.info(f"기록을 게시판별 형식으로 변환: {len(rows)}개 중 {conn.execute('SELECT COUNT(*) FROM notices').fetchone()[0]}개 유지")
+
+    def _import_legacy(self, legacy_file):
+        """저장소가 비어 있을 때 JSON 기록을 한 번만 가져옴"""
+        if self.get_meta('legacy_imported') or self.count():
+            return
+        try:
+            notices = _read_legacy(legacy_file)
+        except Exception as e:
+            logger.error(f"기존 기록 가져오기 오류: {e}")
+            return
+        with self._connect() as conn:
+            self._insert(conn, notices)
+            self._set_meta(conn, 'legacy_imported', datetime.now().isoformat())
+        logger.success(f"기존 기록 가져오기 완료: {len(notices)}개 공지사항")
+
+    @staticmethod
+    def _insert(conn, notices, namespace=DEFAULT_NAMESPACE):
+        """
+        공지사항을 추가합니다. 목록 앞쪽이 최신 공지사항이므로 뒤에서부터 넣어
+        최신순 조회 시 원래 순서가 유지되도록 합니다.
+
+        Returns:
+            int: 실제로 추가된 수 (이미 있는 공지사항은 무시)
+        """
+        seen_at = datetime.now().isoformat()
+        before = conn.total_changes
+        conn.executemany(
+            "INSERT OR IGNORE INTO notices (namespace, notice_id, url, title, data, seen_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (namespace, notice_key(notice), notice.get('url'), notice.get('title'), json.dumps(notice, ensure_ascii=False), seen_at)
+                for notice in reversed(notices)
+            ]
+        )
+        return conn.total_changes - before
+
+    @staticmethod
+    def _filter_new(conn, notices, namespace=None):
+        """기록에 없는 공지사항만 골라냄 (namespace가 없으면 모든 게시판 기록과 비교)"""
+        keys = [notice_key(notice) for notice in notices]
+        if not keys:
+            return []
+        unique_keys = list(set(keys))
+        placeholders = ','.join('?' * len(unique_keys))
+        if namespace is None:
+            rows = conn.execute(f"SELECT notice_id FROM notices WHERE notice_id IN ({placeholders})", unique_keys)
+        else:
+            rows = conn.execute(
+                f"SELECT notice_id FROM notices WHERE namespace = ? AND notice_id IN ({placeholders})",
+                [namespace] + unique_keys
+            )
+        seen = {row[0] for row in rows}
+
+        new_notices = []
+        for key, notice in zip(keys, notices):
+            if key not in seen:
+                seen.add(key)
+                new_notices.append(notice)
+        return new_notices
+
+    @staticmethod
+    def _set_meta(conn, name, value):
+        conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    def add(self, notices, namespace=DEFAULT_NAMESPACE):
+        """
+        공지사항을 기록에 추가합니다. (하나의 트랜잭션)
+
+        Args:
+            notices (list): 추가할 공지사항 목록 (최신순)
+            namespace (str): 기록 구분 이름 (게시판 키)
+
+        Returns:
+            int: 새로 추가된 수
+        """
+        with self._connect() as conn:
+            return self._insert(conn, notices, namespace)
+
+    def replace(self, notices):
+        """기록 전체를 주어진 목록으로 교체합니다. (하나의 트랜잭션)"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM notices")
+            self._insert(conn, notices)
+
+    def filter_new(self, notices, namespace=None):
+        """
+        기록에 없는 공지사항만 골라냅니다. (공지사항 ID 색인으로 조회)
+
+        Args:
+            notices (list): 확인할 공지사항 목록
+            namespace (str): 기록 구분 이름 (없으면 모든 게시판 기록과 비교)
+
+        Returns:
+            list: 새로운 공지사항 목록 (입력 순서 유지, 중복 제거)
+        """
+        with self._connect() as conn:
+            return self._filter_new(conn, notices, namespace)
+
+    def claim(self, notices, namespace=DEFAULT_NAMESPACE):
+        """
+        게시판 기록에 없는 공지사항을 기록하고, 그중 어느 게시판에서도 본 적 없는 공지사항을 반환합니다.
+        여러 게시판을 동시에 확인해도 같은 공지사항이 한 번만 반환되도록 하나의 쓰기 트랜잭션으로 처리합니다.
+
+        Args:
+            notices (list): 확인할 공지사항 목록 (최신순)
+            namespace (str): 기록 구분 이름 (게시판 키)
+
+        Returns:
+            list: 처음 보는 공지사항 목록 (입력 순서 유지)
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            unseen = self._filter_new(conn, notices, namespace)
+            new_notices = self._filter_new(conn, unseen)
+            self._insert(conn, unseen, namespace)
+        return new_notices
+
+    def load(self, limit=None, namespace=None):
+        """
+        기록된 공지사항을 최신순으로 반환합니다.
+
+        Args:
+            limit (int): 최대 개수 (없으면 전체)
+            namespace (str): 기록 구분 이름 (없으면 모든 게시판, 같은 공지사항은 한 번만)
+
+        Returns:
+            list: 공지사항 목록
+        """
+        limit = -1 if limit is None else limit
+        with self._connect() as conn:
+            if namespace is None:
+                rows = conn.execute(
+                    "SELECT data FROM notices WHERE seq IN (SELECT MIN(seq) FROM notices GROUP BY notice_id) ORDER BY seq DESC LIMIT ?",
+                    (limit,)
+                )
+            else:
+                rows = conn.execute("SELECT data FROM notices WHERE namespace = ? ORDER BY seq DESC LIMIT ?", (namespace, limit))
+            return [json.loads(row[0]) for row in rows]
+
+    def count(self, namespace=None):
+        """기록된 공지사항 수 (namespace가 없으면 모든 게시판의 서로 다른 공지사항 수)"""
+        with self._connect() as conn:
+            if namespace is None:
+                return conn.execute("SELECT COUNT(DISTINCT notice_id) FROM notices").fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM notices WHERE namespace = ?", (namespace,)).fetchone()[0]
+
+    def high_water_mark(self, namespace=None):
+        """
+        기록된 가장 큰 공지사항 ID (증분 크롤링의 기준점)
+
+        Args:
+            namespace (str): 기록 구분 이름 (없으면 모든 게시판)
+
+        Returns:
+            int: 게시글 ID (게시판 공지사항 기록이 없으면 None)
+        """
+        with self._connect() as conn:
+            if namespace is None:
+                return conn.execute("SELECT MAX(notice_id) FROM notices WHERE notice_id > 0").fetchone()[0]
+            return conn.execute(
+                "SELECT MAX(notice_id) FROM notices WHERE namespace = ? AND notice_id > 0", (namespace,)
+            ).fetchone()[0]
+
+    def get_meta(self, name, default=None):
+        """저장소 메타데이터 값을 가져옵니다."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, name, value):
+        """저장소 메타데이터 값을 저장합니다."""
+        with self._connect() as conn:
+            self._set_meta(conn, name, value)
+
+    def compact(self):
+        """삭제되거나 교체된 공간을 정리해 파일 크기를 줄입니다."""
+        with closing(sqlite3.connect(self.db_file, timeout=30)) as conn:
+            conn.execute("VACUUM")
+        logger.info(f"기록 저장소 정리 완료: {os.path.getsize(self.db_file)}바이트")
+
+
+# 경로별 기록 저장소 (스키마 확인/기존 기록 가져오기를 호출마다 반복하지 않도록 한 번만 생성)
+_stores = {}
+_stores_lock = threading.Lock()
+
+def _store_files(history_file):
+    """기록 경로를 (데이터베이스 파일, 가져올 JSON 기록 파일) 로 변환 (JSON 경로면 옆의 .db에 가져옴)"""
+    if history_file is None:
+        return DB_FILE, LEGACY_FILE
+    if history_file.endswith('.json'):
+        return f"{os.path.splitext(history_file)[0]}.db", history_file
+    return history_file, None
+
+def get_history_store(history_file=None):
+    """
+    기록 저장소를 엽니다. 같은 경로에는 같은 저장소를 반환합니다.
+
+    Args:
+        history_file (str): 데이터베이스 파일 경로 (없으면 기본 경로)
+            JSON 기록 파일(.json)이면 같은 이름의 .db 저장소를 쓰고, JSON 기록은 처음 한 번만 가져옴 (JSON 파일은 그대로 둠)
+
+    Returns:
+        HistoryStore: 기록 저장소
+    """
+    db_file, legacy_file = _store_files(history_file)
+    key = os.path.abspath(db_file)
+    with _stores_lock:
+        store = _stores.get(key)
+        # 데이터베이스 파일이 지워졌으면 스키마부터 다시 만듦
+        if store is None or not os.path.exists(db_file):
+            store = _stores[key] = HistoryStore(db_file, legacy_file=legacy_file)
+        return store
@@ -1,90 +1,284 @@
 import json
 import os
+import signal
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # 모듈 임포트
-from crawler.notice_list_crawler import fetch_notice_list
+from crawler.notice_list_crawler import fetch_notice_list, fetch_notice_list_since
+from crawler.change_probe import probe_board
+from crawler.boards import get_enabled_boards
 from crawler.notice_crawler import fetch_notice_content
-from history.history_manager import get_new_notices
-from AI.AI_summarizer import summarize_notice
+from history.history_manager import (
+    get_new_notices, get_high_water_mark, load_board_state, save_board_state, load_last_polled, save_last_polled
+)
+from AI.AI_summarizer import summarize_notices
+from AI.summary_cache import get_summary_cache
+from AI.async_summarizer import metrics as summary_metrics
 from notifier.telegram import send_telegram_message
-from notifier.email_notifier import send_email
+from notifier.email_notifier import send_bulk_email, summarize_delivery
 from notifier.discord import send_discord_announcement
-from config import TARGET_URL
+from notifier.smtp_pool import close_smtp_pool
+from crawler.browser_pool import close_browser_pool
+from config import TARGET_URL, PIPELINE_FETCH_WORKERS, CRAWLER_INCREMENTAL, CRAWLER_CHANGE_PROBE, CRAWLER_FETCH_MODE, CRAWLER_BOARD_WORKERS
 from subscribers.subscribers import get_active_subscribers
 from utils.logger import main_logger
+from utils.poll_schedule import now_kst, next_poll_interval
 
-def check_and_notify():
+# 파이프라인 작업 스레드 (실행 간 유지; 브라우저 작업은 Chromium을 소유한 단일 gn-browser 스레드에서 처리됨)
+_pipeline_executor = None
+_pipeline_lock = threading.Lock()
+# 게시판 확인 작업 스레드
+_board_executor = None
+
+def get_pipeline_executor():
+    """공지사항 처리 파이프라인용 스레드 풀을 반환합니다."""
+    global _pipeline_executor
+    with _pipeline_lock:
+        if _pipeline_executor is None:
+            _pipeline_executor = ThreadPoolExecutor(
+                max_workers=PIPELINE_FETCH_WORKERS,
+                thread_name_prefix="gn-pipeline"
+            )
+        return _pipeline_executor
+
+def get_board_executor():
+    """여러 게시판을 동시에 확인하기 위한 스레드 풀을 반환합니다."""
+    global _board_executor
+    with _pipeline_lock:
+        if _board_executor is None:
+            _board_executor = ThreadPoolExecutor(
+                max_workers=CRAWLER_BOARD_WORKERS,
+                thread_name_prefix="gn-board"
+            )
+        return _board_executor
+
+def shutdown_executors():
+    """유지하던 작업 스레드 풀을 종료합니다."""
+    global _pipeline_executor, _board_executor
+    with _pipeline_lock:
+        for executor in (_pipeline_executor, _board_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        _pipeline_executor = None
+        _board_executor = None
+
+def build_summary_input(notice_info):
+    """
+    요약용 텍스트를 구성합니다.
+    
+    Args:
+        notice_info (dict): 공지사항 상세 정보
+    
+    Returns:
+        str: 요약 모델에 전달할 텍스트
+    """
+    # 조회수는 실행마다 달라져 요약 캐시를 무효화하므로 제외
+    notice_content = f"""
+제목: {notice_info.get('title', '제목 없음')}
+작성자: {notice_info.get('writer', '작성자 없음')}
+등록일: {notice_info.get('date', '날짜 없음')}
+내용:
+{notice_info.get('content', '내용 없음')}
+
+첨부파일: {len(notice_info.get('attachments', []))}개
+"""
+    return notice_content.strip()
+
+def build_notice_message(notice, ai_summary):
+    """
+    알림용 구조체를 구성합니다.
+    
+    Args:
+        notice (dict): 공지사항 정보 (title, url)
+        ai_summary (str): 요약 내용
+    
+    Returns:
+        dict: 알림용 구조체 (title, message)
+    """
+    summarized_notice = f"""
+<p style="margin-bottom: 10px;">{ai_summary}</p>
+
+<p>🔗 링크: <a href="{notice['url']}" style="color: #3498db; text-decoration: none;">바로가기</a></p>
+"""
+    return {
+        'title': notice['title'],
+        'message': summarized_notice
+    }
+
+def build_notification_stack(new_notices, summary_backend=None):
+    """
+    새로운 공지사항들의 내용을 병렬로 크롤링한 뒤 묶어서 요약합니다.
+    
+    Args:
+        new_notices (list): 새로운 공지사항 목록
+        summary_backend (str): 요약 방식 ('openai' 또는 'local', 없으면 설정값)
+    
+    Returns:
+        list: 알림용 구조체 목록 (원래 공지사항 순서 유지, 실패한 공지사항 제외)
+    """
+    # 1. 상세 내용 병렬 크롤링
+    executor = get_pipeline_executor()
+    futures = [executor.submit(fetch_notice_content, notice['url']) for notice in new_notices]
+    
+    fetched = []  # (공지사항, 상세 정보) - 제출 순서대로 모아 원래 순서 유지
+    for notice, future in zip(new_notices, futures):
+        try:
+            fetched.append((notice, future.result()))
+        except Exception as e:
+            main_logger.error(f"공지사항 처리 실패 ({notice['title']}): {e}")
+    
+    # 2. 내용을 가져온 공지사항만 묶어서 AI 요약 (로컬 요약은 제목/작성자 등 머리 줄이 없는 본문 사용)
+    summary_targets = [
+        {'title': notice['title'], 'content': build_summary_input(notice_info), 'body': notice_info.get('content', '')}
+        for notice, notice_info in fetched if notice_info
+    ]
+    summaries = iter(summarize_notices(summary_targets, backend=summary_backend)) if summary_targets else iter([])
+    
+    notification_stack = []
+    for i, (notice, notice_info) in enumerate(fetched, 1):
+        ai_summary = next(summaries) if notice_info else "공지사항 내용을 가져올 수 없습니다."
+        notification_stack.append(build_notice_message(notice, ai_summary))
+        main_logger.process(i, len(fetched), f"공지사항 요약 완료: {notice['title']}")
+    
+    return notification_stack
+
+def is_board_due(board, now=None):
+    """
+    게시판별 최소 확인 간격(poll_interval)이 지났는지 확인합니다.
+    
+    Args:
+        board (dict): 게시판 설정
+        now (float): 현재 UNIX 시각 (없으면 현재 시각)
+    
+    Returns:
+        bool: 이번 실행에서 확인할 게시판이면 True
+    """
+    if not board.get('poll_interval'):
+        return True
+    last_polled = load_last_polled(namespace=board['key'])
+    return last_polled is None or (now or time.time()) - last_polled >= board['poll_interval']
+
+def check_board(board):
+    """
+    게시판 하나의 새로운 공지사항을 확인하고 게시판 기록에 저장합니다.
+    
+    Args:
+        board (dict): 게시판 설정
+    
+    Returns:
+        list: 새로운 공지사항 목록 (크롤링 실패 시 None)
+    """
+    namespace = board['key']
+    
+    # 게시판이 바뀌지 않았으면 HTTP 요청 한 번으로 종료 (브라우저/목록 크롤링 생략)
+    probe = None
+    if CRAWLER_CHANGE_PROBE and CRAWLER_FETCH_MODE != "browser":
+        probe = probe_board(load_board_state(namespace=namespace), board)
+        if not probe['changed']:
+            save_last_polled(time.time(), namespace=namespace)
+            return []
+    
+    # 기록이 있으면 마지막으로 본 공지사항까지만 목록을 넘김 (첫 실행은 첫 페이지 전체)
+    high_water_mark = get_high_water_mark(namespace=namespace) if CRAWLER_INCREMENTAL else None
+    if high_water_mark:
+        crawled_notices = fetch_notice_list_since(high_water_mark, board=board)
+        if crawled_notices is None:
+            main_logger.error(f"{board['name']} 크롤링 실패")
+            return None
+    else:
+        crawled_notices = fetch_notice_list(board=board)
+        if not crawled_notices:
+            main_logger.error(f"{board['name']} 크롤링 실패")
+            return None
+    
+    if crawled_notices:
+        main_logger.success(f"{board['name']} {len(crawled_notices)}개 공지사항 크롤링 완료")
+        new_notices = get_new_notices(crawled_notices, namespace=namespace)
+    else:
+        main_logger.info(f"{board['name']} 기준점 이후 새 공지사항이 없습니다.")
+        new_notices = []
+    
+    if probe:
+        # 새 공지사항이 기록된 뒤에만 게시판 상태를 저장 (중간에 실패하면 다음 실행에서 다시 확인)
+        save_board_state(probe['state'], namespace=namespace)
+    save_last_polled(time.time(), namespace=namespace)
+    return new_notices
+
+def check_boards(boards=None):
+    """
+    여러 게시판을 동시에 확인하고 새로운 공지사항을 합칩니다.
+    
+    Args:
+        boards (list): 게시판 설정 목록 (없으면 활성 게시판 중 확인할 때가 된 게시판)
+    
+    Returns:
+        tuple: (새로운 공지사항 목록 (게시판 순서, 중복 제거), 확인에 실패한 게시판 이름 목록)
+    """
+    if boards is None:
+        boards = [board for board in get_enabled_boards() if is_board_due(board)]
+    
+    executor = get_board_executor()
+    futures = [(board, executor.submit(check_board, board)) for board in boards]
+    
+    new_notices = []
+    seen_ids = set()
+    failed = []
+    for board, future in futures:
+        try:
+            board_notices = future.result()
+        except Exception as e:
+            main_logger.error(f"{board['name']} 확인 오류: {e}")
+            board_notices = None
+        if board_notices is None:
+            failed.append(board['name'])
+            continue
+        # 여러 게시판에 함께 올라온 공지사항은 한 번만 포함
+        for notice in board_notices:
+            if notice['id'] not in seen_ids:
+                seen_ids.add(notice['id'])
+                new_notices.append(notice)
+    return new_notices, failed
+
+def check_and_notify(summary_backend=None):
     """
     공지사항 확인 및 알림 전송 메인 함수
+    
+    Args:
+        summary_backend (str): 요약 방식 ('openai' 또는 'local', 없으면 설정값)
     """
     main_logger.start("공지사항 확인 시작")
     
     try:
-        main_logger.step(1, 3, "공지사항 리스트 크롤링")
-        crawled_notices = fetch_notice_list()
+        boards = [board for board in get_enabled_boards() if is_board_due(board)]
+        if not boards:
+            return {"status": "success", "message": "확인할 게시판 없음", "count": 0}
         
-        if not crawled_notices:
+        main_logger.step(1, 3, f"게시판 {len(boards)}곳 확인")
+        new_notices, failed = check_boards(boards)
+        if len(failed) == len(boards):
             main_logger.error("크롤링 실패")
             return {"status": "error", "message": "크롤링 실패"}
-        
-        main_logger.success(f"{len(crawled_notices)}개 공지사항 크롤링 완료")
+        if failed:
+            main_logger.warning(f"일부 게시판 확인 실패: {', '.join(failed)}")
         
         main_logger.step(2, 3, "새로운 공지사항 확인")
-        new_notices = get_new_notices(crawled_notices)
-        
         if not new_notices:
             return {"status": "success", "message": "새로운 공지사항 없음", "count": 0}
         
         # 3. 각 새로운 공지사항에 대해 요약 생성
         main_logger.step(3, 3, "공지사항 요약")
 
-        processed_count = 0
-        notification_stack = [] #여러 알림이 있을 시 한번에 알림을 정리해서 전송하기 위한 저장소
-        for i, notice in enumerate(new_notices, 1):
-            main_logger.process(i, len(new_notices), f"공지사항 요약 시작: {notice['title']}")
-            
-            try:
-                # 3.1 공지사항 내용 크롤링 및 AI 요약
-                notice_info = fetch_notice_content(notice['url'])
-                
-                if notice_info:
-                    # 요약용 텍스트 구성
-                    notice_content = f"""
-제목: {notice_info.get('title', '제목 없음')}
-작성자: {notice_info.get('writer', '작성자 없음')}
-등록일: {notice_info.get('date', '날짜 없음')}
-조회수: {notice_info.get('views', '조회수 없음')}
-내용:
-{notice_info.get('content', '내용 없음')}
-
-첨부파일: {len(notice_info.get('attachments', []))}개
-"""
-                    # AI 요약
-                    ai_summary = summarize_notice(notice['title'], notice_content.strip())
-                else:
-                    ai_summary = "공지사항 내용을 가져올 수 없습니다."
-                
-                # 3.2 알림 메시지 구성
-                summarized_notice = f"""
-<p style="margin-bottom: 10px;">{ai_summary}</p>
-
-<p>🔗 링크: <a href="{notice['url']}" style="color: #3498db; text-decoration: none;">바로가기</a></p>
-"""
-                # 구조체 형태로 저장
-                notification_stack.append({
-                    'title': notice['title'],
-                    'message': summarized_notice
-                })
-                main_logger.success(f"공지사항 요약 완료: {notice['title']}")
-                processed_count += 1
-                
-            except Exception as e:
-                main_logger.error(f"공지사항 처리 실패: {e}")
-                continue
-        
-
+        # 여러 알림이 있을 시 한번에 알림을 정리해서 전송하기 위한 저장소
+        notification_stack = build_notification_stack(new_notices, summary_backend)
+        processed_count = len(notification_stack)
+        main_logger.success(f"{processed_count}/{len(new_notices)}개 공지사항 요약 완료")
+        cache_stats = get_summary_cache().stats()
+        main_logger.info(f"요약 캐시: 적중 {cache_stats['hits']}, 미스 {cache_stats['misses']}, {cache_stats['entries']}개 저장")
+        main_logger.info(f"요약 요청: {summary_metrics.snapshot()}")
 
         # 3.3 알림 전송
         main_logger.send("main", "알림 전송")
@@ -97,7 +291,6 @@ def check_and_notify():
             return {"status": "success", "message": "활성 구독자가 없습니다.", "count": 0}
 
         main_logger.info(f"📧 {len(active_subscribers)}명의 구독자에게 이메일 전송")
-        success_count = 0
 
         # 이메일 내용 구분
         title = ''
@@ -120,48 +313,101 @@ def check_and_notify():
 ''' for item in notification_stack])}
 """
 
-        for subscriber in active_subscribers:
-            try:
-                send_email(title, message, subscriber['email'])
-                success_count += 1
-            except Exception as e:
-                main_logger.error(f"이메일 전송 실패 ({subscriber['email']}): {e}")
+        # 공유 SMTP 연결 풀로 병렬 전송 (초당 전송 수 제한)
+        results = send_bulk_email(title, message, [subscriber['email'] for subscriber in active_subscribers])
+        delivery = summarize_delivery(results)
         
-        main_logger.success(f"이메일 알림 전송 완료: {success_count}/{len(active_subscribers)}명")
+        main_logger.success(f"이메일 알림 전송 완료: {delivery['delivered']}/{delivery['total']}명 (실패 {delivery['failed']}, 재시도 {delivery['retried']})")
         
         main_logger.result(f"새로운 공지사항 요약 및 알림 전송 완료 ({processed_count}개)")
         return {
             "status": "success", 
             "message": f"{processed_count}개 공지사항 처리 완료", 
-            "count": processed_count
+            "count": processed_count,
+            "delivery": delivery
         }
         
     except Exception as e:
         main_logger.error(f"시스템 오류: {e}")
         return {"status": "error", "message": str(e)}
 
-def main():
+def main(summary_backend=None):
     """
     GachonNotifier (GN) 메인 실행 함수
+    
+    Args:
+        summary_backend (str): 요약 방식 ('openai' 또는 'local', 없으면 설정값)
     """
     main_logger.start("GN 시스템 시작")
     main_logger.info(f"📅 실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
-        result = check_and_notify()
+        result = check_and_notify(summary_backend)
         main_logger.success(f"GN 시스템 완료: {result}")
         return result
     except Exception as e:
         main_logger.error(f"GN 시스템 오류: {e}")
         return {"status": "error", "message": str(e)}
 
+def run_daemon(summary_backend=None):
+    """
+    상주하며 공지사항을 주기적으로 확인합니다. 브라우저, AI 클라이언트, SMTP 연결을 실행 간 유지하고,
+    확인 간격은 시간대와 최근 활동에 따라 조절합니다. SIGTERM/SIGINT를 받으면 진행 중인 확인을 마친 뒤 종료합니다.
+    
+    Args:
+        summary_backend (str): 요약 방식 ('openai' 또는 'local', 없으면 설정값)
+    """
+    stop_event = threading.Event()
+    
+    def handle_stop(signum, frame):
+        main_logger.info(f"종료 신호 수신 ({signal.Signals(signum).name}), 진행 중인 작업을 마친 뒤 종료합니다.")
+        stop_event.set()
+    
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+    
+    main_logger.start("GN 데몬 시작")
+    last_activity = None
+    failures = 0
+    
+    while not stop_event.is_set():
+        try:
+            result = check_and_notify(summary_backend)
+        except Exception as e:
+            result = {"status": "error", "message": str(e)}
+        
+        if result.get('status') == 'success':
+            failures = 0
+            if result.get('count'):
+                last_activity = now_kst()
+        else:
+            failures += 1
+            main_logger.error(f"확인 실패 ({failures}회 연속): {result.get('message')}")
+        
+        interval = next_poll_interval(now_kst(), last_activity, failures)
+        main_logger.info(f"다음 확인까지 {interval:.0f}초 대기")
+        stop_event.wait(interval)
+    
+    # 유지하던 자원 정리 (작업 스레드가 끝난 뒤 브라우저 전용 스레드에서 Chromium 종료)
+    shutdown_executors()
+    close_browser_pool()
+    close_smtp_pool()
+    main_logger.success("GN 데몬 종료")
+
 if __name__ == "__main__":
+    # 요약 방식 선택 옵션 (예: --summarizer=local)
+    summary_backend = None
+    for arg in sys.argv[1:]:
+        if arg.startswith("--summarizer="):
+            summary_backend = arg.split("=", 1)[1]
+            sys.argv.remove(arg)
+    
     # 명령행 인수 처리
     if len(sys.argv) > 1:
         if sys.argv[1] == "test":
             # 테스트 모드: 한 번만 실행
             main_logger.start("GN 시스템 테스트 실행")
-            result = check_and_notify()
+            result = check_and_notify(summary_backend)
             main_logger.result(f"테스트 결과: {result}")
         elif sys.argv[1] == "unit-tests":
             # 단위 테스트 실행
@@ -181,7 +427,7 @@ if __name__ == "__main__":
             suite = unittest.TestSuite()
             
             # 테스트 파일들 추가
-            test_files = ['test_simple', 'test_crawler', 'test_notifier', 'test_integration']
+            test_files = ['test_simple', 'test_crawler', 'test_notifier', 'test_integration', 'test_pipeline', 'test_ai', 'test_server']
             
             for test_file in test_files:
                 try:
@@ -225,7 +471,7 @@ if __name__ == "__main__":
             logger.info(f"실행 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             
             try:
-                result = check_and_notify()
+                result = check_and_notify(summary_backend)
                 logger.info(f"스케줄러 완료: {result}")
                 
                 if result.get('status') == 'success':
@@ -235,6 +481,9 @@ if __name__ == "__main__":
             except Exception as e:
                 logger.error(f"스케줄러 오류: {e}")
                 sys.exit(1)
+        elif sys.argv[1] == "daemon":
+            # 데몬 모드 (상주하며 주기적으로 확인, systemd 등으로 실행)
+            run_daemon(summary_backend)
         elif sys.argv[1] == "help":
             print("""
 GachonNotifier (GN) - 가천대 공지사항 자동 알림 시스템
@@ -244,8 +493,12 @@ GachonNotifier (GN) - 가천대 공지사항 자동 알림 시스템
     python main.py test              # 통합 테스트 (실제 크롤링 및 알림)
     python main.py unit-tests        # 단위 테스트 실행
     python main.py scheduler         # 스케줄러 모드 (EC2 cron용)
+    python main.py daemon            # 데몬 모드 (상주하며 시간대에 따라 간격을 조절해 확인)
     python main.py help              # 도움말 표시
 
+옵션:
+    --summarizer=local               # 이번 실행만 로컬 요약 사용 (OpenAI 호출 없음)
+
 환경 설정:
     - config.py에서 설정 확인
     - 환경변수 설정 필요 (텔레그램, 디스코드, 이메일 토큰 등)
@@ -256,10 +509,15 @@ EC2 Cron 설정 예시:
     
     # 매 30분마다 실행
     */30 * * * * cd /home/ubuntu/alg && /home/ubuntu/alg/venv/bin/python main.py scheduler
+
+데몬 모드 systemd 설정 예시 (cron 대신 사용, 종료 시 SIGTERM으로 정상 종료):
+    ExecStart=/home/ubuntu/alg/venv/bin/python main.py daemon
+    WorkingDirectory=/home/ubuntu/alg
+    Restart=on-failure
             """)
         else:
             print(f"알 수 없는 명령: {sys.argv[1]}")
-            print("사용법: python main.py [test|unit-tests|scheduler|help]")
+            print("사용법: python main.py [test|unit-tests|scheduler|daemon|help]")
     else:
         # 일반 실행
-        main()
+        main(summary_backend)
@@ -1,8 +1,11 @@
 # 이메일 알림 기능
 
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.header import Header
+import re
 import sys
 import os
 
@@ -10,35 +13,36 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import EMAIL_HOST, EMAIL_PORT, EMAIL_USER, EMAIL_PASSWORD, EMAIL_RECEIVER
+from config import EMAIL_SEND_WORKERS, EMAIL_RATE_LIMIT, EMAIL_BATCH_SIZE
 from utils.logger import get_logger
+from utils.rate_limiter import RateLimiter
+from notifier.smtp_pool import get_smtp_pool
 
 logger = get_logger("notifier")
 
-def send_email(subject, message, recipient_email):
+# 묶음 전송 시 수신자 목록을 숨기기 위한 To 헤더
+UNDISCLOSED_RECIPIENTS = "undisclosed-recipients:;"
+
+def build_message(subject, message, to_email):
     """
-    이메일로 알림을 전송합니다.
+    알림 이메일 메시지를 구성합니다.
     
     Args:
         subject (str): 이메일 제목
-        message (str): 이메일 내용
-        recipient_email (str): 수신자 이메일
+        message (str): 이메일 내용 (HTML)
+        to_email (str): 수신자 이메일 (None이면 To 헤더 생략)
     
     Returns:
-        bool: 전송 성공 여부
+        MIMEMultipart: 이메일 메시지
     """
-    # 수신자 이메일 설정
-    to_email = recipient_email if recipient_email else EMAIL_RECEIVER
-    
-    logger.send("email", f"이메일 전송 시작: {to_email}")
-    try:
-        # 이메일 메시지 구성
-        msg = MIMEMultipart()
-        msg['From'] = EMAIL_USER
+    msg = MIMEMultipart()
+    msg['From'] = EMAIL_USER
+    if to_email:
         msg['To'] = to_email
-        msg['Subject'] = subject
-        
-        # HTML 형식으로 메시지 작성
-        html_message = f"""
+    msg['Subject'] = subject
+    
+    # HTML 형식으로 메시지 작성
+    html_message = f"""
         <html>
         <body>
         <div style="background-color: #f5f5f5; padding: 20px; border-radius: 10px;">
@@ -52,8 +56,68 @@ def send_email(subject, message, recipient_email):
         </body>
         </html>
         """
+    
+    msg.attach(MIMEText(html_message, 'html'))
+    return msg
+
+class PreparedEmail:
+    """본문 렌더링과 MIME 인코딩을 한 번만 해 두고 수신자 헤더만 붙여 재사용하는 이메일"""
+    
+    def __init__(self, subject, message):
+        """
+        Args:
+            subject (str): 이메일 제목
+            message (str): 이메일 내용 (HTML)
+        """
+        msg = build_message(subject, message, None)
+        # SMTP 전송 형식(CRLF)의 바이트로 미리 직렬화
+        self._payload = re.sub(r'\r\n|\r|\n', '\r\n', msg.as_string()).encode('ascii')
+    
+    def for_recipient(self, to_email):
+        """
+        수신자 To 헤더를 붙인 전송용 메시지를 반환합니다.
+        
+        Args:
+            to_email (str): 수신자 이메일
         
-        msg.attach(MIMEText(html_message, 'html'))
+        Returns:
+            bytes: 직렬화된 메시지
+        """
+        to_header = to_email if to_email.isascii() else Header(to_email, 'utf-8').encode()
+        return b"To: " + to_header.encode('ascii') + b"\r\n" + self._payload
+
+def render_email(subject, message):
+    """
+    여러 수신자에게 보낼 이메일을 미리 렌더링합니다.
+    
+    Args:
+        subject (str): 이메일 제목
+        message (str): 이메일 내용 (HTML)
+    
+    Returns:
+        PreparedEmail: 미리 렌더링된 이메일
+    """
+    return PreparedEmail(subject, message)
+
+def send_email(subject, message, recipient_email):
+    """
+    이메일로 알림을 전송합니다.
+    
+    Args:
+        subject (str): 이메일 제목
+        message (str): 이메일 내용
+        recipient_email (str): 수신자 이메일
+    
+    Returns:
+        bool: 전송 성공 여부
+    """
+    # 수신자 이메일 설정
+    to_email = recipient_email if recipient_email else EMAIL_RECEIVER
+    
+    logger.send("email", f"이메일 전송 시작: {to_email}")
+    try:
+        # 이메일 메시지 구성
+        msg = build_message(subject, message, to_email)
         
         # SMTP 서버 연결 및 전송
         server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT)
@@ -71,12 +135,126 @@ def send_email(subject, message, recipient_email):
         logger.error(f"이메일 전송 오류 ({to_email}): {e}")
         return False
 
-def send_welcome_email(email):
+def send_bulk_email(subject, message, recipients, pool=None, workers=EMAIL_SEND_WORKERS,
+                    rate_limit=EMAIL_RATE_LIMIT, batch_size=EMAIL_BATCH_SIZE):
+    """
+    공유 SMTP 연결 풀로 여러 수신자에게 이메일을 병렬 전송합니다.
+    
+    Args:
+        subject (str): 이메일 제목
+        message (str): 이메일 내용 (HTML)
+        recipients (list): 수신자 이메일 목록
+        pool (SMTPConnectionPool): 사용할 연결 풀 (기본값: 공유 풀)
+        workers (int): 동시 전송 작업 수
+        rate_limit (float): 초당 최대 SMTP 트랜잭션 수 (0 이하이면 제한 없음)
+        batch_size (int): 묶음 전송 시 트랜잭션당 수신자 수 (1 이하이면 개별 전송)
+    
+    Returns:
+        list: 수신자별 결과 [{'email', 'success', 'attempts', 'error'}] (수신자 순서 유지)
+    """
+    pool = pool or get_smtp_pool()
+    limiter = RateLimiter(rate_limit)
+    # 본문은 한 번만 렌더링하고 수신자별로 To 헤더만 붙임
+    prepared = render_email(subject, message)
+    
+    if batch_size > 1:
+        logger.send("email", f"묶음 이메일 전송 시작: {len(recipients)}명 (묶음당 {batch_size}명)")
+        results = _send_batched(prepared, recipients, pool, workers, limiter, batch_size)
+    else:
+        logger.send("email", f"대량 이메일 전송 시작: {len(recipients)}명 (작업 {workers}개, 초당 {rate_limit or '무제한'}건)")
+        results = _send_individually(prepared, recipients, pool, workers, limiter)
+    
+    report = summarize_delivery(results)
+    logger.success(f"대량 이메일 전송 완료: 성공 {report['delivered']}, 실패 {report['failed']}, 재시도 {report['retried']}")
+    return results
+
+def _send_individually(prepared, recipients, pool, workers, limiter):
+    """수신자마다 별도의 SMTP 트랜잭션으로 전송"""
+    def send_one(to_email):
+        result = {'email': to_email, 'success': False, 'attempts': 0, 'error': None}
+        try:
+            limiter.acquire()
+            refused, result['attempts'] = pool.send(EMAIL_USER, to_email, prepared.for_recipient(to_email))
+            if refused:
+                result['error'] = str(refused.get(to_email, refused))
+            else:
+                result['success'] = True
+        except Exception as e:
+            result['attempts'] = getattr(e, 'smtp_attempts', 1)
+            result['error'] = str(e)
+            logger.error(f"이메일 전송 오류 ({to_email}): {e}")
+        return result
+    
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        return list(executor.map(send_one, recipients))
+
+def _send_batched(prepared, recipients, pool, workers, limiter, batch_size):
+    """여러 수신자를 한 트랜잭션의 봉투 수신자로 묶어 전송 (거부된 수신자는 개별 전송으로 재시도)"""
+    payload = prepared.for_recipient(UNDISCLOSED_RECIPIENTS)
+    chunks = [recipients[i:i + batch_size] for i in range(0, len(recipients), batch_size)]
+    
+    def send_chunk(chunk):
+        results = {}
+        rejected = []
+        try:
+            limiter.acquire()
+            refused, attempts = pool.send(EMAIL_USER, chunk, payload)
+            for to_email in chunk:
+                if to_email in refused:
+                    rejected.append(to_email)
+                else:
+                    results[to_email] = {'email': to_email, 'success': True, 'attempts': attempts, 'error': None}
+        except smtplib.SMTPRecipientsRefused:
+            # 묶음 전체가 거부된 경우
+            rejected = list(chunk)
+        except Exception as e:
+            logger.error(f"묶음 이메일 전송 오류 ({len(chunk)}명): {e}")
+            for to_email in chunk:
+                results[to_email] = {'email': to_email, 'success': False,
+                                     'attempts': getattr(e, 'smtp_attempts', 1), 'error': str(e)}
+        return results, rejected
+    
+    results = {}
+    rejected = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for chunk_results, chunk_rejected in executor.map(send_chunk, chunks):
+            results.update(chunk_results)
+            rejected.extend(chunk_rejected)
+    
+    if rejected:
+        logger.warning(f"묶음 전송에서 거부된 {len(rejected)}명에게 개별 전송 재시도")
+        for result in _send_individually(prepared, rejected, pool, workers, limiter):
+            result['attempts'] += 1
+            results[result['email']] = result
+    
+    return [results[to_email] for to_email in recipients]
+
+def summarize_delivery(results):
     """
-    구독 완료 환영 이메일 전송
+    수신자별 전송 결과를 집계합니다.
+    
+    Args:
+        results (list): send_bulk_email 결과
+    
+    Returns:
+        dict: {'total', 'delivered', 'failed', 'retried', 'failed_recipients'}
+              (retried는 재연결 후 다시 시도한 수신자 수로, 성공/실패와 겹칠 수 있음)
+    """
+    return {
+        'total': len(results),
+        'delivered': sum(1 for result in results if result['success']),
+        'failed': sum(1 for result in results if not result['success']),
+        'retried': sum(1 for result in results if result['attempts'] > 1),
+        'failed_recipients': [result['email'] for result in results if not result['success']]
+    }
+
+def send_welcome_email(email, pool=None):
+    """
+    구독 완료 환영 이메일 전송 (공유 SMTP 연결 풀 사용)
     
     Args:
         email (str): 구독자 이메일 주소
+        pool (SMTPConnectionPool): 사용할 연결 풀 (기본값: 공유 풀)
     
     Returns:
         bool: 전송 성공 여부
@@ -99,7 +277,12 @@ def send_welcome_email(email):
 </p>
 """
         
-        return send_email(subject, message, email)
+        refused, _ = (pool or get_smtp_pool()).send(EMAIL_USER, email, render_email(subject, message).for_recipient(email))
+        if refused:
+            logger.error(f"환영 이메일 수신 거부 ({email}): {refused}")
+            return False
+        logger.success(f"환영 이메일 전송 성공: {email}")
+        return True
         
     except Exception as e:
         logger.error(f"환영 이메일 전송 실패 ({email}): {e}")
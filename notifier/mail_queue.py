@@ -0,0 +1,264 @@
+# 이메일 작업 큐
+# 요청마다 스레드와 SMTP 연결을 새로 만들지 않도록 정해진 수의 작업 스레드가 공유 SMTP 연결 풀로 전송
+# 대기 작업은 sqlite 스풀 파일에 기록해 서버가 재시작되어도 유실되지 않고,
+# 처리 중인 작업은 임대 시간이 지나면 다른 작업 스레드(다른 프로세스 포함)가 다시 가져감
+
+from contextlib import contextmanager, closing
+import threading
+import sqlite3
+import atexit
+import json
+import time
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (MAIL_QUEUE_WORKERS, MAIL_QUEUE_MAX_SIZE, MAIL_QUEUE_MAX_ATTEMPTS,
+                    MAIL_QUEUE_LEASE, MAIL_QUEUE_POLL_INTERVAL)
+from notifier.email_notifier import send_welcome_email
+from utils.logger import get_logger
+
+logger = get_logger("notifier")
+
+SPOOL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mail_spool.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_available_at ON jobs (available_at);
+"""
+
+# 작업 종류별 처리 함수 (payload dict를 받아 성공 여부 반환)
+JOB_HANDLERS = {
+    'welcome': lambda payload: send_welcome_email(payload['email']),
+}
+
+# 실패한 작업의 첫 재시도 대기 시간(초), 시도할 때마다 두 배
+RETRY_DELAY = 10
+
+class MailQueueFull(Exception):
+    """대기 작업 수가 최대치에 도달해 작업을 받을 수 없음"""
+
+class MailQueue:
+    """sqlite 스풀 기반의 크기 제한 작업 큐와 작업 스레드"""
+
+    def __init__(self, spool_file=SPOOL_FILE, handlers=None, workers=MAIL_QUEUE_WORKERS,
+                 max_size=MAIL_QUEUE_MAX_SIZE, max_attempts=MAIL_QUEUE_MAX_ATTEMPTS,
+                 lease=MAIL_QUEUE_LEASE, poll_interval=MAIL_QUEUE_POLL_INTERVAL):
+        """
+        Args:
+            spool_file (str): 스풀 파일 경로 (여러 프로세스가 함께 사용 가능)
+            handlers (dict): 작업 종류별 처리 함수 (기본값: JOB_HANDLERS)
+            workers (int): 작업 스레드 수
+            max_size (int): 최대 대기 작업 수 (스풀 전체 기준)
+            max_attempts (int): 작업당 최대 시도 횟수
+            lease (int): 처리 중 작업을 다른 작업 스레드가 가져가지 않는 시간(초)
+            poll_interval (float): 새 작업 알림이 없을 때 스풀을 다시 확인하는 간격(초)
+        """
+        self.spool_file = spool_file
+        self.handlers = handlers or JOB_HANDLERS
+        self.workers = max(1, workers)
+        self.max_size = max_size
+        self.max_attempts = max(1, max_attempts)
+        self.lease = lease
+        self.poll_interval = poll_interval
+
+        with closing(sqlite3.connect(self.spool_file, timeout=30)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
+            for statement in SCHEMA.split(';'):
+                if statement.strip():
+                    conn.execute(statement)
+
+        self._wakeup = threading.Semaphore(0)
+        self._stop = threading.Event()
+        self._threads = []
+        self._stats_lock = threading.Lock()
+        self._stats = {'enqueued': 0, 'sent': 0, 'retried': 0, 'dropped': 0, 'total_latency': 0.0, 'max_latency': 0.0}
+
+    @contextmanager
+    def _connect(self, write=False):
+        """트랜잭션 하나를 여는 연결 (write면 시작할 때 쓰기 잠금)"""
+        with closing(sqlite3.connect(self.spool_file, timeout=30)) as conn:
+            with conn:
+                if write:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+
+    def start(self):
+        """작업 스레드를 시작합니다. (스풀에 남아 있던 작업부터 처리)"""
+        if self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run_worker, name=f"gn-mail-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=10):
+        """
+        작업 스레드를 멈춥니다. 처리 중인 작업은 마치고, 남은 작업은 스풀에 유지됩니다.
+
+        Args:
+            timeout (float): 스레드별 최대 대기 시간(초)
+        """
+        self._stop.set()
+        for _ in self._threads:
+            self._wakeup.release()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def enqueue(self, kind, payload):
+        """
+        작업을 스풀에 기록하고 작업 스레드를 깨웁니다.
+
+        Args:
+            kind (str): 작업 종류 (JOB_HANDLERS 키)
+            payload (dict): 작업 내용 (JSON 직렬화 가능)
+
+        Returns:
+            int: 작업 ID
+
+        Raises:
+            MailQueueFull: 대기 작업 수가 max_size 이상일 때
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        now = time.time()
+        with self._connect(write=True) as conn:
+            depth = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+            if depth >= self.max_size:
+                raise MailQueueFull(f"대기 작업 {depth}개")
+            job_id = conn.execute(
+                "INSERT INTO jobs (kind, payload, enqueued_at, available_at) VALUES (?, ?, ?, ?)",
+                (kind, json.dumps(payload, ensure_ascii=False), now, now)
+            ).lastrowid
+        with self._stats_lock:
+            self._stats['enqueued'] += 1
+        self._wakeup.release()
+        return job_id
+
+    def _claim(self):
+        """처리할 수 있는 작업 하나를 임대합니다. (없으면 None)"""
+        now = time.time()
+        # 대부분의 확인은 처리할 작업이 없으므로, 잠금 없이 먼저 확인해 작업이 있을 때만 쓰기 잠금을 잡음
+        with self._connect() as conn:
+            if conn.execute("SELECT 1 FROM jobs WHERE available_at <= ? LIMIT 1", (now,)).fetchone() is None:
+                return None
+        with self._connect(write=True) as conn:
+            row = conn.execute(
+                "SELECT id, kind, payload, enqueued_at, attempts FROM jobs WHERE available_at <= ? ORDER BY id LIMIT 1", (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE jobs SET available_at = ?, attempts = attempts + 1 WHERE id = ?", (now + self.lease, row[0]))
+        job_id, kind, payload, enqueued_at, attempts = row
+        return {'id': job_id, 'kind': kind, 'payload': json.loads(payload), 'enqueued_at': enqueued_at, 'attempts': attempts + 1}
+
+    def _finish(self, job, success):
+        """처리 결과를 스풀에 반영 (성공하거나 시도 횟수를 다 쓰면 삭제, 아니면 재시도 예약)"""
+        with self._connect(write=True) as conn:
+            if success or job['attempts'] >= self.max_attempts:
+                conn.execute("DELETE FROM jobs WHERE id = ?", (job['id'],))
+            else:
+                retry_at = time.time() + RETRY_DELAY * 2 ** (job['attempts'] - 1)
+                conn.execute("UPDATE jobs SET available_at = ? WHERE id = ?", (retry_at, job['id']))
+
+        with self._stats_lock:
+            if success:
+                latency = time.time() - job['enqueued_at']
+                self._stats['sent'] += 1
+                self._stats['total_latency'] += latency
+                self._stats['max_latency'] = max(self._stats['max_latency'], latency)
+            elif job['attempts'] >= self.max_attempts:
+                self._stats['dropped'] += 1
+                logger.error(f"메일 작업 포기 ({job['kind']} #{job['id']}, {job['attempts']}회 실패)")
+            else:
+                self._stats['retried'] += 1
+
+    def _run_worker(self):
+        while not self._stop.is_set():
+            try:
+                job = self._claim()
+            except Exception as e:
+                logger.error(f"메일 스풀 읽기 오류: {e}")
+                job = None
+            if job is None:
+                # 새 작업 알림 또는 재시도/다른 프로세스의 만료된 작업을 위해 주기적으로 확인
+                self._wakeup.acquire(timeout=self.poll_interval)
+                continue
+
+            try:
+                success = bool(self.handlers[job['kind']](job['payload']))
+            except Exception as e:
+                logger.error(f"메일 작업 오류 ({job['kind']} #{job['id']}): {e}")
+                success = False
+            try:
+                self._finish(job, success)
+            except Exception as e:
+                # 스풀에 반영하지 못하면 임대 시간이 지난 뒤 다시 처리됨
+                logger.error(f"메일 스풀 기록 오류: {e}")
+
+    def depth(self):
+        """스풀에 남아 있는 작업 수 (처리 중, 재시도 대기 포함)"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def stats(self):
+        """
+        큐 상태를 반환합니다.
+
+        Returns:
+            dict: {'depth', 'oldest_age', 'workers', 'enqueued', 'sent', 'retried', 'dropped', 'avg_latency', 'max_latency'}
+                  (depth/oldest_age는 스풀 전체, 나머지는 이 프로세스 기준, latency는 등록부터 전송 완료까지 초)
+        """
+        with self._connect() as conn:
+            depth, oldest = conn.execute("SELECT COUNT(*), MIN(enqueued_at) FROM jobs").fetchone()
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total_latency = stats.pop('total_latency')
+        return {
+            'depth': depth,
+            'oldest_age': round(time.time() - oldest, 3) if oldest else 0.0,
+            'workers': len(self._threads),
+            **stats,
+            'avg_latency': round(total_latency / stats['sent'], 3) if stats['sent'] else 0.0,
+            'max_latency': round(stats['max_latency'], 3),
+        }
+
+
+# 프로세스 전체에서 공유하는 큐
+_queue = None
+_queue_lock = threading.Lock()
+
+def get_mail_queue():
+    """
+    공유 메일 작업 큐를 반환합니다. (처음 호출할 때 작업 스레드 시작)
+
+    Returns:
+        MailQueue: 메일 작업 큐
+    """
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = MailQueue()
+            _queue.start()
+        return _queue
+
+@atexit.register
+def close_mail_queue():
+    """공유 메일 작업 큐의 작업 스레드를 멈춥니다. (남은 작업은 다음 실행에서 처리)"""
+    global _queue
+    with _queue_lock:
+        if _queue is not None:
+            _queue.stop()
+            _queue = None
@@ -0,0 +1,193 @@
+# SMTP 연결 풀
+# 메시지마다 TLS 핸드셰이크와 로그인을 반복하지 않도록 인증된 연결을 재사용
+
+from contextlib import contextmanager
+import smtplib
+import threading
+import atexit
+import queue
+import time
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (EMAIL_HOST, EMAIL_PORT, EMAIL_USER, EMAIL_PASSWORD,
+                    SMTP_POOL_SIZE, SMTP_MAX_MESSAGES_PER_CONNECTION, SMTP_TIMEOUT, SMTP_MAX_RETRIES,
+                    SMTP_IDLE_CHECK_AFTER)
+from utils.logger import get_logger
+
+logger = get_logger("notifier")
+
+# 연결을 버리고 다시 맺으면 해결될 수 있는 오류
+RECONNECT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+class PooledConnection:
+    """풀에서 관리하는 SMTP 연결 (전송한 메시지 수 추적)"""
+
+    def __init__(self, server):
+        self.server = server
+        self.sent_count = 0
+        self.idle_since = time.monotonic()
+
+    def is_alive(self):
+        """NOOP으로 서버가 아직 연결을 유지하는지 확인"""
+        try:
+            return self.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def close(self):
+        try:
+            self.server.quit()
+        except Exception:
+            try:
+                self.server.close()
+            except Exception:
+                pass
+
+class SMTPConnectionPool:
+    """인증된 SMTP 연결을 여러 개 유지하며 재사용하는 풀"""
+
+    def __init__(self, host=EMAIL_HOST, port=EMAIL_PORT, user=EMAIL_USER, password=EMAIL_PASSWORD,
+                 size=SMTP_POOL_SIZE, max_messages_per_connection=SMTP_MAX_MESSAGES_PER_CONNECTION,
+                 timeout=SMTP_TIMEOUT, max_retries=SMTP_MAX_RETRIES, idle_check_after=SMTP_IDLE_CHECK_AFTER):
+        """
+        Args:
+            host (str): SMTP 서버 주소
+            port (int): SMTP 서버 포트
+            user (str): 로그인 계정
+            password (str): 로그인 비밀번호
+            size (int): 최대 동시 연결 수
+            max_messages_per_connection (int): 연결 하나로 보낼 최대 메시지 수 (초과 시 재연결)
+            timeout (int): 소켓 타임아웃(초)
+            max_retries (int): 연결이 끊어졌을 때 재연결 후 재시도 횟수
+            idle_check_after (float): 이 시간(초) 넘게 쉰 연결은 재사용 전에 NOOP으로 확인
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.size = size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.idle_check_after = idle_check_after
+
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _connect(self):
+        """새 SMTP 연결을 맺고 로그인"""
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        server.starttls()
+        server.login(self.user, self.password)
+        logger.info(f"SMTP 연결 생성: {self.host}:{self.port}")
+        return PooledConnection(server)
+
+    def _checkout_idle(self):
+        """유휴 연결 중 살아 있는 것을 하나 꺼냄 (오래 쉰 연결은 NOOP으로 확인하고, 끊긴 연결은 닫음)"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - conn.idle_since <= self.idle_check_after or conn.is_alive():
+                return conn
+            logger.info("끊어진 유휴 SMTP 연결 정리")
+            conn.close()
+
+    @contextmanager
+    def connection(self, fresh=False):
+        """
+        풀에서 연결을 하나 빌려옵니다. 사용 가능한 연결이 없으면 반납될 때까지 대기합니다.
+
+        Args:
+            fresh (bool): 유휴 연결을 쓰지 않고 새로 연결 (재연결 후 재시도용)
+
+        Yields:
+            PooledConnection: SMTP 연결
+        """
+        self._slots.acquire()
+        conn = None
+        broken = False
+        try:
+            if not fresh:
+                conn = self._checkout_idle()
+            if conn is None:
+                conn = self._connect()
+            yield conn
+        except RECONNECT_ERRORS:
+            broken = True
+            raise
+        finally:
+            if conn is not None:
+                if broken or conn.sent_count >= self.max_messages_per_connection:
+                    conn.close()
+                else:
+                    conn.idle_since = time.monotonic()
+                    self._idle.put(conn)
+            self._slots.release()
+
+    def send(self, from_addr, to_addrs, msg):
+        """
+        연결을 재사용해 메시지를 전송합니다. 연결이 끊어지면 새 연결로 재시도합니다.
+        (같은 때 쉬던 다른 유휴 연결도 끊겼을 가능성이 크므로 재시도에는 유휴 연결을 쓰지 않음)
+
+        Args:
+            from_addr (str): 보내는 주소
+            to_addrs (str | list): 받는 주소
+            msg (str | bytes): 직렬화된 메시지
+
+        Returns:
+            tuple: (거부된 수신자 dict, 시도 횟수)
+        """
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                with self.connection(fresh=attempts > 1) as conn:
+                    refused = conn.server.sendmail(from_addr, to_addrs, msg)
+                    conn.sent_count += 1
+                    return refused, attempts
+            except RECONNECT_ERRORS as e:
+                if attempts > self.max_retries:
+                    e.smtp_attempts = attempts
+                    raise
+                logger.warning(f"SMTP 연결 끊김, 재연결 후 재시도 ({attempts}/{self.max_retries}): {e}")
+
+    def close(self):
+        """유휴 연결을 모두 종료"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+# 프로세스 전체에서 공유하는 풀
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_smtp_pool():
+    """
+    공유 SMTP 연결 풀을 반환합니다.
+
+    Returns:
+        SMTPConnectionPool: SMTP 연결 풀
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = SMTPConnectionPool()
+        return _pool
+
+@atexit.register
+def close_smtp_pool():
+    """공유 SMTP 연결 풀을 종료합니다."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,276 @@
+# 구독자 일괄 가져오기/내보내기
+# 학과 메일링 리스트 이전처럼 구독자를 한꺼번에 옮길 때 사용
+# 가져오기는 입력을 모두 읽어 검증/중복 제거한 뒤 하나의 트랜잭션으로 추가/갱신하고,
+# 내보내기는 저장소를 페이지 단위로 읽어 전체를 메모리에 올리지 않고 내보냄
+#
+# 사용법:
+#   python -m subscribers.bulk import members.csv
+#   python -m subscribers.bulk export --format ndjson --active-only -o subscribers.ndjson
+
+import argparse
+import json
+import csv
+import io
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.logger import get_logger
+from subscribers.subscriber_store import get_subscriber_store, is_valid_email
+
+logger = get_logger("subscriber")
+
+# 형식별 Content-Type
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+# 내보내기 항목 (가져오기도 같은 열을 읽으므로 내보낸 파일을 그대로 다시 가져올 수 있음)
+FIELDS = ['email', 'active', 'subscribed_at', 'unsubscribed_at']
+
+# 가져오기 결과에 담을 최대 오류 수
+MAX_REPORTED_ERRORS = 20
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y'}
+FALSE_VALUES = {'0', 'false', 'no', 'n'}
+
+def format_from_content_type(content_type):
+    """
+    Content-Type으로 가져오기 형식을 판단합니다.
+
+    Returns:
+        str: 'csv', 'ndjson' (알 수 없으면 None)
+    """
+    mimetype = (content_type or '').split(';')[0].strip().lower()
+    if mimetype in ('text/csv', 'application/csv'):
+        return 'csv'
+    if mimetype in ('application/x-ndjson', 'application/ndjson', 'application/jsonl'):
+        return 'ndjson'
+    return None
+
+def _parse_active(value):
+    """활성 여부 값을 bool로 변환 (알 수 없는 값이면 ValueError)"""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f"알 수 없는 active 값: {value}")
+
+def _to_record(fields):
+    """입력 항목을 구독자 레코드로 변환 (email 외 항목은 값이 있을 때만, active가 비어 있으면 기존 구독자 상태 유지)"""
+    email = fields.get('email')
+    record = {'email': email.strip() if isinstance(email, str) else ''}
+    if fields.get('active') is not None and str(fields['active']).strip() != '':
+        record['active'] = _parse_active(fields['active'])
+    for name in ('subscribed_at', 'unsubscribed_at'):
+        if fields.get(name):
+            record[name] = str(fields[name]).strip()
+    return record
+
+def _parse_csv(lines):
+    """CSV 행을 (줄 번호, 레코드, 오류) 로 변환 (email 열 머리글이 없으면 첫 열을 이메일로 사용)"""
+    reader = csv.reader(lines)
+    header = None
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        if reader.line_num == 1:
+            names = [cell.strip().lower().lstrip('\ufeff') for cell in row]
+            if 'email' in names:
+                header = names
+                continue
+        try:
+            record = _to_record(dict(zip(header, row))) if header else {'email': row[0].strip()}
+        except ValueError as e:
+            yield reader.line_num, None, str(e)
+            continue
+        yield reader.line_num, record, None
+
+def _parse_ndjson(lines):
+    """NDJSON 줄을 (줄 번호, 레코드, 오류) 로 변환 (각 줄은 {"email": ...} 또는 이메일 문자열)"""
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+            if isinstance(item, str):
+                item = {'email': item}
+            if not isinstance(item, dict):
+                raise ValueError("각 줄은 JSON 객체 또는 이메일 문자열이어야 합니다.")
+            record = _to_record(item)
+        except ValueError as e:
+            yield line_no, None, str(e)
+            continue
+        yield line_no, record, None
+
+PARSERS = {'csv': _parse_csv, 'ndjson': _parse_ndjson}
+
+def _valid_records(parsed, report):
+    """
+    해석한 줄을 검증/중복 제거해 기록할 레코드만 반환합니다. (건너뛴 줄은 report에 기록)
+
+    Args:
+        parsed (iterable): (줄 번호, 레코드, 오류)
+        report (dict): 가져오기 결과 (received/duplicates/invalid/errors 갱신)
+
+    Yields:
+        dict: 구독자 레코드 (같은 이메일은 처음 나온 줄만)
+    """
+    seen = set()
+    for line_no, record, error in parsed:
+        report['received'] += 1
+        if error is None and not is_valid_email(record['email']):
+            error = f"올바른 이메일 형식이 아닙니다: {record['email']}"
+        if error is not None:
+            report['invalid'] += 1
+            if len(report['errors']) < MAX_REPORTED_ERRORS:
+                report['errors'].append({'line': line_no, 'error': error})
+            continue
+        if record['email'] in seen:
+            report['duplicates'] += 1
+            continue
+        seen.add(record['email'])
+        yield record
+
+def import_subscribers(lines, fmt, store=None):
+    """
+    구독자를 일괄 추가/갱신합니다. 형식이 잘못되었거나 중복된 줄은 건너뛰고,
+    나머지는 하나의 트랜잭션으로 기록합니다. (중간에 실패하면 아무것도 기록되지 않음)
+    active 열이 없는 줄은 새 이메일만 추가하고, 해지한 구독자를 다시 활성화하지 않습니다.
+
+    Args:
+        lines (iterable): 입력 줄 (파일 객체 또는 문자열 목록)
+        fmt (str): 'csv' 또는 'ndjson'
+        store (SubscriberStore): 구독자 저장소 (없으면 기본 저장소)
+
+    Returns:
+        dict: {'received', 'created', 'updated', 'unchanged', 'duplicates', 'invalid', 'errors'}
+
+    Raises:
+        ValueError: 지원하지 않는 형식일 때
+    """
+    if fmt not in PARSERS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (csv, ndjson)")
+    return _import(PARSERS[fmt](lines), store)
+
+def subscribe_emails(emails, store=None):
+    """
+    이메일 목록을 한 번에 구독 처리합니다. (import_subscribers와 같은 검증/중복 제거/트랜잭션)
+    새 이메일만 추가하며, 이미 있거나 해지한 구독자는 그대로 둡니다.
+
+    Args:
+        emails (list): 이메일 주소 목록
+        store (SubscriberStore): 구독자 저장소 (없으면 기본 저장소)
+
+    Returns:
+        dict: import_subscribers와 같은 결과 (errors의 line은 목록에서의 순서)
+    """
+    parsed = (
+        (index, {'email': email.strip()}, None) if isinstance(email, str) else (index, None, "이메일은 문자열이어야 합니다.")
+        for index, email in enumerate(emails, start=1)
+    )
+    return _import(parsed, store)
+
+def _import(parsed, store):
+    """
+    해석한 줄을 검증/중복 제거 후 하나의 트랜잭션으로 기록하고 결과를 반환
+    입력(네트워크로 받는 요청 본문 포함)을 모두 읽은 뒤에 쓰기 잠금을 잡아, 느린 업로드가 다른 가입/해지를 막지 않도록 함
+    """
+    store = store or get_subscriber_store()
+    report = {'received': 0, 'created': 0, 'updated': 0, 'unchanged': 0, 'duplicates': 0, 'invalid': 0, 'errors': []}
+    records = list(_valid_records(parsed, report))
+    report.update(store.import_subscribers(records))
+    logger.info(f"구독자 가져오기: {report['received']}줄, 추가 {report['created']}명, 갱신 {report['updated']}명, "
+                f"중복 {report['duplicates']}줄, 오류 {report['invalid']}줄")
+    return report
+
+def export_subscribers(fmt, active_only=False, store=None, page_size=500):
+    """
+    구독자를 형식에 맞춰 page_size명씩 묶은 문자열로 반환합니다. (전체를 메모리에 올리지 않음)
+
+    Args:
+        fmt (str): 'csv' 또는 'ndjson'
+        active_only (bool): 활성 구독자만 내보내기
+        store (SubscriberStore): 구독자 저장소 (없으면 기본 저장소)
+        page_size (int): 한 번에 내보낼 구독자 수
+
+    Yields:
+        str: 내보낼 내용 (CSV는 머리글부터)
+
+    Raises:
+        ValueError: 지원하지 않는 형식일 때 (첫 내용을 요청하기 전에 확인)
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {fmt} (csv, ndjson)")
+    store = store or get_subscriber_store()
+
+    def chunks():
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=FIELDS, lineterminator='\n')
+        if fmt == 'csv':
+            writer.writeheader()
+        count = 0
+        for subscriber in store.iter_subscribers(active_only=active_only, page_size=page_size):
+            row = {name: subscriber.get(name) for name in FIELDS}
+            if fmt == 'csv':
+                row['active'] = int(row['active'])
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row, ensure_ascii=False) + '\n')
+            count += 1
+            if count % page_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.getvalue():
+            yield buffer.getvalue()
+
+    return chunks()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="구독자 일괄 가져오기/내보내기")
+    parser.add_argument('--db', help="구독자 저장소 경로 (기본값: subscribers/subscribers.db, .json이면 같은 이름의 .db로 가져옴)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help="CSV/NDJSON 파일에서 구독자 가져오기")
+    import_parser.add_argument('file', help="가져올 파일 ('-'이면 표준 입력)")
+    import_parser.add_argument('--format', choices=sorted(FORMATS), help="파일 형식 (기본값: 확장자로 판단)")
+
+    export_parser = commands.add_parser('export', help="구독자를 CSV/NDJSON으로 내보내기")
+    export_parser.add_argument('--format', choices=sorted(FORMATS), default='csv', help="파일 형식 (기본값: csv)")
+    export_parser.add_argument('--active-only', action='store_true', help="활성 구독자만 내보내기")
+    export_parser.add_argument('-o', '--output', help="저장할 파일 (기본값: 표준 출력)")
+
+    args = parser.parse_args(argv)
+    store = get_subscriber_store(args.db)
+
+    if args.command == 'import':
+        fmt = args.format or ('ndjson' if args.file.endswith(('.ndjson', '.jsonl')) else 'csv')
+        if args.file == '-':
+            report = import_subscribers(io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8-sig', newline=''), fmt, store)
+        else:
+            with open(args.file, encoding='utf-8-sig', newline='') as f:
+                report = import_subscribers(f, fmt, store)
+        print(f"✅ 가져오기 완료: 추가 {report['created']}명, 갱신 {report['updated']}명, 변경 없음 {report['unchanged']}명, "
+              f"중복 {report['duplicates']}줄, 오류 {report['invalid']}줄")
+        for error in report['errors']:
+            print(f"  ⚠️ {error['line']}번째 줄: {error['error']}")
+        return 0
+
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        for chunk in export_subscribers(args.format, args.active_only, store):
+            output.write(chunk)
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
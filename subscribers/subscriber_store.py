@@ -0,0 +1,403 @@
+# 구독자 저장소 (sqlite)
+# 이메일을 기본 키로 색인하여 구독자가 늘어도 조회/변경 비용이 일정하도록 하고,
+# WAL 모드와 쓰기 잠금(BEGIN IMMEDIATE)으로 여러 서버 프로세스가 동시에 써도 변경이 유실되지 않도록 함
+# 구독자 수와 변경 버전은 트리거로 stats 행에 함께 갱신해 전체를 세지 않고 바로 조회
+
+from contextlib import contextmanager, closing
+from datetime import datetime
+import threading
+import sqlite3
+import json
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.logger import get_logger
+
+logger = get_logger("subscriber")
+
+SUBSCRIBERS_DIR = os.path.dirname(os.path.abspath(__file__))
+DB_FILE = os.path.join(SUBSCRIBERS_DIR, "subscribers.db")
+LEGACY_FILE = os.path.join(SUBSCRIBERS_DIR, "subscribers.json")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscribers (
+    email TEXT PRIMARY KEY,
+    active INTEGER NOT NULL DEFAULT 1,
+    subscribed_at TEXT,
+    unsubscribed_at TEXT
+);
+CREATE INDEX IF NOT EXISTS subscribers_active ON subscribers (active);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    version INTEGER NOT NULL,
+    active_count INTEGER NOT NULL,
+    total_count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO stats (id, version, active_count, total_count)
+    SELECT 1, 0, COALESCE(SUM(active), 0), COUNT(*) FROM subscribers;
+CREATE TRIGGER IF NOT EXISTS subscribers_inserted AFTER INSERT ON subscribers BEGIN
+    UPDATE stats SET version = version + 1, total_count = total_count + 1, active_count = active_count + NEW.active;
+END;
+CREATE TRIGGER IF NOT EXISTS subscribers_deleted AFTER DELETE ON subscribers BEGIN
+    UPDATE stats SET version = version + 1, total_count = total_count - 1, active_count = active_count - OLD.active;
+END;
+CREATE TRIGGER IF NOT EXISTS subscribers_active_changed AFTER UPDATE OF active ON subscribers WHEN NEW.active != OLD.active BEGIN
+    UPDATE stats SET version = version + 1, active_count = active_count + NEW.active - OLD.active;
+END;
+"""
+
+# subscribe/unsubscribe 결과
+CREATED = "created"
+REACTIVATED = "reactivated"
+ALREADY_ACTIVE = "already_active"
+UNSUBSCRIBED = "unsubscribed"
+ALREADY_INACTIVE = "already_inactive"
+NOT_FOUND = "not_found"
+
+def is_valid_email(email):
+    """이메일 형식 검증 (간단한 검증)"""
+    return bool(email) and '@' in email and '.' in email
+
+def _chunks(iterable, size):
+    """iterable을 size개씩 묶어 반환"""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _row_to_subscriber(row):
+    """DB 행을 구독자 dict로 변환 (이전 JSON 형식과 같은 키)"""
+    email, active, subscribed_at, unsubscribed_at = row
+    subscriber = {'email': email, 'subscribed_at': subscribed_at, 'active': bool(active)}
+    if unsubscribed_at:
+        subscriber['unsubscribed_at'] = unsubscribed_at
+    return subscriber
+
+def _read_legacy(path):
+    """JSON 구독자 파일에서 구독자 목록을 읽습니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('subscribers', [])
+
+class SubscriberStore:
+    """sqlite 기반 구독자 저장소"""
+
+    def __init__(self, db_file=DB_FILE, legacy_file=None):
+        """
+        Args:
+            db_file (str): 데이터베이스 파일 경로
+            legacy_file (str): 비어 있는 저장소에 처음 한 번 가져올 JSON 구독자 파일 (파일은 바꾸지 않음)
+        """
+        self.db_file = db_file
+        with closing(sqlite3.connect(self.db_file, timeout=30)) as conn:
+            # WAL: 쓰는 동안에도 다른 프로세스의 읽기가 막히지 않음 (DB 파일에 유지되는 설정)
+            conn.execute("PRAGMA journal_mode=WAL")
+        with self._connect() as conn:
+            # 트리거 본문에도 ';'가 있으므로 완성된 문장 단위로 실행 (executescript는 트랜잭션을 커밋함)
+            statement = ''
+            for line in SCHEMA.splitlines(keepends=True):
+                statement += line
+                if sqlite3.complete_statement(statement):
+                    conn.execute(statement)
+                    statement = ''
+        if legacy_file and os.path.exists(legacy_file):
+            self._import_legacy(legacy_file)
+
+    @contextmanager
+    def _connect(self, write=False):
+        """
+        트랜잭션 하나를 여는 연결 (블록이 끝나면 커밋, 오류 시 롤백)
+
+        Args:
+            write (bool): 읽은 값을 보고 쓰는 작업이면 True (시작할 때 쓰기 잠금을 잡아 다른 프로세스와 겹치지 않도록 함)
+        """
+        with closing(sqlite3.connect(self.db_file, timeout=30)) as conn:
+            conn.execute("PRAGMA synchronous=FULL")
+            with conn:
+                if write:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield conn
+
+    def _import_legacy(self, legacy_file):
+        """저장소가 비어 있을 때 JSON 구독자를 한 번만 가져옴"""
+        if self.get_meta('legacy_imported') or self.count():
+            return
+        try:
+            subscribers = _read_legacy(legacy_file)
+        except Exception as e:
+            logger.error(f"기존 구독자 가져오기 오류: {e}")
+            return
+        with self._connect(write=True) as conn:
+            self._insert(conn, subscribers)
+            self._set_meta(conn, 'legacy_imported', datetime.now().isoformat())
+        logger.success(f"기존 구독자 가져오기 완료: {len(subscribers)}명")
+
+    @staticmethod
+    def _insert(conn, subscribers):
+        """구독자 목록을 추가합니다. (이미 있는 이메일은 무시, active 플래그가 없으면 활성)"""
+        conn.executemany(
+            "INSERT OR IGNORE INTO subscribers (email, active, subscribed_at, unsubscribed_at) VALUES (?, ?, ?, ?)",
+            [
+                (sub['email'].strip(), int(sub.get('active', True)), sub.get('subscribed_at'), sub.get('unsubscribed_at'))
+                for sub in subscribers if sub.get('email')
+            ]
+        )
+
+    @staticmethod
+    def _set_meta(conn, name, value):
+        conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    @staticmethod
+    def _get(conn, email):
+        row = conn.execute(
+            "SELECT email, active, subscribed_at, unsubscribed_at FROM subscribers WHERE email = ?", (email,)
+        ).fetchone()
+        return _row_to_subscriber(row) if row else None
+
+    def get(self, email):
+        """
+        이메일로 구독자를 찾습니다.
+
+        Args:
+            email (str): 이메일 주소
+
+        Returns:
+            dict: 구독자 (없으면 None)
+        """
+        with self._connect() as conn:
+            return self._get(conn, email)
+
+    def subscribe(self, email, with_stats=False):
+        """
+        구독자를 추가하거나 해지한 구독자를 다시 활성화합니다. (하나의 쓰기 트랜잭션)
+
+        Args:
+            email (str): 이메일 주소
+            with_stats (bool): 같은 트랜잭션에서 읽은 쓰기 직후의 구독자 수(stats)도 반환
+
+        Returns:
+            tuple: (결과 CREATED/REACTIVATED/ALREADY_ACTIVE, 구독자) (with_stats면 (그 튜플, stats))
+        """
+        now = datetime.now().isoformat()
+        with self._connect(write=True) as conn:
+            subscriber = self._get(conn, email)
+            if subscriber and subscriber['active']:
+                result = ALREADY_ACTIVE, subscriber
+            else:
+                if subscriber:
+                    conn.execute(
+                        "UPDATE subscribers SET active = 1, subscribed_at = ?, unsubscribed_at = NULL WHERE email = ?",
+                        (now, email)
+                    )
+                    status = REACTIVATED
+                else:
+                    conn.execute("INSERT INTO subscribers (email, active, subscribed_at) VALUES (?, 1, ?)", (email, now))
+                    status = CREATED
+                result = status, self._get(conn, email)
+            return (result, self._stats(conn)) if with_stats else result
+
+    def unsubscribe(self, email, with_stats=False):
+        """
+        구독을 해지합니다. (하나의 쓰기 트랜잭션)
+
+        Args:
+            email (str): 이메일 주소
+            with_stats (bool): 같은 트랜잭션에서 읽은 쓰기 직후의 구독자 수(stats)도 반환
+
+        Returns:
+            str: 결과 (UNSUBSCRIBED/ALREADY_INACTIVE/NOT_FOUND) (with_stats면 (결과, stats))
+        """
+        with self._connect(write=True) as conn:
+            subscriber = self._get(conn, email)
+            if not subscriber:
+                status = NOT_FOUND
+            elif not subscriber['active']:
+                status = ALREADY_INACTIVE
+            else:
+                conn.execute(
+                    "UPDATE subscribers SET active = 0, unsubscribed_at = ? WHERE email = ?",
+                    (datetime.now().isoformat(), email)
+                )
+                status = UNSUBSCRIBED
+            return (status, self._stats(conn)) if with_stats else status
+
+    def import_subscribers(self, records, chunk_size=500):
+        """
+        구독자를 한 번에 추가/갱신합니다. (전체가 하나의 쓰기 트랜잭션, chunk_size개씩 조회/기록)
+        쓰기 잠금을 잡고 있는 동안 입력을 읽지 않도록 records는 이미 메모리에 있는 목록으로 넘깁니다.
+
+        Args:
+            records (list): {'email', 'active', 'subscribed_at', 'unsubscribed_at'} (중복 없는 이메일)
+                            active가 없으면 새 이메일만 활성으로 추가하고 기존 구독자(해지한 구독자 포함)는 그대로 둠
+            chunk_size (int): 한 번에 조회/기록할 구독자 수
+
+        Returns:
+            dict: {'created', 'updated', 'unchanged'} (updated는 active를 지정해 활성 상태가 바뀐 기존 구독자)
+        """
+        counts = {'created': 0, 'updated': 0, 'unchanged': 0}
+        now = datetime.now().isoformat()
+        with self._connect(write=True) as conn:
+            for chunk in _chunks(records, chunk_size):
+                emails = [record['email'] for record in chunk]
+                placeholders = ','.join('?' * len(emails))
+                existing = dict(conn.execute(f"SELECT email, active FROM subscribers WHERE email IN ({placeholders})", emails))
+
+                new_rows, changed_rows = [], []
+                for record in chunk:
+                    if record['email'] not in existing:
+                        counts['created'] += 1
+                        active = int(record.get('active', True))
+                        unsubscribed_at = None if active else (record.get('unsubscribed_at') or now)
+                        new_rows.append((record['email'], active, record.get('subscribed_at') or now, unsubscribed_at))
+                    elif 'active' not in record or existing[record['email']] == int(record['active']):
+                        counts['unchanged'] += 1
+                    else:
+                        counts['updated'] += 1
+                        active = int(record['active'])
+                        unsubscribed_at = None if active else (record.get('unsubscribed_at') or now)
+                        changed_rows.append((active, record.get('subscribed_at') or now, unsubscribed_at, record['email']))
+
+                conn.executemany(
+                    "INSERT INTO subscribers (email, active, subscribed_at, unsubscribed_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (email) DO NOTHING",
+                    new_rows
+                )
+                # 다시 활성화되면 가입 시각을 새로 기록하고, 해지되면 가입 시각은 유지
+                conn.executemany(
+                    """UPDATE subscribers SET
+                        active = ?1,
+                        subscribed_at = CASE WHEN ?1 THEN ?2 ELSE subscribed_at END,
+                        unsubscribed_at = ?3
+                    WHERE email = ?4""",
+                    changed_rows
+                )
+        return counts
+
+    def iter_subscribers(self, active_only=False, page_size=500):
+        """
+        구독자를 가입 순서대로 page_size개씩 읽어 하나씩 반환합니다. (전체를 메모리에 올리지 않음)
+
+        Args:
+            active_only (bool): 활성 구독자만 반환
+            page_size (int): 한 번에 읽을 구독자 수
+
+        Yields:
+            dict: 구독자
+        """
+        query = "SELECT rowid, email, active, subscribed_at, unsubscribed_at FROM subscribers WHERE rowid > ?"
+        if active_only:
+            query += " AND active = 1"
+        last_rowid = 0
+        while True:
+            # 페이지마다 연결을 닫아 내보내는 동안 다른 요청의 쓰기를 막지 않음
+            with self._connect() as conn:
+                rows = conn.execute(query + " ORDER BY rowid LIMIT ?", (last_rowid, page_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_subscriber(row[1:])
+            last_rowid = rows[-1][0]
+
+    def list(self, active_only=False):
+        """
+        구독자 목록을 가입 순서대로 반환합니다.
+
+        Args:
+            active_only (bool): 활성 구독자만 반환
+
+        Returns:
+            list: 구독자 목록
+        """
+        query = "SELECT email, active, subscribed_at, unsubscribed_at FROM subscribers"
+        if active_only:
+            query += " WHERE active = 1"
+        with self._connect() as conn:
+            return [_row_to_subscriber(row) for row in conn.execute(query + " ORDER BY rowid")]
+
+    def count(self, active_only=False):
+        """구독자 수 (active 색인으로 조회)"""
+        query = "SELECT COUNT(*) FROM subscribers" + (" WHERE active = 1" if active_only else "")
+        with self._connect() as conn:
+            return conn.execute(query).fetchone()[0]
+
+    def stats(self):
+        """
+        구독자 수와 변경 버전을 반환합니다. (트리거가 유지하는 한 행만 조회)
+
+        Returns:
+            dict: {'version', 'count' (활성 구독자 수), 'total_count'}
+        """
+        with self._connect() as conn:
+            return self._stats(conn)
+
+    @staticmethod
+    def _stats(conn):
+        version, active_count, total_count = conn.execute(
+            "SELECT version, active_count, total_count FROM stats WHERE id = 1"
+        ).fetchone()
+        return {'version': version, 'count': active_count, 'total_count': total_count}
+
+    def signature(self):
+        """
+        저장소 파일의 변경 표시 (DB와 WAL 파일의 수정 시각과 크기)
+        다른 프로세스가 저장소를 바꿨는지 DB를 열지 않고 확인할 때 사용합니다.
+
+        Returns:
+            tuple: 파일별 (수정 시각(ns), 크기) (파일이 없으면 None)
+        """
+        signature = []
+        for path in (self.db_file, f"{self.db_file}-wal"):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def get_meta(self, name, default=None):
+        """저장소 메타데이터 값을 가져옵니다."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else default
+
+
+# 경로별 구독자 저장소 (WAL 설정/스키마 확인/구독자 수 초기화/기존 구독자 가져오기를 요청마다 반복하지 않도록 한 번만 생성)
+_stores = {}
+_stores_lock = threading.Lock()
+
+def _store_files(subscribers_file):
+    """구독자 경로를 (데이터베이스 파일, 가져올 JSON 구독자 파일) 로 변환 (JSON 경로면 옆의 .db에 가져옴)"""
+    if subscribers_file is None:
+        return DB_FILE, LEGACY_FILE
+    if subscribers_file.endswith('.json'):
+        return f"{os.path.splitext(subscribers_file)[0]}.db", subscribers_file
+    return subscribers_file, None
+
+def get_subscriber_store(subscribers_file=None):
+    """
+    구독자 저장소를 엽니다. 같은 경로에는 같은 저장소를 반환합니다.
+
+    Args:
+        subscribers_file (str): 데이터베이스 파일 경로 (없으면 기본 경로)
+            JSON 구독자 파일(.json)이면 같은 이름의 .db 저장소를 쓰고, JSON 구독자는 처음 한 번만 가져옴 (JSON 파일은 그대로 둠)
+
+    Returns:
+        SubscriberStore: 구독자 저장소
+    """
+    db_file, legacy_file = _store_files(subscribers_file)
+    key = os.path.abspath(db_file)
+    with _stores_lock:
+        store = _stores.get(key)
+        # 데이터베이스 파일이 지워졌으면 스키마부터 다시 만듦
+        if store is None or not os.path.exists(db_file):
+            store = _stores[key] = SubscriberStore(db_file, legacy_file=legacy_file)
+        return store
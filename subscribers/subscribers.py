@@ -1,37 +1,47 @@
 import os
-import json
-from datetime import datetime
 import sys
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from utils.logger import get_logger
+from subscribers.subscriber_store import get_subscriber_store
 
 logger = get_logger("subscriber")
 
-# 구독자 파일 경로
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-SUBSCRIBERS_FILE = os.path.join(BASE_DIR, 'subscribers.json')
-
-def load_subscribers():
-    """구독자 목록을 로드합니다."""
+def load_subscribers(subscribers_file=None):
+    """
+    구독자 목록을 로드합니다.
+    
+    Args:
+        subscribers_file (str): 구독자 저장소 경로 (없으면 subscribers/subscribers.db)
+    
+    Returns:
+        list: 구독자 목록 (실패 시 빈 리스트)
+    """
     try:
-        if os.path.exists(SUBSCRIBERS_FILE):
-            with open(SUBSCRIBERS_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('subscribers', [])
-        return []
+        return get_subscriber_store(subscribers_file).list()
     except Exception as e:
         logger.error(f"구독자 로드 오류: {e}")
         return []
 
-def get_active_subscribers():
-    """활성 구독자 목록을 반환합니다."""
-    subscribers = load_subscribers()
-    return [sub for sub in subscribers if sub.get('active', True)]
+def get_active_subscribers(subscribers_file=None):
+    """
+    활성 구독자 목록을 반환합니다.
+    
+    Args:
+        subscribers_file (str): 구독자 저장소 경로 (없으면 subscribers/subscribers.db)
+    
+    Returns:
+        list: 활성 구독자 목록 (실패 시 빈 리스트)
+    """
+    try:
+        return get_subscriber_store(subscribers_file).list(active_only=True)
+    except Exception as e:
+        logger.error(f"구독자 로드 오류: {e}")
+        return []
 
 
 
 
 if __name__ == '__main__':
-    print(get_active_subscribers())
\ No newline at end of file
+    print(get_active_subscribers())
@@ -0,0 +1,349 @@
+# 구독 API 공통 처리
+# Flask 서버(server.py)와 ASGI 서버(asgi_server.py)가 같은 저장소, 구독자 수 캐시, 응답 형식, CORS 설정을 사용하도록
+# 요청 처리 결과를 (응답 JSON, 상태 코드)로 반환
+
+from datetime import datetime
+import threading
+import hmac
+import time
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from notifier.mail_queue import get_mail_queue, MailQueueFull
+from subscribers import bulk
+from subscribers.subscriber_store import (
+    get_subscriber_store, is_valid_email, REACTIVATED, ALREADY_ACTIVE, ALREADY_INACTIVE, NOT_FOUND
+)
+
+# 환경별 CORS 설정
+ENVIRONMENT = os.getenv('FLASK_ENV', 'development')
+IS_PRODUCTION = ENVIRONMENT == 'production'
+
+# 구독자 저장소 (이메일 색인, 여러 워커 프로세스가 함께 사용)
+subscriber_store = get_subscriber_store()
+
+# 구독자 수 캐시 (랜딩 페이지가 자주 조회하므로 메모리에서 응답)
+# 이 프로세스의 가입/해지는 쓰기 직후의 구독자 수로 바로 반영하고, 다른 프로세스의 변경은 저장소 파일 변경 표시로 감지하며,
+# 파일 표시로 잡히지 않는 변경도 최대 SUBSCRIBER_COUNT_MAX_AGE초 안에 다시 확인
+SUBSCRIBER_COUNT_MAX_AGE = int(os.getenv('SUBSCRIBER_COUNT_MAX_AGE', '10'))
+_count_cache = {'stats': None, 'signature': None, 'checked_at': 0.0}
+_count_lock = threading.Lock()
+
+# 일괄 가져오기/내보내기 API 인증 토큰 (Authorization: Bearer <토큰>, 설정하지 않으면 관리자 API 비활성화)
+ADMIN_API_TOKEN = os.getenv('ADMIN_API_TOKEN', '')
+BATCH_SUBSCRIBE_MAX = int(os.getenv('BATCH_SUBSCRIBE_MAX', '1000'))  # 일괄 구독 요청당 최대 이메일 수
+
+def get_cors_settings():
+    """
+    환경별 CORS 설정을 반환합니다. (flask_cors.CORS 인자와 같은 형식)
+
+    Returns:
+        dict: {'origins', 'methods', 'allow_headers'} (프로덕션은 'supports_credentials', 'max_age' 포함)
+    """
+    settings = {
+        'origins': "*",
+        'methods': ['GET', 'POST', 'OPTIONS'],
+        'allow_headers': ['Content-Type', 'Authorization'],
+    }
+    if IS_PRODUCTION:
+        # 프로덕션: 특정 도메인만 허용
+        allowed_origins = os.getenv('ALLOWED_ORIGINS', '').split(',')
+        if not allowed_origins or allowed_origins == ['']:
+            # gachonnotifier.site 도메인 설정
+            allowed_origins = ['https://gachonnotifier.site', 'https://www.gachonnotifier.site']
+        settings.update(origins=allowed_origins, supports_credentials=True, max_age=3600)  # 1시간 캐시
+    return settings
+
+def get_subscriber_counts():
+    """
+    구독자 수를 반환합니다. 저장소가 바뀌지 않았으면 DB를 열지 않습니다.
+
+    Returns:
+        dict: {'version', 'count', 'total_count'}
+    """
+    with _count_lock:
+        signature = subscriber_store.signature()
+        fresh = time.monotonic() - _count_cache['checked_at'] < SUBSCRIBER_COUNT_MAX_AGE
+        if _count_cache['stats'] is None or signature != _count_cache['signature'] or not fresh:
+            _count_cache['stats'] = subscriber_store.stats()
+            _count_cache['signature'] = signature
+            _count_cache['checked_at'] = time.monotonic()
+        return dict(_count_cache['stats'])
+
+def change_subscription(change, email):
+    """
+    가입/해지를 처리하고 같은 트랜잭션에서 읽은 구독자 수를 캐시에 바로 반영합니다.
+    저장소 쓰기(쓰기 잠금 대기 포함)는 캐시 잠금 밖에서 하므로 구독자 수 조회와 다른 가입이 기다리지 않고,
+    캐시보다 새로운 버전일 때만 반영해 순서가 뒤바뀐 결과가 최신 값을 덮어쓰지 않습니다.
+
+    Args:
+        change (callable): subscriber_store.subscribe 또는 subscriber_store.unsubscribe
+        email (str): 이메일 주소
+
+    Returns:
+        change의 반환값
+    """
+    result, stats = change(email, with_stats=True)
+    with _count_lock:
+        cached = _count_cache['stats']
+        if cached is None or stats['version'] > cached['version']:
+            _count_cache['stats'] = stats
+            # 방금 쓴 변경으로 바뀐 파일 표시를 기준으로 삼아 다시 읽지 않음
+            _count_cache['signature'] = subscriber_store.signature()
+    return result
+
+def send_welcome_email_async(email):
+    """
+    환영 이메일을 메일 작업 큐에 등록 (작업 스레드가 공유 SMTP 연결로 전송, 재시작해도 스풀에서 이어서 전송)
+
+    Returns:
+        bool: 등록 성공 여부 (큐가 가득 차면 False, 구독 처리에는 영향 없음)
+    """
+    try:
+        get_mail_queue().enqueue('welcome', {'email': email})
+        return True
+    except MailQueueFull as e:
+        print(f"⚠️ 메일 큐가 가득 차 환영 이메일을 건너뜁니다 ({email}): {e}")
+    except Exception as e:
+        print(f"❌ 환영 이메일 등록 실패 ({email}): {e}")
+    return False
+
+def error_response(e):
+    """처리 중 예외를 500 응답으로 변환"""
+    return {
+        'success': False,
+        'error': str(e)
+    }, 500
+
+def health_status(service='GN API Server'):
+    """
+    서버 상태를 반환합니다. 메일 큐 상태를 읽지 못해도 API는 응답하므로 200으로 반환하고 status를 'degraded'로 표시합니다.
+
+    Returns:
+        tuple: (응답 JSON, 상태 코드)
+    """
+    status = 'healthy'
+    try:
+        mail_queue = get_mail_queue().stats()
+    except Exception as e:
+        print(f"⚠️ 메일 큐 상태 조회 실패: {e}")
+        status = 'degraded'
+        mail_queue = {'error': str(e)}
+    return {
+        'status': status,
+        'timestamp': datetime.now().isoformat(),
+        'service': service,
+        'environment': ENVIRONMENT,
+        'cors_mode': 'production' if IS_PRODUCTION else 'development',
+        'mail_queue': mail_queue
+    }, 200
+
+def subscriber_count():
+    """
+    구독자 수를 반환합니다.
+
+    Returns:
+        tuple: (응답 JSON, 상태 코드, ETag) (오류 시 ETag는 None)
+    """
+    try:
+        counts = get_subscriber_counts()
+        return {
+            'success': True,
+            'count': counts['count'],
+            'total_count': counts['total_count']
+        }, 200, f"{counts['count']}-{counts['total_count']}"
+    except Exception as e:
+        return (*error_response(e), None)
+
+def subscribe(data):
+    """
+    구독자를 추가하거나 해지한 구독자를 다시 활성화합니다.
+
+    Args:
+        data (dict): 요청 JSON ({'email'})
+
+    Returns:
+        tuple: (응답 JSON, 상태 코드)
+    """
+    try:
+        email = data.get('email', '').strip()
+
+        if not email:
+            return {
+                'success': False,
+                'error': '이메일 주소가 필요합니다.'
+            }, 400
+
+        # 이메일 형식 검증 (간단한 검증)
+        if not is_valid_email(email):
+            return {
+                'success': False,
+                'error': '올바른 이메일 형식이 아닙니다.'
+            }, 400
+
+        # 조회와 추가/재활성화를 하나의 쓰기 트랜잭션으로 처리 (동시 가입 시 변경 유실 방지)
+        status, subscriber = change_subscription(subscriber_store.subscribe, email)
+
+        if status == ALREADY_ACTIVE:
+            return {
+                'success': False,
+                'error': '이미 등록된 이메일 주소입니다.'
+            }, 409
+
+        # 백그라운드에서 환영 이메일 전송
+        send_welcome_email_async(email)
+        return {
+            'success': True,
+            'message': '구독이 재활성화되었습니다.' if status == REACTIVATED else '구독이 완료되었습니다.',
+            'subscriber': subscriber
+        }, 200
+
+    except Exception as e:
+        return error_response(e)
+
+def unsubscribe(data):
+    """
+    구독을 해지합니다.
+
+    Args:
+        data (dict): 요청 JSON ({'email'})
+
+    Returns:
+        tuple: (응답 JSON, 상태 코드)
+    """
+    try:
+        email = data.get('email', '').strip()
+
+        if not email:
+            return {
+                'success': False,
+                'error': '이메일 주소가 필요합니다.'
+            }, 400
+
+        status = change_subscription(subscriber_store.unsubscribe, email)
+
+        if status == ALREADY_INACTIVE:
+            return {
+                'success': False,
+                'error': '이미 구독이 해제된 이메일 주소입니다.'
+            }, 409
+
+        if status == NOT_FOUND:
+            return {
+                'success': False,
+                'error': '등록되지 않은 이메일 주소입니다.'
+            }, 404
+
+        return {
+            'success': True,
+            'message': '구독이 해제되었습니다.'
+        }, 200
+
+    except Exception as e:
+        return error_response(e)
+
+def check_admin_token(authorization):
+    """
+    관리자 API 요청의 인증 토큰을 확인합니다.
+
+    Args:
+        authorization (str): Authorization 헤더 값
+
+    Returns:
+        tuple: 거부할 때 (응답 JSON, 상태 코드), 허용하면 None
+    """
+    if not ADMIN_API_TOKEN:
+        return {
+            'success': False,
+            'error': '관리자 API가 설정되지 않았습니다.'
+        }, 403
+    scheme, _, token = (authorization or '').partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(token.strip().encode(), ADMIN_API_TOKEN.encode()):
+        return {
+            'success': False,
+            'error': '인증이 필요합니다.'
+        }, 401
+    return None
+
+def _invalidate_count_cache():
+    """일괄 변경 후 다음 구독자 수 조회 때 저장소에서 다시 읽도록 함"""
+    with _count_lock:
+        _count_cache['stats'] = None
+
+def bulk_import(lines, fmt):
+    """
+    CSV/NDJSON 입력으로 구독자를 일괄 추가/갱신합니다. (환영 이메일은 보내지 않음)
+
+    Args:
+        lines (iterable): 입력 줄 (요청 본문을 한 줄씩)
+        fmt (str): 'csv' 또는 'ndjson'
+
+    Returns:
+        tuple: (응답 JSON, 상태 코드)
+    """
+    if fmt not in bulk.PARSERS:
+        return {
+            'success': False,
+            'error': '가져오기 형식이 필요합니다. (format=csv 또는 ndjson)'
+        }, 400
+    try:
+        report = bulk.import_subscribers(lines, fmt, subscriber_store)
+    except UnicodeDecodeError:
+        return {
+            'success': False,
+            'error': '요청 본문은 UTF-8이어야 합니다.'
+        }, 400
+    except Exception as e:
+        return error_response(e)
+    _invalidate_count_cache()
+    return {'success': True, **report}, 200
+
+def batch_subscribe(data):
+    """
+    이메일 목록을 한 번에 구독 처리합니다. (환영 이메일은 보내지 않음)
+
+    Args:
+        data (dict): 요청 JSON ({'emails': [...]})
+
+    Returns:
+        tuple: (응답 JSON, 상태 코드)
+    """
+    emails = (data or {}).get('emails')
+    if not isinstance(emails, list) or not emails:
+        return {
+            'success': False,
+            'error': '이메일 주소 목록이 필요합니다.'
+        }, 400
+    if len(emails) > BATCH_SUBSCRIBE_MAX:
+        return {
+            'success': False,
+            'error': f'한 번에 최대 {BATCH_SUBSCRIBE_MAX}개까지 등록할 수 있습니다.'
+        }, 413
+    try:
+        report = bulk.subscribe_emails(emails, subscriber_store)
+    except Exception as e:
+        return error_response(e)
+    _invalidate_count_cache()
+    return {'success': True, **report}, 200
+
+def bulk_export(fmt, active_only=False):
+    """
+    구독자 내보내기를 준비합니다.
+
+    Args:
+        fmt (str): 'csv' 또는 'ndjson'
+        active_only (bool | str): 활성 구독자만 내보내기 (쿼리 문자열 '1', 'true', 'yes'도 허용)
+
+    Returns:
+        tuple: (오류 응답 JSON, 상태 코드, 내보낼 내용 iterator) (성공하면 응답 JSON은 None)
+    """
+    if isinstance(active_only, str):
+        active_only = active_only.strip().lower() in ('1', 'true', 'yes')
+    if fmt not in bulk.FORMATS:
+        return {
+            'success': False,
+            'error': '지원하지 않는 형식입니다. (format=csv 또는 ndjson)'
+        }, 400, None
+    return None, 200, bulk.export_subscribers(fmt, active_only, subscriber_store)
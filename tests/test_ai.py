@@ -0,0 +1,581 @@
+# AI 요약 모듈 테스트
+
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
+import httpx
+import time
+import openai
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # OpenAI 클라이언트 생성용
+
+from AI.summary_cache import SummaryCache, make_cache_key
+from AI import AI_summarizer
+from AI import async_summarizer
+from AI.local_summarizer import extract_key_info, summarize_notice_local
+from AI.text_preprocessor import count_tokens, strip_boilerplate, compress_extractive, prepare_content
+
+def make_chunk(text):
+    """스트리밍 응답 청크 모킹"""
+    chunk = MagicMock(usage=None)
+    chunk.choices[0].delta.content = text
+    return chunk
+
+def make_response(text):
+    """OpenAI 응답 모킹 (일반 응답과 스트리밍 응답 모두 지원)"""
+    response = MagicMock()
+    response.choices[0].message.content = text
+    response.__iter__.return_value = [make_chunk(text)]
+    response.__aiter__.return_value = [make_chunk(text)]
+    return response
+
+class SlowStream:
+    """청크마다 지연이 있는 비동기 스트리밍 응답"""
+
+    def __init__(self, parts, delay):
+        self.parts = parts
+        self.delay = delay
+        self.close = AsyncMock()
+
+    async def __aiter__(self):
+        for part in self.parts:
+            await asyncio.sleep(self.delay)
+            yield make_chunk(part)
+
+def make_async_client(*responses):
+    """AsyncOpenAI 클라이언트 모킹 (응답 또는 예외를 순서대로 반환)"""
+    for response in responses:
+        if isinstance(response, MagicMock):
+            response.close = AsyncMock()
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=list(responses))
+    return mock_client
+
+def make_status_error(error_class, status_code, headers=None):
+    """OpenAI 상태 코드 오류 생성"""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return error_class("오류", response=response, body=None)
+
+class TestSummaryCache(unittest.TestCase):
+    """요약 캐시 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_summary_cache.json"
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+    
+    def test_key_ignores_whitespace(self):
+        """공백 차이는 같은 키로 취급하는지 테스트"""
+        first = make_cache_key("제목", "내용  입니다\n\n", "gpt", 250, 1)
+        second = make_cache_key("제목", "내용 입니다", "gpt", 250, 1)
+        other_version = make_cache_key("제목", "내용 입니다", "gpt", 250, 2)
+        
+        # 검증
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, other_version)
+    
+    
+    def test_persisted_across_instances(self):
+        """flush한 캐시가 파일에 저장되어 다시 불러와지는지 테스트"""
+        cache = SummaryCache(self.test_file)
+        cache.set("key", "요약")
+        before_flush = SummaryCache(self.test_file)
+        
+        flushed = cache.flush()
+        reloaded = SummaryCache(self.test_file)
+        
+        # 검증 (set만으로는 파일에 쓰지 않고, 바뀐 것이 없으면 다시 쓰지 않음)
+        self.assertIsNone(before_flush.get("key"))
+        self.assertTrue(flushed)
+        self.assertFalse(cache.flush())
+        self.assertEqual(reloaded.get("key"), "요약")
+        self.assertEqual(reloaded.stats()['hits'], 1)
+    
+    def test_lru_eviction(self):
+        """크기 한도를 넘으면 가장 오래 사용하지 않은 항목부터 삭제하는지 테스트"""
+        cache = SummaryCache(self.test_file, max_bytes=25)
+        cache.set("a", "1" * 9)
+        cache.set("b", "2" * 9)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", "3" * 9)
+        
+        # 검증
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "1" * 9)
+        self.assertEqual(cache.get("c"), "3" * 9)
+
+class TestSummarizeNotice(unittest.TestCase):
+    """공지사항 요약 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_summary_cache.json"
+        self.cache = SummaryCache(self.test_file)
+        patcher = patch('AI.AI_summarizer.get_summary_cache', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+    
+    @patch('AI.AI_summarizer.client')
+    def test_cached_summary_skips_api(self, mock_client):
+        """같은 공지사항을 다시 요약하면 API를 호출하지 않는지 테스트"""
+        mock_client.chat.completions.create.return_value = make_response("테스트 요약")
+        
+        first = AI_summarizer.summarize_notice("제목", "내용")
+        second = AI_summarizer.summarize_notice("제목", "내용")
+        
+        # 검증
+        self.assertEqual(first, "테스트 요약")
+        self.assertEqual(second, "테스트 요약")
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(self.cache.stats()['hits'], 1)
+    
+    @patch('AI.AI_summarizer.client')
+    def test_failure_not_cached(self, mock_client):
+        """요약 실패 결과는 캐시에 저장하지 않는지 테스트"""
+        mock_client.chat.completions.create.side_effect = Exception("API 오류")
+        
+        AI_summarizer.summarize_notice("제목", "내용")
+        
+        # 검증
+        self.assertEqual(self.cache.stats()['entries'], 0)
+    
+    @patch('AI.AI_summarizer.client')
+    def test_fallback_uses_body(self, mock_client):
+        """API 오류로 로컬 요약을 사용할 때 머리 줄이 없는 본문을 요약하는지 테스트"""
+        mock_client.chat.completions.create.side_effect = Exception("API 오류")
+        content = "제목: 공지\n작성자: 학사팀\n내용:\n수강 신청은 3월 15일까지입니다.\n\n첨부파일: 0개"
+        
+        summary = AI_summarizer.summarize_notice("공지", content, body="수강 신청은 3월 15일까지입니다.")
+        
+        # 검증
+        self.assertNotIn('작성자:', summary)
+        self.assertNotIn('첨부파일:', summary)
+        self.assertIn('3월 15일', summary)
+
+class TestSummarizeNotices(unittest.TestCase):
+    """묶음 요약 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_summary_cache.json"
+        self.cache = SummaryCache(self.test_file)
+        patcher = patch('AI.async_summarizer.get_summary_cache', return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.notices = [{'title': f'공지 {i}', 'content': f'내용 {i}'} for i in range(4)]
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+    
+    def test_long_content_compressed(self):
+        """긴 본문은 줄여서 요청하는지 테스트"""
+        mock_client = make_async_client(make_response("요약"))
+        long_content = "\n".join(f"배경 설명 문장 {i}번입니다." for i in range(2000))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            AI_summarizer.summarize_notices([{'title': '긴 공지', 'content': long_content}])
+        
+        # 검증
+        prompt = mock_client.chat.completions.create.call_args.kwargs['messages'][1]['content']
+        self.assertLess(len(prompt), len(long_content))
+    
+    def test_batched_request(self):
+        """여러 공지사항을 한 번의 요청으로 요약하는지 테스트"""
+        mock_client = make_async_client(make_response(
+            '{"summaries": [{"id": 2, "summary": "요약 2"}, {"id": 1, "summary": "요약 1"}, '
+            '{"id": 3, "summary": "요약 3"}, {"id": 4, "summary": "요약 4"}]}'
+        ))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices(self.notices, batch_size=4)
+        
+        # 검증
+        self.assertEqual(result, ["요약 1", "요약 2", "요약 3", "요약 4"])
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(self.cache.stats()['entries'], 4)
+    
+    def test_miss_counted_once(self):
+        """캐시에 없는 공지사항을 개별 요약해도 캐시 실패를 한 번만 세는지 테스트"""
+        mock_client = make_async_client(make_response("요약"))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            AI_summarizer.summarize_notices(self.notices[:1])
+        
+        # 검증
+        self.assertEqual((self.cache.stats()['hits'], self.cache.stats()['misses']), (0, 1))
+    
+    def test_cache_saved_once_per_batch(self):
+        """묶음 요약의 새 요약을 항목마다가 아니라 묶음이 끝난 뒤 한 번에 저장하는지 테스트"""
+        mock_client = make_async_client(make_response(
+            '{"summaries": [{"id": 1, "summary": "요약 1"}, {"id": 2, "summary": "요약 2"}, '
+            '{"id": 3, "summary": "요약 3"}, {"id": 4, "summary": "요약 4"}]}'
+        ))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client), \
+                patch.object(self.cache, '_save', wraps=self.cache._save) as mock_save:
+            AI_summarizer.summarize_notices(self.notices, batch_size=4)
+        
+        # 검증
+        mock_save.assert_called_once()
+        self.assertEqual(SummaryCache(self.test_file).stats()['entries'], 4)
+    
+    def test_reposted_notice_uses_cache(self):
+        """같은 내용으로 다시 올라온 공지사항(새 artclId)은 캐시된 요약을 사용하는지 테스트"""
+        mock_client = make_async_client(make_response("요약"))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            first = AI_summarizer.summarize_notices([{'id': 111860, 'title': '공지', 'content': '내용'}])
+            reposted = AI_summarizer.summarize_notices([{'id': 112000, 'title': '공지', 'content': '내용'}])
+        
+        # 검증
+        self.assertEqual(first, reposted)
+        mock_client.chat.completions.create.assert_called_once()
+    
+    def test_fallback_on_unparsable_response(self):
+        """묶음 응답을 해석할 수 없으면 개별 요약으로 대체하는지 테스트"""
+        mock_client = make_async_client(
+            make_response("JSON이 아닌 응답"),
+            make_response("개별 요약"), make_response("개별 요약")
+        )
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices(self.notices[:2], batch_size=2)
+        
+        # 검증
+        self.assertEqual(result, ["개별 요약", "개별 요약"])
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+    
+    def test_token_budget_splits_batches(self):
+        """토큰 예산을 넘으면 요청을 나누는지 테스트"""
+        mock_client = make_async_client(*[make_response("요약") for _ in range(4)])
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            AI_summarizer.summarize_notices(self.notices, batch_size=4, token_budget=1)
+        
+        # 검증 (공지사항마다 개별 요청)
+        self.assertEqual(mock_client.chat.completions.create.call_count, 4)
+
+class TestAsyncRetry(unittest.TestCase):
+    """비동기 요청 재시도 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_summary_cache.json"
+        patcher = patch('AI.async_summarizer.get_summary_cache', return_value=SummaryCache(self.test_file))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        async_summarizer.metrics.reset()
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+    
+    @patch('AI.async_summarizer._retry_delay', return_value=0)
+    def test_retry_on_rate_limit(self, mock_delay):
+        """429 응답은 재시도해서 요약을 잃지 않는지 테스트"""
+        mock_client = make_async_client(
+            make_status_error(openai.RateLimitError, 429, {'retry-after': '1'}),
+            make_response("재시도 후 요약")
+        )
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices([{'title': '공지', 'content': '내용'}])
+        
+        # 검증
+        self.assertEqual(result, ["재시도 후 요약"])
+        self.assertEqual(async_summarizer.metrics.snapshot()['retries'], 1)
+        self.assertEqual(async_summarizer.metrics.snapshot()['requests'], 1)
+    
+    def test_no_retry_on_client_error(self):
+        """400 응답은 재시도하지 않고 로컬 요약으로 대체하는지 테스트"""
+        mock_client = make_async_client(make_status_error(openai.BadRequestError, 400))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices([{'title': '공지', 'content': '내용'}])
+        
+        # 검증
+        self.assertEqual(result, [summarize_notice_local('공지', '내용')])
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(async_summarizer.metrics.snapshot()['failures'], 1)
+    
+    def test_retry_delay_uses_retry_after(self):
+        """retry-after 헤더가 있으면 그 시간을 따르는지 테스트"""
+        error = make_status_error(openai.RateLimitError, 429, {'retry-after': '3'})
+        
+        delay = async_summarizer._retry_delay(error, 1)
+        
+        # 검증
+        self.assertGreaterEqual(delay, 3)
+        self.assertLess(delay, 3.6)
+    
+    def test_retry_delay_exponential_backoff(self):
+        """retry-after가 없으면 시도 횟수에 따라 대기 시간이 늘어나는지 테스트"""
+        error = make_status_error(openai.InternalServerError, 500)
+        
+        first = async_summarizer._retry_delay(error, 1)
+        third = async_summarizer._retry_delay(error, 3)
+        
+        # 검증
+        self.assertLessEqual(first, 1.0)
+        self.assertGreaterEqual(third, 2.0)
+
+class TestStreamingDeadline(unittest.TestCase):
+    """스트리밍 요약과 마감 시간 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_summary_cache.json"
+        self.cache = SummaryCache(self.test_file)
+        for target in ('AI.async_summarizer.get_summary_cache', 'AI.AI_summarizer.get_summary_cache'):
+            patcher = patch(target, return_value=self.cache)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        async_summarizer.metrics.reset()
+        self.notice = {'title': '공지', 'content': '수강 신청 기간은 3월 15일까지입니다.'}
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+    
+    def test_stream_records_ttft(self):
+        """스트리밍 응답의 첫 토큰 시간을 기록하는지 테스트"""
+        mock_client = make_async_client(SlowStream(["요약 ", "완료"], 0.01))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices([self.notice])
+        
+        # 검증
+        snapshot = async_summarizer.metrics.snapshot()
+        self.assertEqual(result, ["요약 완료"])
+        self.assertGreater(snapshot['max_ttft'], 0)
+        self.assertEqual(snapshot['deadline_misses'], 0)
+        self.assertEqual(self.cache.stats()['entries'], 1)
+    
+    def test_deadline_keeps_partial_summary(self):
+        """마감 시간이 지나면 받은 부분까지 사용하는지 테스트"""
+        first = "가" * 50 + "."
+        stream = SlowStream([first, "나" * 50], 0.1)
+        mock_client = make_async_client(stream)
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices([self.notice], deadline=0.15)
+        
+        # 검증 (부분 요약은 캐시하지 않음)
+        self.assertEqual(result, [first + " …"])
+        self.assertEqual(async_summarizer.metrics.snapshot()['deadline_misses'], 1)
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        stream.close.assert_awaited_once()
+    
+    def test_deadline_without_tokens_uses_local(self):
+        """마감 시간까지 받은 내용이 없으면 로컬 요약을 사용하는지 테스트"""
+        mock_client = make_async_client(SlowStream(["늦은 요약"], 1))
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices([self.notice], deadline=0.05)
+        
+        # 검증
+        self.assertEqual(result, [summarize_notice_local(self.notice['title'], self.notice['content'])])
+    
+    def test_batch_deadline_uses_local(self):
+        """묶음 요청이 마감 시간을 넘기면 로컬 요약으로 대체하는지 테스트"""
+        async def slow_create(**kwargs):
+            await asyncio.sleep(1)
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=slow_create)
+        notices = [self.notice, {'title': '공지 2', 'content': '장소는 대학 본관입니다.'}]
+        
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices(notices, batch_size=2, deadline=0.05)
+        
+        # 검증
+        self.assertEqual(result, [summarize_notice_local(notice['title'], notice['content']) for notice in notices])
+        self.assertEqual(async_summarizer.metrics.snapshot()['deadline_misses'], 1)
+    
+    @patch('AI.AI_summarizer.client')
+    def test_sync_deadline_keeps_partial_summary(self, mock_client):
+        """동기 요약도 마감 시간이 지나면 스트림을 닫고 받은 부분까지 사용하는지 테스트"""
+        first = "다" * 50 + "."
+        def slow_chunks():
+            yield make_chunk(first)
+            time.sleep(0.1)
+            yield make_chunk("라" * 50)
+            yield make_chunk("마" * 50)
+        stream = MagicMock()
+        stream.__iter__.side_effect = lambda: slow_chunks()
+        mock_client.chat.completions.create.return_value = stream
+        
+        result = AI_summarizer.summarize_notice("제목", "내용", deadline=0.05)
+        
+        # 검증
+        self.assertEqual(result, first + " …")
+        stream.close.assert_called_once()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+
+    def test_sync_client_not_retried(self):
+        """동기 클라이언트가 SDK 자동 재시도를 하지 않아 마감 시간이 늘어나지 않는지 테스트"""
+        # 검증
+        self.assertEqual(AI_summarizer.client.max_retries, 0)
+    
+    @patch('AI.AI_summarizer.client')
+    def test_sync_stream_error_keeps_partial_summary(self, mock_client):
+        """동기 스트리밍 도중 연결이 끊기면 받은 부분까지 사용하는지 테스트"""
+        first = "바" * 50 + "."
+        def broken_chunks():
+            yield make_chunk(first)
+            raise httpx.RemoteProtocolError("peer closed connection")
+        stream = MagicMock()
+        stream.__iter__.side_effect = lambda: broken_chunks()
+        mock_client.chat.completions.create.return_value = stream
+
+        result = AI_summarizer.summarize_notice("제목", "내용")
+
+        # 검증 (부분 요약은 캐시하지 않고, 마감 시간 초과로 세지 않음)
+        self.assertEqual(result, first + " …")
+        stream.close.assert_called_once()
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        self.assertEqual(async_summarizer.metrics.snapshot()['deadline_misses'], 0)
+
+    def test_async_stream_error_keeps_partial_summary(self):
+        """비동기 스트리밍 도중 읽기 오류가 나면 받은 부분까지 사용하는지 테스트"""
+        first = "사" * 50 + "."
+        class BrokenStream(SlowStream):
+            async def __aiter__(self):
+                yield make_chunk(first)
+                raise httpx.ReadError("connection reset")
+        stream = BrokenStream([], 0)
+        mock_client = make_async_client(stream)
+
+        with patch('AI.async_summarizer.get_async_client', return_value=mock_client):
+            result = AI_summarizer.summarize_notices([self.notice])
+
+        # 검증
+        self.assertEqual(result, [first + " …"])
+        self.assertEqual(self.cache.stats()['entries'], 0)
+        stream.close.assert_awaited_once()
+
+class TestLocalSummarizer(unittest.TestCase):
+    """로컬 요약 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.content = "\n".join([
+            "2024학년도 1학기 국가장학금 2차 신청 안내",
+            "□ 신청대상 : 2024학년도 1학기 재학생 및 복학생",
+            "□ 신청기간 : 2024. 3. 4.(월) 09:00 ~ 2024. 3. 15.(금) 18:00",
+            "□ 신청방법 : 한국장학재단 홈페이지에서 온라인 신청",
+            "□ 문의 : 학생지원팀 031-750-5555",
+            "목록",
+        ])
+    
+    def test_extract_labeled_fields(self):
+        """항목 형태의 기간, 대상, 문의처를 추출하는지 테스트"""
+        info = extract_key_info(self.content)
+        
+        # 검증
+        self.assertEqual(info['대상'], "2024학년도 1학기 재학생 및 복학생")
+        self.assertEqual(info['기간'], "2024. 3. 4.(월) 09:00 ~ 2024. 3. 15.(금) 18:00")
+        self.assertEqual(info['문의'], "학생지원팀 031-750-5555")
+        self.assertNotIn('장소', info)
+    
+    def test_extract_from_sentence(self):
+        """문장 속의 기간과 대상을 추출하는지 테스트"""
+        info = extract_key_info("재학생을 대상으로 3월 4일부터 3월 8일까지 특강을 진행합니다.")
+        
+        # 검증
+        self.assertEqual(info['기간'], "3월 4일부터 3월 8일까지")
+        self.assertEqual(info['대상'], "재학생")
+    
+    def test_summary_within_length(self):
+        """요약이 최대 길이를 넘지 않고 핵심 정보를 담는지 테스트"""
+        summary = summarize_notice_local("국가장학금 신청 안내", self.content, max_length=120)
+        
+        # 검증
+        self.assertLessEqual(len(summary), 120)
+        self.assertIn("재학생 및 복학생", summary)
+        self.assertNotIn("목록", summary)
+    
+    @patch('AI.AI_summarizer.client')
+    def test_local_backend_skips_api(self, mock_client):
+        """로컬 요약 방식을 선택하면 API를 호출하지 않는지 테스트"""
+        notices = [{'title': '장학금', 'content': self.content}]
+        
+        with patch('AI.async_summarizer.get_async_client') as mock_get_client:
+            result = AI_summarizer.summarize_notices(notices, backend="local")
+            single = AI_summarizer.summarize_notice('장학금', self.content, backend="local")
+        
+        # 검증
+        self.assertEqual(result, [single])
+        mock_get_client.assert_not_called()
+        mock_client.chat.completions.create.assert_not_called()
+    
+    def test_unknown_backend(self):
+        """알 수 없는 요약 방식은 오류를 내는지 테스트"""
+        with self.assertRaises(ValueError):
+            AI_summarizer.summarize_notices([], backend="unknown")
+
+class TestTextPreprocessor(unittest.TestCase):
+    """요약 전 본문 전처리 테스트"""
+
+    def test_strip_boilerplate(self):
+        """상투 문구와 중복 줄을 제거하는지 테스트"""
+        text = "장학금 신청 안내\n\n장학금 신청 안내\n목록\n이전글 다른 공지\nCopyright 가천대학교"
+        self.assertEqual(strip_boilerplate(text), "장학금 신청 안내")
+
+    def test_boilerplate_phrase_inside_body_kept(self):
+        """한 줄로 이어진 본문 중간에 상투 문구가 있어도 본문을 지우지 않는지 테스트"""
+        body = ("2025학년도 1학기 장학금 신청을 받습니다. 신청 기간은 3월 4일부터 3월 15일까지입니다. "
+                "첨부한 서식은 무단 복제 및 배포를 금합니다. 문의는 학생지원팀으로 해주시기 바랍니다.")
+        starts_with_menu = "목록에 있는 학과 학생은 " + body
+
+        # 검증
+        self.assertEqual(strip_boilerplate(body), body)
+        self.assertEqual(strip_boilerplate(starts_with_menu), starts_with_menu)
+        self.assertIn("3월 15일", prepare_content(f"제목: 장학금\n내용:\n{body}\n첨부파일: 0개"))
+
+    def test_short_content_unchanged(self):
+        """짧은 본문은 그대로 두는지 테스트"""
+        self.assertEqual(prepare_content("짧은 공지입니다.", max_tokens=100), "짧은 공지입니다.")
+
+    def test_compress_keeps_key_sentences(self):
+        """날짜·신청 관련 문장을 남기고 토큰 한도를 지키는지 테스트"""
+        filler = [f"이 문장은 배경 설명 {i}번으로 학생들에게 꼭 필요한 정보는 아닙니다." for i in range(30)]
+        key = "신청 기간은 2024. 3. 4.(월)부터 3월 15일까지이며 온라인으로 접수합니다."
+        text = "\n".join(filler[:15] + [key] + filler[15:])
+
+        result = prepare_content(text, max_tokens=120)
+
+        self.assertIn(key, result)
+        self.assertLessEqual(count_tokens(result), 120)
+        self.assertLess(len(result), len(text))
+
+    def test_compress_keeps_original_order(self):
+        """추출한 문장이 원래 순서를 유지하는지 테스트"""
+        text = "1차 모집은 3월 2일 마감합니다.\n참고 사항입니다.\n2차 모집은 4월 2일 마감합니다."
+        result = compress_extractive(text, max_tokens=30)
+        self.assertLess(result.index("1차"), result.index("2차"))
+
+    def test_single_long_sentence_truncated(self):
+        """한 문장이 한도를 넘으면 잘라내는지 테스트"""
+        result = prepare_content("가" * 1000, max_tokens=50)
+        self.assertLessEqual(count_tokens(result), 50)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,27 +1,45 @@
 # 크롤러 모듈 테스트
 
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, ANY
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import sys
 import os
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from crawler.notice_list_crawler import fetch_notice_list
+from crawler.notice_list_crawler import fetch_notice_list, fetch_notice_list_since, fetch_notice_page, parse_notice_list
 from crawler.notice_crawler import fetch_notice_content
+from crawler.browser_pool import BrowserPool, close_browser_pool, run_in_browser
+
+def make_list_html(artcl_ids):
+    """게시글 ID 목록으로 게시판 목록 HTML 생성"""
+    rows = "".join(
+        f"""<tr class="thumb"><td>{i}</td>
+        <td class="td-subject"><a href="javascript:jf_viewArtcl('kor', '{artcl_id}')">공지 {artcl_id}</a></td>
+        <td>관리자</td><td>2025.01.23</td></tr>"""
+        for i, artcl_id in enumerate(artcl_ids)
+    )
+    return f'<div class="scroll-table"><table class="board-table horizon"><tbody>{rows}</tbody></table></div>'
 
 class TestNoticeListCrawler(unittest.TestCase):
     """공지사항 리스트 크롤러 테스트"""
     
-    @patch('crawler.notice_list_crawler.sync_playwright')
-    def test_fetch_notice_list_success(self, mock_playwright):
+    def tearDown(self):
+        """테스트 후 정리"""
+        close_browser_pool()
+    
+    @patch('crawler.notice_list_crawler.fetch_html', return_value=None)
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_fetch_notice_list_success(self, mock_playwright, mock_fetch_html):
         """정상적인 크롤링 테스트"""
         # Mock 설정
         mock_browser = MagicMock()
         mock_page = MagicMock()
-        mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
-        mock_browser.new_page.return_value = mock_page
+        mock_playwright.return_value.start.return_value.chromium.launch.return_value = mock_browser
+        mock_browser.new_context.return_value.new_page.return_value = mock_page
         
         # HTML 콘텐츠 모킹
         mock_html = """
@@ -51,13 +69,14 @@ class TestNoticeListCrawler(unittest.TestCase):
             self.assertIn('writer', result[0])
             self.assertIn('date', result[0])
     
-    @patch('crawler.notice_list_crawler.sync_playwright')
-    def test_fetch_notice_list_failure(self, mock_playwright):
+    @patch('crawler.notice_list_crawler.fetch_html', return_value=None)
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_fetch_notice_list_failure(self, mock_playwright, mock_fetch_html):
         """크롤링 실패 테스트"""
         # Mock 설정 - 예외 발생
         mock_context = MagicMock()
         mock_context.chromium.launch.side_effect = Exception("크롤링 실패")
-        mock_playwright.return_value.__enter__.return_value = mock_context
+        mock_playwright.return_value.start.return_value = mock_context
         
         # 테스트 실행
         result = fetch_notice_list()
@@ -65,17 +84,241 @@ class TestNoticeListCrawler(unittest.TestCase):
         # 검증
         self.assertEqual(result, [])
 
+    @patch('crawler.notice_list_crawler.fetch_html', return_value=None)
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_fetch_notice_list_single_page_load(self, mock_playwright, mock_fetch_html):
+        """브라우저 대체 시 게시글 수와 관계없이 목록 페이지를 한 번만 불러오는지 테스트"""
+        mock_browser = mock_playwright.return_value.start.return_value.chromium.launch.return_value
+        mock_page = mock_browser.new_context.return_value.new_page.return_value
+        rows = ''.join(f"""
+                    <tr class="thumb">
+                        <td>{i}</td>
+                        <td class="td-subject"><a href="javascript:jf_viewArtcl('kor', '11186{i}')">공지 {i}</a></td>
+                        <td>관리자</td>
+                        <td>2025.01.23</td>
+                    </tr>""" for i in range(5))
+        mock_page.content.return_value = f"""
+        <div class="scroll-table">
+            <table class="board-table horizon">
+                <tbody>{rows}</tbody>
+            </table>
+        </div>
+        """
+        
+        # 테스트 실행
+        result = fetch_notice_list(limit=3)
+        
+        # 검증
+        self.assertEqual(len(result), 3)
+        mock_page.goto.assert_called_once()
+        mock_page.evaluate.assert_not_called()
+        mock_page.wait_for_timeout.assert_not_called()
+    
+    @patch('crawler.browser_pool.sync_playwright')
+    @patch('crawler.notice_list_crawler.fetch_html')
+    def test_fetch_notice_list_http(self, mock_fetch_html, mock_playwright):
+        """정적 HTML로 목록을 가져오면 브라우저를 실행하지 않는지 테스트"""
+        mock_fetch_html.return_value = """
+        <div class="scroll-table">
+            <table class="board-table horizon">
+                <tbody>
+                    <tr class="thumb">
+                        <td>1</td>
+                        <td class="td-subject"><a href="javascript:jf_viewArtcl('kor', '111860')">테스트 공지사항</a></td>
+                        <td>관리자</td>
+                        <td>2025.01.23</td>
+                    </tr>
+                </tbody>
+            </table>
+        </div>
+        """
+        
+        # 테스트 실행
+        result = fetch_notice_list(limit=10)
+        
+        # 검증
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['title'], '테스트 공지사항')
+        self.assertEqual(result[0]['writer'], '관리자')
+        self.assertEqual(result[0]['date'], '2025.01.23')
+        self.assertEqual(result[0]['id'], 111860)
+        self.assertIn('subview.do?enc=', result[0]['url'])
+        mock_playwright.assert_not_called()
+
+class TestIncrementalCrawl(unittest.TestCase):
+    """기준점 기반 증분 크롤링 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정 (페이지당 3개, 최신순)"""
+        self.pages = {1: [110, 109, 108], 2: [107, 106, 105], 3: [104, 103, 102]}
+        patcher = patch('crawler.notice_list_crawler.fetch_html', side_effect=self.fake_fetch)
+        self.mock_fetch_html = patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def fake_fetch(self, url, params=None):
+        page = int(url.split("page=")[1]) if "page=" in url else 1
+        return make_list_html(self.pages.get(page, []))
+    
+    def test_unchanged_board_single_request(self):
+        """새 공지사항이 없으면 요청 한 번으로 끝나는지 테스트"""
+        result = fetch_notice_list_since(110)
+        
+        # 검증
+        self.assertEqual(result, [])
+        self.mock_fetch_html.assert_called_once()
+    
+    def test_stops_at_high_water_mark(self):
+        """기준점이 있는 페이지에서 멈추고 그보다 새로운 공지사항만 반환하는지 테스트"""
+        result = fetch_notice_list_since(106)
+        
+        # 검증
+        self.assertEqual([notice['id'] for notice in result], [110, 109, 108, 107])
+        self.assertEqual(self.mock_fetch_html.call_count, 2)
+    
+    def test_catch_up_limited_by_max_pages(self):
+        """오래 멈춰 있었으면 최대 페이지 수까지만 따라잡는지 테스트"""
+        result = fetch_notice_list_since(50, max_pages=2)
+        
+        # 검증
+        self.assertEqual(len(result), 6)
+        self.assertEqual(self.mock_fetch_html.call_count, 2)
+
+class TestBoards(unittest.TestCase):
+    """게시판 목록 테스트"""
+    
+    def test_unknown_board(self):
+        """등록되지 않은 게시판 키는 오류를 내는지 테스트"""
+        from crawler.boards import get_board
+        
+        with self.assertRaises(ValueError):
+            get_board('unknown')
+    
+    def test_board_specific_parsing(self):
+        """게시판 설정의 URL로 링크를 만들고 게시판 키를 붙이는지 테스트"""
+        from crawler.boards import get_board
+        board = get_board('academic')
+        
+        result = parse_notice_list(make_list_html([501]), board=board)
+        
+        # 검증
+        self.assertEqual(result[0]['board'], 'academic')
+        self.assertTrue(result[0]['url'].startswith(board['url']))
+    
+    @patch('crawler.notice_list_crawler.fetch_html', return_value=make_list_html([501]))
+    def test_board_page_url(self, mock_fetch_html):
+        """게시판마다 자기 목록 URL을 요청하는지 테스트"""
+        from crawler.boards import get_board
+        board = get_board('academic')
+        
+        fetch_notice_page(2, board=board)
+        
+        # 검증
+        mock_fetch_html.assert_called_once_with(f"{board['url']}?page=2")
+
+    @patch('crawler.notice_list_crawler.CRAWLER_FETCH_MODE', 'browser')
+    @patch('crawler.notice_list_crawler.run_in_browser')
+    def test_browser_waits_for_board_rows(self, mock_run):
+        """브라우저 대체 시 게시판 설정의 목록 행 선택자를 기다리는지 테스트"""
+        board = {'key': 'custom', 'name': '다른 게시판', 'url': 'https://example.com/board',
+                 'row_selector': 'table.list > tbody > tr', 'link_selector': 'a', 'writer_column': 1, 'date_column': 2}
+        browser_page = MagicMock()
+        browser_page.content.return_value = '<table class="list"><tbody></tbody></table>'
+        mock_run.side_effect = lambda job: job(browser_page)
+        
+        fetch_notice_page(1, board=board)
+        
+        # 검증
+        self.assertEqual(browser_page.wait_for_selector.call_args[0][0], 'table.list > tbody > tr')
+
+class TestChangeProbe(unittest.TestCase):
+    """게시판 변경 감지 테스트"""
+    
+    def make_response(self, html, etag=None):
+        return {'not_modified': False, 'html': html, 'etag': etag, 'last_modified': None}
+    
+    @patch('crawler.change_probe.fetch_html_conditional')
+    def test_not_modified(self, mock_fetch):
+        """304 응답이면 변경 없음으로 판단하는지 테스트"""
+        from crawler.change_probe import probe_board
+        mock_fetch.return_value = {'not_modified': True, 'html': None, 'etag': '"v1"', 'last_modified': None}
+        
+        result = probe_board({'etag': '"v1"'})
+        
+        # 검증
+        self.assertFalse(result['changed'])
+        mock_fetch.assert_called_once_with(ANY, '"v1"', None)
+    
+    @patch('crawler.change_probe.fetch_html_conditional')
+    def test_fragment_hash(self, mock_fetch):
+        """게시글 목록이 같으면 변경 없음, 새 글이 있으면 변경으로 판단하는지 테스트"""
+        from crawler.change_probe import probe_board
+        mock_fetch.return_value = self.make_response(make_list_html([110, 109]))
+        first = probe_board()
+        
+        unchanged = probe_board(first['state'])
+        mock_fetch.return_value = self.make_response(make_list_html([111, 110, 109]))
+        changed = probe_board(first['state'])
+        
+        # 검증
+        self.assertTrue(first['changed'])
+        self.assertFalse(unchanged['changed'])
+        self.assertTrue(changed['changed'])
+    
+    @patch('crawler.change_probe.fetch_html_conditional')
+    def test_view_count_ignored(self, mock_fetch):
+        """조회수 같은 게시글 외 영역 변화는 무시하는지 테스트"""
+        from crawler.change_probe import probe_board
+        mock_fetch.return_value = self.make_response(make_list_html([110]) + "<td>조회 10</td>")
+        first = probe_board()
+        mock_fetch.return_value = self.make_response(make_list_html([110]) + "<td>조회 11</td>")
+        
+        result = probe_board(first['state'])
+        
+        # 검증
+        self.assertFalse(result['changed'])
+    
+    @patch('crawler.change_probe.fetch_html_conditional', return_value=None)
+    def test_probe_failure_means_changed(self, mock_fetch):
+        """확인에 실패하면 전체 크롤링으로 넘어가는지 테스트"""
+        from crawler.change_probe import probe_board
+        
+        result = probe_board({'fragment_hash': 'abc'})
+        
+        # 검증
+        self.assertTrue(result['changed'])
+    
+    @patch('crawler.http_client.session')
+    def test_conditional_headers(self, mock_session):
+        """이전 ETag/Last-Modified를 조건부 요청 헤더로 보내는지 테스트"""
+        from crawler.http_client import fetch_html_conditional
+        mock_session.get.return_value.status_code = 304
+        mock_session.get.return_value.headers = {}
+        
+        result = fetch_html_conditional("https://example.com", '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT")
+        
+        # 검증
+        headers = mock_session.get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], "Mon, 01 Jan 2024 00:00:00 GMT")
+        self.assertTrue(result['not_modified'])
+        self.assertEqual(result['etag'], '"v1"')
+
 class TestNoticeContentCrawler(unittest.TestCase):
     """공지사항 내용 크롤러 테스트"""
     
-    @patch('crawler.notice_crawler.sync_playwright')
-    def test_fetch_notice_content_success(self, mock_playwright):
+    def tearDown(self):
+        """테스트 후 정리"""
+        close_browser_pool()
+    
+    @patch('crawler.notice_crawler.fetch_html', return_value=None)
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_fetch_notice_content_success(self, mock_playwright, mock_fetch_html):
         """정상적인 내용 크롤링 테스트"""
         # Mock 설정
         mock_browser = MagicMock()
         mock_page = MagicMock()
-        mock_playwright.return_value.__enter__.return_value.chromium.launch.return_value = mock_browser
-        mock_browser.new_page.return_value = mock_page
+        mock_playwright.return_value.start.return_value.chromium.launch.return_value = mock_browser
+        mock_browser.new_context.return_value.new_page.return_value = mock_page
         
         # HTML 콘텐츠 모킹
         mock_html = """
@@ -97,13 +340,14 @@ class TestNoticeContentCrawler(unittest.TestCase):
         self.assertIn('date', result)
         self.assertIn('content', result)
     
-    @patch('crawler.notice_crawler.sync_playwright')
-    def test_fetch_notice_content_failure(self, mock_playwright):
+    @patch('crawler.notice_crawler.fetch_html', return_value=None)
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_fetch_notice_content_failure(self, mock_playwright, mock_fetch_html):
         """내용 크롤링 실패 테스트"""
         # Mock 설정 - 예외 발생
         mock_context = MagicMock()
         mock_context.chromium.launch.side_effect = Exception("크롤링 실패")
-        mock_playwright.return_value.__enter__.return_value = mock_context
+        mock_playwright.return_value.start.return_value = mock_context
         
         # 테스트 실행
         result = fetch_notice_content("https://test.com")
@@ -111,5 +355,126 @@ class TestNoticeContentCrawler(unittest.TestCase):
         # 검증
         self.assertIsNone(result)
 
+    @patch('crawler.browser_pool.sync_playwright')
+    @patch('crawler.notice_crawler.fetch_html')
+    def test_fetch_notice_content_http(self, mock_fetch_html, mock_playwright):
+        """정적 HTML로 본문을 가져오면 브라우저를 실행하지 않는지 테스트"""
+        mock_fetch_html.return_value = """
+        <h2 class="view-title">테스트 공지사항</h2>
+        <dl class="writer"><dd>관리자</dd></dl>
+        <div class="view-con">테스트 내용입니다.</div>
+        """
+        
+        # 테스트 실행
+        result = fetch_notice_content("https://www.gachon.ac.kr/kor/7986/subview.do?artclId=111860")
+        
+        # 검증
+        self.assertEqual(result['content'], '테스트 내용입니다.')
+        mock_fetch_html.assert_called_once_with("https://www.gachon.ac.kr/commonNotice/kor/111860/artclView.do")
+        mock_playwright.assert_not_called()
+
+class TestNoticeUrl(unittest.TestCase):
+    """공지사항 URL 생성 테스트"""
+    
+    def test_build_notice_url_matches_site_script(self):
+        """jf_viewArtcl이 만드는 enc URL과 동일한지 테스트"""
+        from crawler.notice_url import build_notice_url, get_view_url
+        
+        url = build_notice_url("https://www.gachon.ac.kr/kor/7986/subview.do", "111860")
+        
+        # 검증
+        self.assertEqual(url, "https://www.gachon.ac.kr/kor/7986/subview.do?enc=Zm5jdDF8QEB8JTJGY29tbW9uTm90aWNlJTJGa29yJTJGMTExODYwJTJGYXJ0Y2xWaWV3LmRvJTNGcGFnZSUzRDElMjZzcmNoQ29sdW1uJTNEJTI2c3JjaFdvcmQlM0QlMjY%3D")
+        self.assertTrue(get_view_url(url).startswith("https://www.gachon.ac.kr/commonNotice/kor/111860/artclView.do"))
+    
+    def test_notice_id_same_for_every_url_form(self):
+        """enc, artclId, 게시판 URL이 모두 같은 공지사항 ID로 해석되는지 테스트"""
+        from crawler.notice_url import build_notice_url, get_notice_id, parse_notice_url
+        
+        list_url = "https://www.gachon.ac.kr/kor/7986/subview.do"
+        bbs_url = build_notice_url(list_url, "111600", "kor", "475")
+        
+        # 검증
+        self.assertEqual(get_notice_id(build_notice_url(list_url, "111860")), 111860)
+        self.assertEqual(get_notice_id(f"{list_url}?artclId=111860"), 111860)
+        self.assertEqual(get_notice_id({'url': bbs_url}), 111600)
+        self.assertEqual(parse_notice_url(bbs_url), {'site': 'kor', 'bbs_id': '475', 'artcl_id': '111600'})
+        self.assertEqual(get_notice_id({'id': 5, 'url': bbs_url}), 5)
+    
+    def test_notice_id_fallback_for_other_urls(self):
+        """게시판 URL이 아니면 URL마다 고정된 음수 ID를 쓰는지 테스트"""
+        from crawler.notice_url import get_notice_id
+        
+        first = get_notice_id("https://example.com/1")
+        
+        # 검증
+        self.assertLess(first, 0)
+        self.assertEqual(first, get_notice_id("https://example.com/1"))
+        self.assertNotEqual(first, get_notice_id("https://example.com/2"))
+
+class TestBrowserPool(unittest.TestCase):
+    """브라우저 풀 테스트"""
+    
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_browser_launched_once(self, mock_playwright):
+        """여러 번 페이지를 빌려도 브라우저는 한 번만 실행되는지 테스트"""
+        mock_launch = mock_playwright.return_value.start.return_value.chromium.launch
+        pool = BrowserPool(max_contexts=1, max_pages_per_context=10)
+        
+        for _ in range(3):
+            with pool.page():
+                pass
+        
+        # 검증
+        mock_launch.assert_called_once()
+        mock_launch.return_value.new_context.assert_called_once()
+        pool.close()
+    
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_context_recycled_after_limit(self, mock_playwright):
+        """페이지 사용 한도를 넘으면 컨텍스트를 재생성하는지 테스트"""
+        mock_browser = mock_playwright.return_value.start.return_value.chromium.launch.return_value
+        pool = BrowserPool(max_contexts=1, max_pages_per_context=2)
+        
+        for _ in range(4):
+            with pool.page():
+                pass
+        
+        # 검증
+        self.assertEqual(mock_browser.new_context.call_count, 2)
+        pool.close()
+    
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_context_recycled_on_error(self, mock_playwright):
+        """페이지 작업 중 오류가 나면 컨텍스트를 폐기하는지 테스트"""
+        mock_browser = mock_playwright.return_value.start.return_value.chromium.launch.return_value
+        pool = BrowserPool(max_contexts=1, max_pages_per_context=10)
+        
+        with self.assertRaises(RuntimeError):
+            with pool.page():
+                raise RuntimeError("페이지 크래시")
+        with pool.page():
+            pass
+        
+        # 검증
+        self.assertEqual(mock_browser.new_context.call_count, 2)
+        mock_browser.new_context.return_value.close.assert_called()
+        pool.close()
+    
+    @patch('crawler.browser_pool.sync_playwright')
+    def test_single_browser_thread_for_all_workers(self, mock_playwright):
+        """여러 작업 스레드가 넘긴 작업을 브라우저 스레드 하나가 같은 Chromium으로 처리하고, 종료도 그 스레드에서 하는지 테스트"""
+        mock_launch = mock_playwright.return_value.start.return_value.chromium.launch
+        close_threads = []
+        mock_launch.return_value.close.side_effect = lambda: close_threads.append(threading.current_thread().name)
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            names = list(executor.map(lambda _: run_in_browser(lambda page: threading.current_thread().name), range(8)))
+        close_browser_pool()
+        
+        # 검증
+        self.assertEqual(set(names), {"gn-browser"})
+        mock_launch.assert_called_once()
+        self.assertEqual(close_threads, ["gn-browser"])
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
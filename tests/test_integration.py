@@ -31,9 +31,9 @@ class TestIntegration(unittest.TestCase):
     
     @patch('main.fetch_notice_list')
     @patch('main.fetch_notice_content')
-    @patch('main.summarize_notice')
+    @patch('main.summarize_notices')
     @patch('main.send_telegram_message')
-    @patch('main.send_email')
+    @patch('main.send_bulk_email')
     @patch('main.send_discord_announcement')
     @patch('main.get_active_subscribers')
     def test_check_and_notify_success(self, mock_subscribers, mock_discord, mock_email, 
@@ -56,7 +56,7 @@ class TestIntegration(unittest.TestCase):
             'date': '2025.01.23'
         }
         
-        mock_summarize.return_value = "테스트 요약"
+        mock_summarize.return_value = ["테스트 요약"]
         mock_telegram.return_value = True
         mock_email.return_value = True
         mock_discord.return_value = True
@@ -9,7 +9,13 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from notifier.telegram import send_telegram_message
-from notifier.email_notifier import send_email
+import smtplib
+from notifier.email_notifier import send_email, send_bulk_email, summarize_delivery, render_email, send_welcome_email
+from notifier.mail_queue import MailQueue, MailQueueFull
+import email
+from notifier.smtp_pool import SMTPConnectionPool, PooledConnection
+from utils.rate_limiter import RateLimiter
+import time
 from notifier.discord import send_discord_announcement
 
 class TestTelegramNotifier(unittest.TestCase):
@@ -89,6 +95,331 @@ class TestEmailNotifier(unittest.TestCase):
         # 검증
         self.assertFalse(result)
 
+class TestPreparedEmail(unittest.TestCase):
+    """미리 렌더링된 이메일 테스트"""
+    
+    def test_for_recipient_headers(self):
+        """수신자별로 To 헤더만 달라지는지 테스트"""
+        prepared = render_email("📢 테스트 제목", "<p>테스트 내용</p>")
+        
+        first = email.message_from_bytes(prepared.for_recipient("a@test.com"))
+        second = email.message_from_bytes(prepared.for_recipient("b@test.com"))
+        
+        # 검증
+        self.assertEqual(first['To'], "a@test.com")
+        self.assertEqual(second['To'], "b@test.com")
+        self.assertEqual(first['Subject'], second['Subject'])
+        self.assertIn("테스트 내용", first.get_payload()[0].get_payload(decode=True).decode('utf-8'))
+    
+    @patch('notifier.email_notifier.build_message')
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_rendered_once_for_bulk_send(self, mock_smtp, mock_build):
+        """대량 전송 시 본문을 한 번만 렌더링하는지 테스트"""
+        from email.mime.multipart import MIMEMultipart
+        mock_build.return_value = MIMEMultipart()
+        mock_smtp.return_value.sendmail.return_value = {}
+        pool = SMTPConnectionPool(size=1)
+        
+        # 테스트 실행
+        send_bulk_email("제목", "내용", [f"user{i}@test.com" for i in range(5)], pool=pool, rate_limit=0)
+        
+        # 검증
+        mock_build.assert_called_once()
+        pool.close()
+
+class TestSMTPConnectionPool(unittest.TestCase):
+    """SMTP 연결 풀 테스트"""
+    
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_connection_reused(self, mock_smtp):
+        """여러 메시지를 보내도 연결과 로그인은 한 번만 하는지 테스트"""
+        mock_server = MagicMock()
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
+        pool = SMTPConnectionPool(size=1)
+        
+        # 테스트 실행
+        results = send_bulk_email("제목", "내용", [f"user{i}@test.com" for i in range(5)], pool=pool)
+        
+        # 검증
+        self.assertTrue(all(result['success'] for result in results))
+        mock_smtp.assert_called_once()
+        mock_server.login.assert_called_once()
+        self.assertEqual(mock_server.sendmail.call_count, 5)
+        pool.close()
+    
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_reconnect_on_disconnect(self, mock_smtp):
+        """연결이 끊어지면 재연결 후 재시도하는지 테스트"""
+        broken_server = MagicMock()
+        broken_server.sendmail.side_effect = smtplib.SMTPServerDisconnected("연결 끊김")
+        healthy_server = MagicMock()
+        healthy_server.sendmail.return_value = {}
+        mock_smtp.side_effect = [broken_server, healthy_server]
+        pool = SMTPConnectionPool(size=1, max_retries=1)
+        
+        # 테스트 실행
+        results = send_bulk_email("제목", "내용", ["test@example.com"], pool=pool)
+        
+        # 검증
+        self.assertTrue(results[0]['success'])
+        self.assertEqual(results[0]['attempts'], 2)
+        self.assertEqual(mock_smtp.call_count, 2)
+        pool.close()
+    
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_stale_pooled_connections(self, mock_smtp):
+        """유휴 연결이 모두 끊겨 있어도 새 연결로 재시도하고, 오래 쉰 연결은 NOOP으로 걸러내는지 테스트"""
+        def stale_connection():
+            server = MagicMock()
+            server.sendmail.side_effect = smtplib.SMTPServerDisconnected("연결 끊김")
+            server.noop.side_effect = smtplib.SMTPServerDisconnected("연결 끊김")
+            return PooledConnection(server)
+        healthy_server = MagicMock()
+        healthy_server.sendmail.return_value = {}
+        mock_smtp.return_value = healthy_server
+
+        # NOOP 확인 전(최근에 쉰 연결): 끊긴 연결로 한 번 실패한 뒤 새 연결로 재시도
+        pool = SMTPConnectionPool(size=3, max_retries=2, idle_check_after=60)
+        for _ in range(3):
+            pool._idle.put(stale_connection())
+        refused, attempts = pool.send("from@test.com", "to@test.com", "메시지")
+
+        # 검증
+        self.assertEqual((refused, attempts), ({}, 2))
+        self.assertEqual(mock_smtp.call_count, 1)
+        pool.close()
+
+        # 오래 쉰 연결: NOOP으로 끊긴 연결을 정리하고 첫 시도에 새 연결 사용
+        mock_smtp.reset_mock()
+        pool = SMTPConnectionPool(size=3, max_retries=2, idle_check_after=0)
+        for _ in range(3):
+            pool._idle.put(stale_connection())
+        time.sleep(0.01)
+        refused, attempts = pool.send("from@test.com", "to@test.com", "메시지")
+
+        # 검증
+        self.assertEqual((refused, attempts), ({}, 1))
+        self.assertEqual(mock_smtp.call_count, 1)
+        self.assertEqual(pool._idle.qsize(), 1)
+        pool.close()
+
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_per_recipient_results(self, mock_smtp):
+        """거부된 수신자는 실패로 기록하는지 테스트"""
+        mock_server = MagicMock()
+        mock_server.sendmail.side_effect = [
+            {},
+            smtplib.SMTPRecipientsRefused({'bad@test.com': (550, b'User unknown')})
+        ]
+        mock_smtp.return_value = mock_server
+        pool = SMTPConnectionPool(size=1)
+        
+        # 테스트 실행
+        results = send_bulk_email("제목", "내용", ["good@test.com", "bad@test.com"], pool=pool, workers=1)
+        
+        # 검증
+        self.assertTrue(results[0]['success'])
+        self.assertFalse(results[1]['success'])
+        self.assertIsNotNone(results[1]['error'])
+        mock_smtp.assert_called_once()
+        pool.close()
+
+class TestEmailFanout(unittest.TestCase):
+    """구독자 병렬 전송 테스트"""
+    
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_parallel_send_keeps_order(self, mock_smtp):
+        """여러 작업으로 전송해도 결과가 수신자 순서를 유지하는지 테스트"""
+        mock_smtp.return_value.sendmail.return_value = {}
+        pool = SMTPConnectionPool(size=3)
+        recipients = [f"user{i}@test.com" for i in range(10)]
+        
+        # 테스트 실행
+        results = send_bulk_email("제목", "내용", recipients, pool=pool, workers=3, rate_limit=0)
+        
+        # 검증
+        self.assertEqual([result['email'] for result in results], recipients)
+        self.assertLessEqual(mock_smtp.call_count, 3)
+        pool.close()
+    
+    def test_summarize_delivery(self):
+        """전송 결과 집계 테스트"""
+        results = [
+            {'email': 'a@test.com', 'success': True, 'attempts': 1, 'error': None},
+            {'email': 'b@test.com', 'success': True, 'attempts': 2, 'error': None},
+            {'email': 'c@test.com', 'success': False, 'attempts': 3, 'error': '연결 끊김'}
+        ]
+        
+        report = summarize_delivery(results)
+        
+        # 검증
+        self.assertEqual(report['delivered'], 2)
+        self.assertEqual(report['failed'], 1)
+        self.assertEqual(report['retried'], 2)
+        self.assertEqual(report['failed_recipients'], ['c@test.com'])
+    
+    def test_rate_limiter(self):
+        """초당 전송 수 제한 테스트"""
+        limiter = RateLimiter(50)
+        
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+        
+        # 첫 호출 이후 5번은 1/50초 간격으로 대기
+        self.assertGreaterEqual(elapsed, 0.09)
+
+class TestBatchedEmail(unittest.TestCase):
+    """묶음(BCC) 전송 테스트"""
+    
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_batched_transactions(self, mock_smtp):
+        """묶음 크기만큼 수신자를 모아 한 트랜잭션으로 보내는지 테스트"""
+        mock_server = MagicMock()
+        mock_server.sendmail.return_value = {}
+        mock_smtp.return_value = mock_server
+        pool = SMTPConnectionPool(size=1)
+        recipients = [f"user{i}@test.com" for i in range(5)]
+        
+        # 테스트 실행
+        results = send_bulk_email("제목", "내용", recipients, pool=pool, rate_limit=0, batch_size=2)
+        
+        # 검증
+        self.assertTrue(all(result['success'] for result in results))
+        self.assertEqual(mock_server.sendmail.call_count, 3)
+        envelope = mock_server.sendmail.call_args_list[0][0][1]
+        self.assertEqual(len(envelope), 2)
+        payload = email.message_from_bytes(mock_server.sendmail.call_args_list[0][0][2])
+        self.assertEqual(payload['To'], "undisclosed-recipients:;")
+        pool.close()
+    
+    @patch('notifier.smtp_pool.smtplib.SMTP')
+    def test_rejected_recipients_fallback(self, mock_smtp):
+        """묶음에서 거부된 수신자는 개별 전송으로 재시도하는지 테스트"""
+        def fake_sendmail(from_addr, to_addrs, msg):
+            if isinstance(to_addrs, list):
+                return {addr: (550, b'Rejected') for addr in to_addrs if addr.startswith('bad')}
+            if to_addrs.startswith('bad'):
+                raise smtplib.SMTPRecipientsRefused({to_addrs: (550, b'Rejected')})
+            return {}
+        
+        mock_server = MagicMock()
+        mock_server.sendmail.side_effect = fake_sendmail
+        mock_smtp.return_value = mock_server
+        pool = SMTPConnectionPool(size=1)
+        recipients = ["good1@test.com", "bad@test.com", "good2@test.com"]
+        
+        # 테스트 실행
+        results = send_bulk_email("제목", "내용", recipients, pool=pool, rate_limit=0, batch_size=3)
+        
+        # 검증
+        self.assertEqual([result['email'] for result in results], recipients)
+        self.assertEqual([result['success'] for result in results], [True, False, True])
+        self.assertEqual(mock_server.sendmail.call_count, 2)
+        pool.close()
+
+class TestMailQueue(unittest.TestCase):
+    """메일 작업 큐 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.spool_file = "test_mail_spool.db"
+        self.sent = []
+        self.handlers = {'welcome': lambda payload: self.sent.append(payload['email']) or True}
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.spool_file, f"{self.spool_file}-wal", f"{self.spool_file}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def wait_until_empty(self, queue, timeout=5):
+        deadline = time.monotonic() + timeout
+        while queue.depth() and time.monotonic() < deadline:
+            time.sleep(0.02)
+    
+    def test_jobs_processed_by_workers(self):
+        """등록한 작업을 고정된 작업 스레드가 처리하고 지연 시간을 집계하는지 테스트"""
+        queue = MailQueue(self.spool_file, self.handlers, workers=2, poll_interval=0.1)
+        queue.start()
+        for i in range(10):
+            queue.enqueue('welcome', {'email': f'user{i}@test.com'})
+        self.wait_until_empty(queue)
+        stats = queue.stats()
+        queue.stop()
+        
+        # 검증
+        self.assertEqual(sorted(self.sent), sorted(f'user{i}@test.com' for i in range(10)))
+        self.assertEqual((stats['depth'], stats['sent'], stats['workers']), (0, 10, 2))
+        self.assertGreaterEqual(stats['max_latency'], stats['avg_latency'])
+    
+    def test_bounded(self):
+        """대기 작업이 최대치에 도달하면 등록을 거부하는지 테스트"""
+        queue = MailQueue(self.spool_file, self.handlers, max_size=2)
+        queue.enqueue('welcome', {'email': 'a@test.com'})
+        queue.enqueue('welcome', {'email': 'b@test.com'})
+        
+        # 검증
+        with self.assertRaises(MailQueueFull):
+            queue.enqueue('welcome', {'email': 'c@test.com'})
+    
+    def test_spooled_jobs_survive_restart(self):
+        """처리하지 못한 작업이 다음 실행에서 스풀로부터 처리되는지 테스트"""
+        MailQueue(self.spool_file, self.handlers).enqueue('welcome', {'email': 'a@test.com'})
+        
+        queue = MailQueue(self.spool_file, self.handlers, poll_interval=0.1)
+        queue.start()
+        self.wait_until_empty(queue)
+        queue.stop()
+        
+        # 검증
+        self.assertEqual(self.sent, ['a@test.com'])
+    
+    def test_idle_poll_skips_write_lock(self):
+        """처리할 작업이 없으면 쓰기 잠금 없이 확인만 하는지 테스트"""
+        queue = MailQueue(self.spool_file, self.handlers)
+        
+        with patch.object(queue, '_connect', wraps=queue._connect) as mock_connect:
+            idle = queue._claim()
+            queue.enqueue('welcome', {'email': 'a@test.com'})
+            job = queue._claim()
+        
+        # 검증
+        self.assertIsNone(idle)
+        self.assertEqual(job['payload'], {'email': 'a@test.com'})
+        writes = [call for call in mock_connect.call_args_list if call.kwargs.get('write')]
+        self.assertEqual(len(writes), 2)  # 등록과 작업이 있을 때의 임대만
+    
+    @patch('notifier.mail_queue.RETRY_DELAY', 0)
+    def test_failed_job_retried_then_dropped(self):
+        """실패한 작업을 다시 시도하고, 최대 시도 횟수를 넘기면 포기하는지 테스트"""
+        attempts = []
+        handlers = {'welcome': lambda payload: attempts.append(payload['email']) and False}
+        queue = MailQueue(self.spool_file, handlers, max_attempts=3, poll_interval=0.05)
+        queue.start()
+        queue.enqueue('welcome', {'email': 'a@test.com'})
+        self.wait_until_empty(queue)
+        stats = queue.stats()
+        queue.stop()
+        
+        # 검증
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual((stats['retried'], stats['dropped'], stats['depth']), (2, 1, 0))
+    
+    def test_welcome_email_uses_pool(self):
+        """환영 이메일을 공유 SMTP 연결 풀로 전송하는지 테스트"""
+        pool = MagicMock()
+        pool.send.return_value = ({}, 1)
+        
+        result = send_welcome_email('a@test.com', pool=pool)
+        
+        # 검증
+        self.assertTrue(result)
+        self.assertEqual(pool.send.call_args[0][1], 'a@test.com')
+        self.assertIn(b"To: a@test.com", pool.send.call_args[0][2])
+
 class TestDiscordNotifier(unittest.TestCase):
     """디스코드 알림 테스트"""
     
@@ -0,0 +1,235 @@
+# 공지사항 처리 파이프라인 테스트
+
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+import signal
+import time
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("OPENAI_API_KEY", "test-key")  # OpenAI 클라이언트 생성용
+
+from main import build_notification_stack, check_boards, run_daemon, get_pipeline_executor
+from crawler import browser_pool
+from utils.poll_schedule import KST, next_poll_interval
+from config import (DAEMON_ACTIVE_INTERVAL, DAEMON_IDLE_INTERVAL, DAEMON_QUIET_INTERVAL, DAEMON_RECENT_INTERVAL)
+
+class TestNotificationPipeline(unittest.TestCase):
+    """상세 크롤링 및 요약 파이프라인 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.notices = [
+            {'title': f'공지사항 {i}', 'url': f'https://test.com/{i}'}
+            for i in range(6)
+        ]
+    
+    @patch('main.summarize_notices')
+    @patch('main.fetch_notice_content')
+    def test_order_preserved(self, mock_content, mock_summarize):
+        """처리 시간이 달라도 원래 공지사항 순서를 유지하는지 테스트"""
+        def fake_fetch(url):
+            # 앞쪽 공지사항일수록 늦게 끝나도록 설정
+            time.sleep(0.01 * (6 - int(url.rsplit('/', 1)[1])))
+            return {'title': url, 'content': '내용'}
+        
+        mock_content.side_effect = fake_fetch
+        mock_summarize.side_effect = lambda notices, **options: [f"요약: {notice['title']}" for notice in notices]
+        
+        # 테스트 실행
+        result = build_notification_stack(self.notices)
+        
+        # 검증
+        self.assertEqual([item['title'] for item in result], [n['title'] for n in self.notices])
+        self.assertIn('요약: 공지사항 0', result[0]['message'])
+    
+    @patch('main.summarize_notices')
+    @patch('main.fetch_notice_content')
+    def test_summaries_requested_together(self, mock_content, mock_summarize):
+        """내용을 가져온 공지사항만 한 번에 묶어서 요약을 요청하는지 테스트"""
+        mock_content.side_effect = lambda url: None if url.endswith('/3') else {'title': url, 'content': '내용'}
+        mock_summarize.side_effect = lambda notices, **options: ["요약"] * len(notices)
+        
+        # 테스트 실행
+        result = build_notification_stack(self.notices)
+        
+        # 검증
+        mock_summarize.assert_called_once()
+        self.assertEqual(len(mock_summarize.call_args[0][0]), 5)
+        self.assertEqual(len(result), 6)
+        self.assertIn("공지사항 내용을 가져올 수 없습니다.", result[3]['message'])
+    
+    @patch('main.summarize_notices')
+    @patch('main.fetch_notice_content')
+    def test_failed_notice_skipped(self, mock_content, mock_summarize):
+        """일부 공지사항 처리가 실패해도 나머지는 전송 목록에 남는지 테스트"""
+        def fake_fetch(url):
+            if url.endswith('/2'):
+                raise Exception("크롤링 실패")
+            return {'title': url, 'content': '내용'}
+        
+        mock_content.side_effect = fake_fetch
+        mock_summarize.side_effect = lambda notices, **options: ["요약"] * len(notices)
+        
+        # 테스트 실행
+        result = build_notification_stack(self.notices)
+        
+        # 검증
+        self.assertEqual(len(result), 5)
+        self.assertNotIn('공지사항 2', [item['title'] for item in result])
+    
+    @patch('main.fetch_notice_content')
+    def test_local_summary_without_header_lines(self, mock_content):
+        """로컬 요약에 요약용 머리 줄(제목/작성자/등록일/첨부파일)이 들어가지 않는지 테스트"""
+        mock_content.return_value = {
+            'title': '장학금 신청 안내', 'writer': '학생지원팀', 'date': '2025.03.04', 'attachments': [],
+            'content': '2025학년도 1학기 장학금 신청을 받습니다.\n신청 기간: 3월 4일 ~ 3월 15일\n문의: 학생지원팀',
+        }
+        
+        # 테스트 실행
+        result = build_notification_stack(self.notices[:1], summary_backend='local')
+        
+        # 검증
+        for label in ('제목:', '작성자:', '등록일:', '내용:', '첨부파일:'):
+            self.assertNotIn(label, result[0]['message'])
+        self.assertIn('3월 15일', result[0]['message'])
+
+class TestBoardChecks(unittest.TestCase):
+    """여러 게시판 동시 확인 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.boards = [{'key': 'general', 'name': '전체공지'}, {'key': 'academic', 'name': '학사공지'}]
+    
+    @patch('main.check_board')
+    def test_results_merged_without_duplicates(self, mock_check):
+        """게시판별 결과를 게시판 순서대로 합치고 같은 공지사항은 한 번만 포함하는지 테스트"""
+        results = {
+            'general': [{'id': 3, 'title': '공지 3'}, {'id': 2, 'title': '공지 2'}],
+            'academic': [{'id': 2, 'title': '공지 2'}, {'id': 1, 'title': '공지 1'}],
+        }
+        mock_check.side_effect = lambda board: results[board['key']]
+        
+        new_notices, failed = check_boards(self.boards)
+        
+        # 검증
+        self.assertEqual([notice['id'] for notice in new_notices], [3, 2, 1])
+        self.assertEqual(failed, [])
+    
+    @patch('main.check_board')
+    def test_boards_checked_concurrently(self, mock_check):
+        """게시판들을 동시에 확인하는지 테스트"""
+        def slow_check(board):
+            time.sleep(0.2)
+            return []
+        mock_check.side_effect = slow_check
+        
+        start = time.perf_counter()
+        check_boards(self.boards)
+        
+        # 검증
+        self.assertLess(time.perf_counter() - start, 0.35)
+    
+    @patch('main.check_board')
+    def test_failed_board_reported(self, mock_check):
+        """한 게시판이 실패해도 나머지 결과는 반환하는지 테스트"""
+        def check(board):
+            if board['key'] == 'academic':
+                raise RuntimeError("연결 실패")
+            return [{'id': 1, 'title': '공지 1'}]
+        mock_check.side_effect = check
+        
+        new_notices, failed = check_boards(self.boards)
+        
+        # 검증
+        self.assertEqual(len(new_notices), 1)
+        self.assertEqual(failed, ['학사공지'])
+
+class TestPollSchedule(unittest.TestCase):
+    """데몬 폴링 간격 테스트"""
+    
+    def test_office_hours(self):
+        """평일 업무 시간에는 짧은 간격을 쓰는지 테스트"""
+        now = datetime(2025, 3, 5, 10, 0, tzinfo=KST)  # 수요일
+        self.assertEqual(next_poll_interval(now), DAEMON_ACTIVE_INTERVAL)
+    
+    def test_recent_activity(self):
+        """새 공지사항 직후에는 더 짧은 간격을 쓰는지 테스트"""
+        now = datetime(2025, 3, 8, 23, 0, tzinfo=KST)  # 토요일 밤
+        self.assertEqual(next_poll_interval(now, now - timedelta(minutes=5)), DAEMON_RECENT_INTERVAL)
+    
+    def test_quiet_and_idle_hours(self):
+        """야간·주말은 가장 긴 간격, 평일 저녁은 중간 간격을 쓰는지 테스트"""
+        self.assertEqual(next_poll_interval(datetime(2025, 3, 8, 14, 0, tzinfo=KST)), DAEMON_QUIET_INTERVAL)
+        self.assertEqual(next_poll_interval(datetime(2025, 3, 5, 19, 0, tzinfo=KST)), DAEMON_IDLE_INTERVAL)
+    
+    def test_wakes_at_office_start(self):
+        """업무 시작 직전에는 업무 시작 시각까지만 기다리는지 테스트"""
+        now = datetime(2025, 3, 5, 8, 50, tzinfo=KST)
+        self.assertEqual(next_poll_interval(now), 600)
+    
+    def test_failures_back_off(self):
+        """연속 실패 시 간격을 늘리되 최대 간격을 넘지 않는지 테스트"""
+        now = datetime(2025, 3, 5, 10, 0, tzinfo=KST)
+        self.assertEqual(next_poll_interval(now, failures=2), DAEMON_ACTIVE_INTERVAL * 2)
+        self.assertEqual(next_poll_interval(now, failures=20), DAEMON_QUIET_INTERVAL)
+
+class TestDaemon(unittest.TestCase):
+    """데몬 모드 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정 (원래 신호 처리기 복원)"""
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+    
+    @patch('main.close_smtp_pool')
+    @patch('main.close_browser_pool')
+    @patch('main.next_poll_interval', return_value=0)
+    @patch('main.check_and_notify')
+    def test_sigterm_stops_after_current_run(self, mock_check, mock_interval, mock_close_browser, mock_close_smtp):
+        """SIGTERM을 받으면 진행 중인 확인을 마친 뒤 자원을 정리하고 종료하는지 테스트"""
+        results = [
+            {"status": "success", "count": 1},
+            {"status": "error", "message": "크롤링 실패"},
+        ]
+        def fake_check(summary_backend=None):
+            result = results[mock_check.call_count - 1]
+            if mock_check.call_count == 2:
+                os.kill(os.getpid(), signal.SIGTERM)
+            return result
+        mock_check.side_effect = fake_check
+        
+        run_daemon()
+        
+        # 검증
+        self.assertEqual(mock_check.call_count, 2)
+        first_call, second_call = mock_interval.call_args_list
+        self.assertIsNotNone(first_call.args[1])  # 새 공지사항 발견 시각 기록
+        self.assertEqual(second_call.args[2], 1)  # 연속 실패 횟수
+        mock_close_browser.assert_called_once()
+        mock_close_smtp.assert_called_once()
+    
+    @patch('main.close_smtp_pool')
+    @patch('crawler.browser_pool.sync_playwright')
+    @patch('main.check_and_notify')
+    def test_browser_used_by_workers_closed(self, mock_check, mock_playwright, mock_close_smtp):
+        """작업 스레드에서 사용한 브라우저도 데몬 종료 시 닫히는지 테스트"""
+        mock_browser = mock_playwright.return_value.start.return_value.chromium.launch.return_value
+        def fake_check(summary_backend=None):
+            get_pipeline_executor().submit(browser_pool.run_in_browser, lambda page: page.content()).result()
+            os.kill(os.getpid(), signal.SIGTERM)
+            return {"status": "success", "count": 0}
+        mock_check.side_effect = fake_check
+        
+        run_daemon()
+        
+        # 검증
+        mock_browser.close.assert_called_once()
+        mock_playwright.return_value.start.return_value.stop.assert_called_once()
+        self.assertIsNone(browser_pool._browser_thread)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,346 @@
+# API 서버 테스트
+
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import httpx
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import server
+import asgi_server
+from subscribers import subscription_service
+from subscribers.subscriber_store import SubscriberStore
+
+class TestSubscriberCount(unittest.TestCase):
+    """구독자 수 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 전 설정 (테스트용 저장소, 환영 이메일 전송 생략)"""
+        self.test_file = "test_server_subscribers.db"
+        self.store = SubscriberStore(self.test_file)
+        for patcher in (
+            patch('subscribers.subscription_service.subscriber_store', self.store),
+            patch('subscribers.subscription_service.send_welcome_email_async'),
+            patch.dict(subscription_service._count_cache, {'stats': None, 'signature': None, 'checked_at': 0.0}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = server.app.test_client()
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.test_file, f"{self.test_file}-wal", f"{self.test_file}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_count_served_from_memory(self):
+        """저장소가 바뀌지 않았으면 DB를 다시 읽지 않는지 테스트"""
+        self.store.subscribe('a@test.com')
+
+        with patch.object(self.store, 'stats', wraps=self.store.stats) as mock_stats:
+            for _ in range(5):
+                response = self.client.get('/api/subscriber/count')
+
+        # 검증
+        self.assertEqual(response.get_json()['count'], 1)
+        self.assertEqual(mock_stats.call_count, 1)
+
+    def test_own_changes_applied_incrementally(self):
+        """이 프로세스의 가입/해지는 DB를 다시 읽지 않고 반영하는지 테스트"""
+        self.client.get('/api/subscriber/count')
+
+        with patch.object(self.store, 'stats', wraps=self.store.stats) as mock_stats:
+            self.client.post('/api/subscribe', json={'email': 'a@test.com'})
+            self.client.post('/api/subscribe', json={'email': 'b@test.com'})
+            self.client.post('/api/unsubscribe', json={'email': 'a@test.com'})
+            result = self.client.get('/api/subscriber/count').get_json()
+
+        # 검증
+        self.assertEqual((result['count'], result['total_count']), (1, 2))
+        mock_stats.assert_not_called()
+
+    def test_write_outside_count_lock(self):
+        """가입 처리 중(저장소 쓰기)에는 구독자 수 캐시 잠금을 잡지 않는지 테스트"""
+        lock_held = []
+        subscribe = self.store.subscribe
+
+        def checked_subscribe(email, with_stats=False):
+            lock_held.append(subscription_service._count_lock.locked())
+            return subscribe(email, with_stats=with_stats)
+
+        with patch.object(self.store, 'subscribe', checked_subscribe):
+            self.client.post('/api/subscribe', json={'email': 'a@test.com'})
+        result = self.client.get('/api/subscriber/count').get_json()
+
+        # 검증
+        self.assertEqual(lock_held, [False])
+        self.assertEqual(result['count'], 1)
+
+    def test_older_result_not_applied(self):
+        """늦게 도착한 이전 버전의 구독자 수가 최신 캐시를 덮어쓰지 않는지 테스트"""
+        _, stale = self.store.subscribe('a@test.com', with_stats=True)
+        self.store.subscribe('b@test.com')
+        self.client.get('/api/subscriber/count')
+
+        stale_change = lambda email, with_stats=False: (None, stale)
+        subscription_service.change_subscription(stale_change, 'a@test.com')
+        result = self.client.get('/api/subscriber/count').get_json()
+
+        # 검증
+        self.assertEqual(result['count'], 2)
+
+    def test_other_process_change_detected(self):
+        """다른 프로세스가 저장소를 바꾸면 새 구독자 수를 반환하는지 테스트"""
+        self.client.get('/api/subscriber/count')
+
+        SubscriberStore(self.test_file).subscribe('other@test.com')
+        result = self.client.get('/api/subscriber/count').get_json()
+
+        # 검증
+        self.assertEqual(result['count'], 1)
+
+    def test_not_modified(self):
+        """ETag가 같으면 304, 구독자 수가 바뀌면 200을 반환하는지 테스트"""
+        first = self.client.get('/api/subscriber/count')
+        etag = first.headers['ETag']
+
+        unchanged = self.client.get('/api/subscriber/count', headers={'If-None-Match': etag})
+        self.client.post('/api/subscribe', json={'email': 'a@test.com'})
+        changed = self.client.get('/api/subscriber/count', headers={'If-None-Match': etag})
+
+        # 검증
+        self.assertIn('max-age', first.headers['Cache-Control'])
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.get_json()['count'], 1)
+
+class TestAsgiServer(unittest.TestCase):
+    """ASGI 서버 테스트 (Flask 서버와 같은 응답)"""
+
+    def setUp(self):
+        """테스트 전 설정 (테스트용 저장소, 환영 이메일 전송 생략)"""
+        self.test_file = "test_asgi_subscribers.db"
+        self.store = SubscriberStore(self.test_file)
+        for patcher in (
+            patch('subscribers.subscription_service.subscriber_store', self.store),
+            patch('subscribers.subscription_service.send_welcome_email_async'),
+            patch.dict(subscription_service._count_cache, {'stats': None, 'signature': None, 'checked_at': 0.0}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.flask_client = server.app.test_client()
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.test_file, f"{self.test_file}-wal", f"{self.test_file}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def request(self, *requests):
+        """ASGI 앱에 요청을 차례로 보내고 응답 목록을 반환"""
+        async def run():
+            transport = httpx.ASGITransport(app=asgi_server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return [await client.request(method, path, **kwargs) for method, path, kwargs in requests]
+        return asyncio.run(run())
+
+    def test_same_json_contract(self):
+        """가입/중복 가입/해지/잘못된 요청에 Flask 서버와 같은 상태 코드와 JSON을 반환하는지 테스트"""
+        requests = [
+            ('POST', '/api/subscribe', {'json': {'email': 'a@test.com'}}),
+            ('POST', '/api/subscribe', {'json': {'email': 'a@test.com'}}),
+            ('POST', '/api/subscribe', {'json': {'email': 'invalid'}}),
+            ('POST', '/api/unsubscribe', {'json': {'email': 'a@test.com'}}),
+            ('POST', '/api/unsubscribe', {'json': {'email': 'b@test.com'}}),
+        ]
+        asgi_responses = self.request(*requests)
+
+        # 검증 (가입 시각은 요청마다 다르므로 제외)
+        expected_statuses = [200, 409, 400, 200, 404]
+        self.assertEqual([response.status_code for response in asgi_responses], expected_statuses)
+        self.assertEqual(asgi_responses[0].json()['message'], '구독이 완료되었습니다.')
+        self.assertEqual(asgi_responses[1].json(), {'success': False, 'error': '이미 등록된 이메일 주소입니다.'})
+        self.assertEqual(asgi_responses[4].json(), {'success': False, 'error': '등록되지 않은 이메일 주소입니다.'})
+
+        flask_response = self.flask_client.post('/api/subscribe', json={'email': 'a@test.com'})
+        self.assertEqual(flask_response.get_json()['message'], '구독이 재활성화되었습니다.')
+        self.assertEqual(flask_response.get_json().keys(), asgi_responses[0].json().keys())
+
+    def test_count_not_modified(self):
+        """구독자 수에 ETag/Cache-Control을 붙이고 같은 ETag면 304를 반환하는지 테스트"""
+        first, = self.request(('GET', '/api/subscriber/count', {}))
+        second, = self.request(('GET', '/api/subscriber/count', {'headers': {'If-None-Match': first.headers['ETag']}}))
+        flask_response = self.flask_client.get('/api/subscriber/count')
+
+        # 검증
+        self.assertEqual(first.json(), flask_response.get_json())
+        self.assertEqual(first.headers['ETag'], flask_response.headers['ETag'])
+        self.assertEqual(first.headers['Cache-Control'], flask_response.headers['Cache-Control'])
+        self.assertEqual(second.status_code, 304)
+
+    def test_cors_preflight(self):
+        """사전 요청에 허용 메서드/헤더를 반환하는지 테스트"""
+        headers = {'Origin': 'https://gachonnotifier.site', 'Access-Control-Request-Method': 'POST',
+                   'Access-Control-Request-Headers': 'content-type'}
+        response, = self.request(('OPTIONS', '/api/subscribe', {'headers': headers}))
+        flask_response = self.flask_client.options('/api/subscribe', headers=headers)
+
+        # 검증
+        self.assertEqual(response.status_code, 200)
+        for name in ('Access-Control-Allow-Origin', 'Access-Control-Allow-Methods', 'Access-Control-Allow-Headers'):
+            self.assertEqual(response.headers.get(name), flask_response.headers.get(name))
+
+    def test_health_mail_queue(self):
+        """두 서버 모두 상태 확인에 메일 큐 상태를 담고, 읽지 못하면 200과 degraded를 반환하는지 테스트"""
+        queue = MagicMock()
+        queue.stats.return_value = {'depth': 3}
+        with patch('subscribers.subscription_service.get_mail_queue', return_value=queue):
+            healthy, = self.request(('GET', '/api/health', {}))
+            flask_healthy = self.flask_client.get('/api/health')
+        queue.stats.side_effect = OSError("disk I/O error")
+        with patch('subscribers.subscription_service.get_mail_queue', return_value=queue):
+            degraded, = self.request(('GET', '/api/health', {}))
+            flask_degraded = self.flask_client.get('/api/health')
+
+        # 검증
+        for body in (healthy.json(), flask_healthy.get_json()):
+            self.assertEqual((body['status'], body['mail_queue']), ('healthy', {'depth': 3}))
+        self.assertEqual((degraded.status_code, flask_degraded.status_code), (200, 200))
+        for body in (degraded.json(), flask_degraded.get_json()):
+            self.assertEqual(body['status'], 'degraded')
+            self.assertIn('disk I/O error', body['mail_queue']['error'])
+
+    def test_cors_echoes_origin(self):
+        """모든 도메인을 허용할 때 Flask 서버와 같이 요청 출처를 그대로 돌려주는지 테스트"""
+        headers = {'Origin': 'https://example.com'}
+        response, = self.request(('GET', '/api/health', {'headers': headers}))
+        flask_response = self.flask_client.get('/api/health', headers=headers)
+
+        # 검증
+        self.assertEqual(response.headers.get('Access-Control-Allow-Origin'), 'https://example.com')
+        self.assertEqual(flask_response.headers.get('Access-Control-Allow-Origin'), 'https://example.com')
+        self.assertEqual(response.headers.get('Vary'), flask_response.headers.get('Vary'))
+
+    def test_oversized_body_rejected(self):
+        """요청 본문이 최대 크기를 넘으면 (Content-Length 유무와 관계없이) 413을 반환하는지 테스트"""
+        async def chunks():
+            for _ in range(3):
+                yield b'a@test.com\n' * 4
+
+        with patch('subscribers.subscription_service.ADMIN_API_TOKEN', 'test-token'), \
+                patch('asgi_server.BULK_MAX_BODY_SIZE', 100):
+            subscribe, bulk_import, streamed = self.request(
+                ('POST', '/api/subscribe', {'json': {'email': 'a@test.com', 'padding': 'x' * asgi_server.MAX_BODY_SIZE}}),
+                ('POST', '/api/admin/subscribers/import', {'headers': {'Authorization': 'Bearer test-token'},
+                                                          'content': b'a@test.com\n' * 20}),
+                ('POST', '/api/admin/subscribers/import', {'headers': {'Authorization': 'Bearer test-token'},
+                                                          'content': chunks()}),
+            )
+
+        # 검증
+        self.assertEqual([subscribe.status_code, bulk_import.status_code, streamed.status_code], [413, 413, 413])
+        self.assertFalse(streamed.json()['success'])
+        self.assertEqual(self.store.count(), 0)
+
+    def test_unknown_route_and_method(self):
+        """없는 경로는 404, 허용되지 않은 메서드는 405를 반환하는지 테스트"""
+        missing, wrong_method = self.request(('GET', '/api/unknown', {}), ('GET', '/api/subscribe', {}))
+
+        # 검증
+        self.assertEqual(missing.status_code, 404)
+        self.assertEqual(wrong_method.status_code, 405)
+
+class TestBulkApi(unittest.TestCase):
+    """구독자 일괄 가져오기/내보내기 API 테스트"""
+
+    def setUp(self):
+        """테스트 전 설정 (테스트용 저장소, 관리자 토큰)"""
+        self.test_file = "test_bulk_api_subscribers.db"
+        self.store = SubscriberStore(self.test_file)
+        for patcher in (
+            patch('subscribers.subscription_service.subscriber_store', self.store),
+            patch('subscribers.subscription_service.send_welcome_email_async'),
+            patch('subscribers.subscription_service.ADMIN_API_TOKEN', 'test-token'),
+            patch.dict(subscription_service._count_cache, {'stats': None, 'signature': None, 'checked_at': 0.0}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = server.app.test_client()
+        self.auth = {'Authorization': 'Bearer test-token'}
+
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.test_file, f"{self.test_file}-wal", f"{self.test_file}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_requires_admin_token(self):
+        """토큰이 없거나 틀리면 401, 토큰이 설정되지 않았으면 403을 반환하는지 테스트"""
+        missing = self.client.get('/api/admin/subscribers/export')
+        wrong = self.client.get('/api/admin/subscribers/export', headers={'Authorization': 'Bearer wrong'})
+        with patch('subscribers.subscription_service.ADMIN_API_TOKEN', ''):
+            disabled = self.client.get('/api/admin/subscribers/export', headers=self.auth)
+
+        # 검증
+        self.assertEqual((missing.status_code, wrong.status_code, disabled.status_code), (401, 401, 403))
+
+    def test_import_updates_count(self):
+        """CSV 본문을 가져오면 결과를 반환하고 캐시된 구독자 수에 반영하는지 테스트"""
+        self.client.get('/api/subscriber/count')
+
+        response = self.client.post('/api/admin/subscribers/import', headers=self.auth, content_type='text/csv',
+                                    data='email\na@test.com\nb@test.com\na@test.com\ninvalid\n')
+        no_format = self.client.post('/api/admin/subscribers/import', headers=self.auth, data='a@test.com\n')
+        count = self.client.get('/api/subscriber/count').get_json()
+
+        # 검증
+        result = response.get_json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((result['created'], result['duplicates'], result['invalid']), (2, 1, 1))
+        self.assertEqual(no_format.status_code, 400)
+        self.assertEqual(count['count'], 2)
+
+    def test_batch_subscribe(self):
+        """이메일 목록을 한 번에 구독 처리하고 최대 개수를 넘으면 413을 반환하는지 테스트"""
+        self.store.subscribe('a@test.com')
+
+        response = self.client.post('/api/admin/subscribers/batch', headers=self.auth,
+                                    json={'emails': ['a@test.com', 'b@test.com', 'b@test.com', 'bad']})
+        with patch('subscribers.subscription_service.BATCH_SUBSCRIBE_MAX', 2):
+            too_many = self.client.post('/api/admin/subscribers/batch', headers=self.auth,
+                                        json={'emails': ['x@test.com', 'y@test.com', 'z@test.com']})
+
+        # 검증
+        result = response.get_json()
+        self.assertEqual((result['created'], result['unchanged'], result['duplicates'], result['invalid']), (1, 1, 1, 1))
+        self.assertEqual(too_many.status_code, 413)
+        self.assertEqual(self.store.count(), 2)
+
+    def test_export_streams_same_as_asgi(self):
+        """내보내기를 나누어 전송하고 ASGI 서버도 같은 내용을 반환하는지 테스트"""
+        for i in range(3):
+            self.store.subscribe(f'user{i}@test.com')
+        self.store.unsubscribe('user1@test.com')
+
+        flask_response = self.client.get('/api/admin/subscribers/export?format=ndjson&active_only=1', headers=self.auth)
+
+        async def run():
+            transport = httpx.ASGITransport(app=asgi_server.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get('/api/admin/subscribers/export?format=ndjson&active_only=1', headers=self.auth)
+        asgi_response = asyncio.run(run())
+
+        # 검증
+        self.assertTrue(flask_response.is_streamed)
+        self.assertEqual(flask_response.mimetype, 'application/x-ndjson')
+        self.assertEqual(len(flask_response.get_data(as_text=True).splitlines()), 2)
+        self.assertEqual(asgi_response.status_code, 200)
+        self.assertEqual(asgi_response.text, flask_response.get_data(as_text=True))
+        self.assertEqual(self.client.get('/api/admin/subscribers/export?format=xml', headers=self.auth).status_code, 400)
+
+if __name__ == '__main__':
+    unittest.main()
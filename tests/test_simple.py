@@ -4,11 +4,18 @@ import unittest
 import sys
 import os
 import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 
 # 상위 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from history.history_manager import load_history, save_history
+from history.history_manager import load_history, save_history, get_new_notices, load_board_state, save_board_state
+from history.history_store import HistoryStore, notice_key, get_history_store
+from crawler.notice_url import build_notice_url
+from subscribers.subscriber_store import SubscriberStore, get_subscriber_store, CREATED, REACTIVATED, ALREADY_ACTIVE, ALREADY_INACTIVE, NOT_FOUND
+from subscribers.subscribers import load_subscribers, get_active_subscribers
+from subscribers import bulk
 
 class TestHistoryManager(unittest.TestCase):
     """히스토리 관리자 테스트"""
@@ -19,8 +26,9 @@ class TestHistoryManager(unittest.TestCase):
     
     def tearDown(self):
         """테스트 후 정리"""
-        if os.path.exists(self.test_file):
-            os.remove(self.test_file)
+        for path in (self.test_file, "test_history.db"):
+            if os.path.exists(path):
+                os.remove(path)
     
     def test_load_history_empty(self):
         """빈 히스토리 로드 테스트"""
@@ -44,6 +52,434 @@ class TestHistoryManager(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['title'], '테스트1')
 
+class TestHistoryStore(unittest.TestCase):
+    """sqlite 기록 저장소 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_history.db"
+        self.legacy_file = "test_history_legacy.json"
+        self.list_url = "https://www.gachon.ac.kr/kor/7986/subview.do"
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.test_file, self.legacy_file, "test_history_legacy.db"):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def make_notice(self, artcl_id):
+        return {'title': f'공지 {artcl_id}', 'url': build_notice_url(self.list_url, str(artcl_id))}
+    
+    def test_key_is_article_id(self):
+        """enc URL과 artclId URL이 같은 정수 공지사항 ID로 해석되는지 테스트"""
+        enc_notice = self.make_notice(111860)
+        plain_notice = {'url': f"{self.list_url}?artclId=111860"}
+        
+        # 검증
+        self.assertEqual(notice_key(enc_notice), 111860)
+        self.assertEqual(notice_key(plain_notice), 111860)
+    
+    def test_same_article_not_sent_twice(self):
+        """enc URL로 기록된 게시글이 artclId URL로 다시 나와도 새 공지사항이 아닌지 테스트"""
+        get_new_notices([self.make_notice(1)], self.test_file)
+        
+        result = get_new_notices([{'title': '공지 1', 'url': f"{self.list_url}?artclId=1"}], self.test_file)
+        
+        # 검증
+        self.assertEqual(result, [])
+    
+    def test_legacy_rows_rekeyed(self):
+        """URL 문자열 키로 저장된 이전 기록을 공지사항 ID로 옮기고 중복을 합치는지 테스트"""
+        with sqlite3.connect(self.test_file) as conn:
+            conn.execute("CREATE TABLE notices (seq INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL UNIQUE, "
+                         "url TEXT, title TEXT, data TEXT NOT NULL, seen_at TEXT NOT NULL)")
+            for notice in (self.make_notice(1), {'title': '공지 1', 'url': f"{self.list_url}?artclId=1"}, self.make_notice(2)):
+                conn.execute("INSERT INTO notices (key, url, title, data, seen_at) VALUES (?, ?, ?, ?, '')",
+                             (notice['url'], notice['url'], notice['title'], json.dumps(notice)))
+        conn.close()
+        
+        store = HistoryStore(self.test_file)
+        
+        # 검증
+        self.assertEqual(store.count(), 2)
+        self.assertEqual(store.filter_new([self.make_notice(1), self.make_notice(3)]), [self.make_notice(3)])
+    
+    def test_no_retention_cap(self):
+        """50개를 넘는 기록도 모두 보관해 다시 새 공지사항으로 보지 않는지 테스트"""
+        first = [self.make_notice(i) for i in range(100, 0, -1)]
+        get_new_notices(first, self.test_file)
+        
+        result = get_new_notices(first[-5:] + [self.make_notice(101)], self.test_file)
+        
+        # 검증
+        self.assertEqual([notice['title'] for notice in result], ['공지 101'])
+        self.assertEqual(len(load_history(self.test_file)), 101)
+        self.assertEqual(load_history(self.test_file, limit=1)[0]['title'], '공지 101')
+    
+    def test_high_water_mark(self):
+        """가장 큰 게시글 ID를 기준점으로 반환하는지 테스트"""
+        store = HistoryStore(self.test_file)
+        self.assertIsNone(store.high_water_mark())
+        
+        store.add([self.make_notice(7), self.make_notice(9), {'title': '외부', 'url': 'https://example.com'}])
+        
+        # 검증
+        self.assertEqual(store.high_water_mark(), 9)
+    
+    def test_boards_recorded_separately(self):
+        """게시판별로 첫 실행을 따로 처리하고, 다른 게시판에서 이미 알린 공지사항은 다시 반환하지 않는지 테스트"""
+        get_new_notices([self.make_notice(2), self.make_notice(1)], self.test_file, namespace='general')
+        
+        first_run = get_new_notices([self.make_notice(5), self.make_notice(3)], self.test_file, namespace='academic')
+        general = get_new_notices([self.make_notice(4), self.make_notice(2)], self.test_file, namespace='general')
+        academic = get_new_notices([self.make_notice(6), self.make_notice(4), self.make_notice(5)], self.test_file, namespace='academic')
+        
+        # 검증
+        self.assertEqual(first_run, [])
+        self.assertEqual([notice['title'] for notice in general], ['공지 4'])
+        self.assertEqual([notice['title'] for notice in academic], ['공지 6'])
+        store = HistoryStore(self.test_file)
+        self.assertEqual(store.high_water_mark('general'), 4)
+        self.assertEqual(store.high_water_mark('academic'), 6)
+        self.assertEqual(store.count(), 6)
+    
+    def test_unnamespaced_rows_upgraded(self):
+        """게시판 구분 없이 저장된 이전 기록을 기본 게시판 기록으로 옮기는지 테스트"""
+        with sqlite3.connect(self.test_file) as conn:
+            conn.execute("CREATE TABLE notices (seq INTEGER PRIMARY KEY AUTOINCREMENT, notice_id INTEGER NOT NULL UNIQUE, "
+                         "url TEXT, title TEXT, data TEXT NOT NULL, seen_at TEXT NOT NULL)")
+            for artcl_id in (1, 2):
+                notice = self.make_notice(artcl_id)
+                conn.execute("INSERT INTO notices (notice_id, url, title, data, seen_at) VALUES (?, ?, ?, ?, '')",
+                             (artcl_id, notice['url'], notice['title'], json.dumps(notice)))
+        conn.close()
+        
+        store = HistoryStore(self.test_file)
+        
+        # 검증
+        self.assertEqual(store.count('general'), 2)
+        self.assertEqual(store.count('academic'), 0)
+        self.assertEqual(store.high_water_mark('general'), 2)
+    
+    def test_board_state_saved_with_history(self):
+        """게시판 변경 확인 결과를 기록 저장소에 저장하는지 테스트"""
+        self.assertEqual(load_board_state(self.test_file), {})
+        
+        save_board_state({'etag': '"v1"', 'fragment_hash': 'abc'}, self.test_file)
+        
+        # 검증
+        self.assertEqual(load_board_state(self.test_file), {'etag': '"v1"', 'fragment_hash': 'abc'})
+    
+    def test_duplicates_in_one_crawl(self):
+        """한 번의 크롤링에 같은 게시글이 두 번 나와도 한 번만 새 공지사항으로 보는지 테스트"""
+        store = HistoryStore(self.test_file)
+        store.add([self.make_notice(1)])
+        
+        result = store.filter_new([self.make_notice(2), self.make_notice(2)])
+        
+        # 검증
+        self.assertEqual(len(result), 1)
+    
+    def test_json_path_imported_without_overwrite(self):
+        """JSON 기록 파일 경로를 주면 같은 이름의 .db로 가져오고 JSON 파일은 그대로 두는지 테스트"""
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            json.dump({'notices': [self.make_notice(2), self.make_notice(1)]}, f)
+        with open(self.legacy_file, 'rb') as f:
+            original = f.read()
+        
+        result = load_history(self.legacy_file)
+        
+        # 검증
+        self.assertEqual([notice['title'] for notice in result], ['공지 2', '공지 1'])
+        self.assertTrue(os.path.exists("test_history_legacy.db"))
+        with open(self.legacy_file, 'rb') as f:
+            self.assertEqual(f.read(), original)
+    
+    def test_store_reused_per_path(self):
+        """같은 경로에는 저장소를 한 번만 만드는지 테스트"""
+        first = get_history_store(self.test_file)
+        
+        # 검증
+        self.assertIs(get_history_store(self.test_file), first)
+        self.assertIsNot(get_history_store(self.legacy_file), first)
+    
+    def test_legacy_imported_once(self):
+        """기존 history.json은 비어 있는 저장소에 한 번만 가져오는지 테스트"""
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            json.dump({'notices': [self.make_notice(1)]}, f)
+        
+        store = HistoryStore(self.test_file, legacy_file=self.legacy_file)
+        store.replace([])
+        store = HistoryStore(self.test_file, legacy_file=self.legacy_file)
+        
+        # 검증
+        self.assertEqual(store.count(), 0)
+        self.assertIsNotNone(store.get_meta('legacy_imported'))
+    
+    def test_compact(self):
+        """정리 후에도 기록이 유지되는지 테스트"""
+        store = HistoryStore(self.test_file)
+        store.add([self.make_notice(i) for i in range(20)])
+        
+        store.compact()
+        
+        # 검증
+        self.assertEqual(store.count(), 20)
+
+class TestSubscriberStore(unittest.TestCase):
+    """sqlite 구독자 저장소 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_subscribers.db"
+        self.legacy_file = "test_subscribers_legacy.json"
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.test_file, f"{self.test_file}-wal", f"{self.test_file}-shm", self.legacy_file,
+                     "test_subscribers_legacy.db", "test_subscribers_legacy.db-wal", "test_subscribers_legacy.db-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def test_subscribe_lifecycle(self):
+        """가입, 중복 가입, 해지, 재가입 결과를 테스트"""
+        store = SubscriberStore(self.test_file)
+        
+        # 검증
+        self.assertEqual(store.subscribe('a@test.com')[0], CREATED)
+        self.assertEqual(store.subscribe('a@test.com')[0], ALREADY_ACTIVE)
+        self.assertEqual(store.unsubscribe('a@test.com'), 'unsubscribed')
+        self.assertEqual(store.unsubscribe('a@test.com'), ALREADY_INACTIVE)
+        self.assertEqual(store.unsubscribe('b@test.com'), NOT_FOUND)
+        self.assertIn('unsubscribed_at', store.get('a@test.com'))
+        
+        status, subscriber = store.subscribe('a@test.com')
+        self.assertEqual(status, REACTIVATED)
+        self.assertTrue(subscriber['active'])
+        self.assertNotIn('unsubscribed_at', subscriber)
+    
+    def test_concurrent_subscribes_not_lost(self):
+        """여러 연결에서 동시에 가입해도 가입이 유실되지 않는지 테스트"""
+        SubscriberStore(self.test_file)
+        
+        def subscribe(i):
+            return SubscriberStore(self.test_file).subscribe(f'user{i}@test.com')[0]
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(subscribe, range(40)))
+        
+        # 검증
+        self.assertEqual(results, [CREATED] * 40)
+        self.assertEqual(SubscriberStore(self.test_file).count(), 40)
+    
+    def test_json_path_imported_without_overwrite(self):
+        """JSON 구독자 파일 경로를 주면 같은 이름의 .db로 가져오고(active 플래그가 없으면 활성) JSON 파일은 그대로 두는지 테스트"""
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            json.dump({'subscribers': [
+                {'email': 'active@test.com', 'active': True},
+                {'email': 'inactive@test.com', 'active': False},
+                {'email': 'no_flag@test.com'}
+            ]}, f)
+        with open(self.legacy_file, 'rb') as f:
+            original = f.read()
+        
+        result = get_active_subscribers(self.legacy_file)
+        
+        # 검증
+        self.assertEqual([sub['email'] for sub in result], ['active@test.com', 'no_flag@test.com'])
+        self.assertEqual(len(load_subscribers(self.legacy_file)), 3)
+        self.assertTrue(os.path.exists("test_subscribers_legacy.db"))
+        with open(self.legacy_file, 'rb') as f:
+            self.assertEqual(f.read(), original)
+    
+    def test_store_reused_per_path(self):
+        """같은 경로에는 저장소를 한 번만 만들고, JSON 경로는 같은 이름의 .db 저장소를 쓰는지 테스트"""
+        first = get_subscriber_store(self.test_file)
+        
+        # 검증
+        self.assertIs(get_subscriber_store(self.test_file), first)
+        self.assertIs(get_subscriber_store("test_subscribers.json"), first)
+        self.assertIsNot(get_subscriber_store(self.legacy_file), first)
+    
+    def test_stats_follow_changes(self):
+        """트리거가 유지하는 구독자 수가 실제 수와 같고, 바뀔 때마다 버전이 오르는지 테스트"""
+        with sqlite3.connect(self.test_file) as conn:
+            conn.execute("CREATE TABLE subscribers (email TEXT PRIMARY KEY, active INTEGER NOT NULL DEFAULT 1, "
+                         "subscribed_at TEXT, unsubscribed_at TEXT)")
+            conn.execute("INSERT INTO subscribers (email, active) VALUES ('old@test.com', 1), ('gone@test.com', 0)")
+        conn.close()
+        
+        store = SubscriberStore(self.test_file)
+        before = store.stats()
+        store.subscribe('a@test.com')
+        store.subscribe('gone@test.com')
+        store.unsubscribe('old@test.com')
+        store.subscribe('a@test.com')  # 이미 활성 (변화 없음)
+        after = store.stats()
+        
+        # 검증
+        self.assertEqual((before['count'], before['total_count']), (1, 2))
+        self.assertEqual((after['count'], after['total_count']), (store.count(active_only=True), store.count()))
+        self.assertEqual(after['version'] - before['version'], 3)
+    
+    def test_legacy_imported_once(self):
+        """기존 subscribers.json은 비어 있는 저장소에 한 번만 가져오는지 테스트"""
+        with open(self.legacy_file, 'w', encoding='utf-8') as f:
+            json.dump({'subscribers': [{'email': 'a@test.com', 'active': True}]}, f)
+        
+        store = SubscriberStore(self.test_file, legacy_file=self.legacy_file)
+        store.unsubscribe('a@test.com')
+        store = SubscriberStore(self.test_file, legacy_file=self.legacy_file)
+        
+        # 검증
+        self.assertEqual(store.count(), 1)
+        self.assertEqual(store.count(active_only=True), 0)
+    
+    def test_import_upserts_in_one_transaction(self):
+        """일괄 가져오기가 추가/재활성화/해지/변경 없음을 구분하고 구독자 수를 유지하는지 테스트"""
+        store = SubscriberStore(self.test_file)
+        store.subscribe('active@test.com')
+        store.subscribe('gone@test.com')
+        store.unsubscribe('gone@test.com')
+        
+        result = store.import_subscribers([
+            {'email': 'new@test.com'},
+            {'email': 'gone@test.com', 'active': True},
+            {'email': 'active@test.com', 'active': False},
+            {'email': 'same@test.com', 'active': False},
+        ], chunk_size=3)
+        result_again = store.import_subscribers([{'email': 'new@test.com'}, {'email': 'gone@test.com', 'active': True}])
+        
+        # 검증
+        self.assertEqual(result, {'created': 2, 'updated': 2, 'unchanged': 0})
+        self.assertEqual(result_again, {'created': 0, 'updated': 0, 'unchanged': 2})
+        self.assertTrue(store.get('gone@test.com')['active'])
+        self.assertNotIn('unsubscribed_at', store.get('gone@test.com'))
+        self.assertIn('unsubscribed_at', store.get('active@test.com'))
+        stats = store.stats()
+        self.assertEqual((stats['count'], stats['total_count']), (store.count(active_only=True), store.count()))
+    
+    def test_import_without_active_keeps_unsubscribed(self):
+        """active를 지정하지 않으면 새 이메일만 추가하고 해지한 구독자를 다시 활성화하지 않는지 테스트"""
+        store = SubscriberStore(self.test_file)
+        store.subscribe('gone@test.com')
+        store.unsubscribe('gone@test.com')
+        
+        result = store.import_subscribers([{'email': 'gone@test.com'}, {'email': 'new@test.com'}])
+        
+        # 검증
+        self.assertEqual(result, {'created': 1, 'updated': 0, 'unchanged': 1})
+        self.assertFalse(store.get('gone@test.com')['active'])
+        self.assertTrue(store.get('new@test.com')['active'])
+    
+    def test_import_rolled_back_on_error(self):
+        """가져오는 도중 실패하면 앞서 처리한 구독자도 기록되지 않는지 테스트"""
+        store = SubscriberStore(self.test_file)
+        
+        def records():
+            yield {'email': 'a@test.com'}
+            raise RuntimeError("입력 중단")
+        
+        # 검증
+        with self.assertRaises(RuntimeError):
+            store.import_subscribers(records(), chunk_size=1)
+        self.assertEqual(store.count(), 0)
+    
+    def test_iter_subscribers_pages(self):
+        """페이지 단위로 읽어도 가입 순서대로 모든 구독자를 반환하는지 테스트"""
+        store = SubscriberStore(self.test_file)
+        for i in range(7):
+            store.subscribe(f'user{i}@test.com')
+        store.unsubscribe('user3@test.com')
+        
+        # 검증
+        emails = [sub['email'] for sub in store.iter_subscribers(page_size=2)]
+        self.assertEqual(emails, [f'user{i}@test.com' for i in range(7)])
+        self.assertEqual(len(list(store.iter_subscribers(active_only=True, page_size=2))), 6)
+
+class TestBulkSubscribers(unittest.TestCase):
+    """구독자 일괄 가져오기/내보내기 테스트"""
+    
+    def setUp(self):
+        """테스트 전 설정"""
+        self.test_file = "test_bulk_subscribers.db"
+        self.store = SubscriberStore(self.test_file)
+    
+    def tearDown(self):
+        """테스트 후 정리"""
+        for path in (self.test_file, f"{self.test_file}-wal", f"{self.test_file}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def test_csv_import_validates_and_dedupes(self):
+        """잘못된 줄은 줄 번호와 함께 건너뛰고, 같은 이메일은 처음 줄만 반영하는지 테스트"""
+        lines = ['email,active\n', 'a@test.com,1\n', 'invalid,1\n', 'a@test.com,0\n', 'b@test.com,no\n', 'c@test.com,maybe\n']
+        
+        report = bulk.import_subscribers(lines, 'csv', self.store)
+        
+        # 검증
+        self.assertEqual((report['received'], report['created'], report['duplicates'], report['invalid']), (5, 2, 1, 2))
+        self.assertEqual([error['line'] for error in report['errors']], [3, 6])
+        self.assertTrue(self.store.get('a@test.com')['active'])
+        self.assertFalse(self.store.get('b@test.com')['active'])
+    
+    def test_input_read_before_write_lock(self):
+        """입력을 읽는 동안에는 쓰기 잠금을 잡지 않아 다른 가입이 기다리지 않는지 테스트"""
+        def lines():
+            yield 'email\n'
+            # 가져오기가 쓰기 잠금을 잡고 있다면 바로 'database is locked' 오류
+            conn = sqlite3.connect(self.test_file, timeout=0)
+            conn.execute("BEGIN IMMEDIATE")
+            conn.rollback()
+            conn.close()
+            yield 'a@test.com\n'
+        
+        report = bulk.import_subscribers(lines(), 'csv', self.store)
+        
+        # 검증
+        self.assertEqual(report['created'], 1)
+    
+    def test_plain_email_list_keeps_unsubscribed(self):
+        """active 열이 없는 목록이나 일괄 구독은 해지한 구독자를 다시 활성화하지 않는지 테스트"""
+        self.store.subscribe('gone@test.com')
+        self.store.unsubscribe('gone@test.com')
+        
+        csv_report = bulk.import_subscribers(['gone@test.com\n', 'new@test.com\n'], 'csv', self.store)
+        batch_report = bulk.subscribe_emails(['gone@test.com'], self.store)
+        
+        # 검증
+        self.assertEqual((csv_report['created'], csv_report['updated'], csv_report['unchanged']), (1, 0, 1))
+        self.assertEqual((batch_report['updated'], batch_report['unchanged']), (0, 1))
+        self.assertFalse(self.store.get('gone@test.com')['active'])
+    
+    def test_headerless_csv_and_ndjson(self):
+        """머리글 없는 CSV는 첫 열을, NDJSON은 객체 또는 문자열 줄을 이메일로 읽는지 테스트"""
+        csv_report = bulk.import_subscribers(['a@test.com,홍길동\n', 'b@test.com\n'], 'csv', self.store)
+        ndjson_report = bulk.import_subscribers(['"c@test.com"\n', '{"email": "a@test.com", "active": false}\n', '{broken\n'],
+                                                'ndjson', self.store)
+        
+        # 검증
+        self.assertEqual(csv_report['created'], 2)
+        self.assertEqual((ndjson_report['created'], ndjson_report['updated'], ndjson_report['invalid']), (1, 1, 1))
+        self.assertEqual(self.store.count(active_only=True), 2)
+    
+    def test_export_round_trip(self):
+        """내보낸 CSV/NDJSON을 다시 가져오면 변경이 없는지 테스트"""
+        for i in range(5):
+            self.store.subscribe(f'user{i}@test.com')
+        self.store.unsubscribe('user1@test.com')
+        
+        for fmt in ('csv', 'ndjson'):
+            chunks = list(bulk.export_subscribers(fmt, store=self.store, page_size=2))
+            lines = ''.join(chunks).splitlines(keepends=True)
+            report = bulk.import_subscribers(lines, fmt, self.store)
+            
+            # 검증
+            self.assertGreater(len(chunks), 1)
+            self.assertEqual((report['unchanged'], report['created'], report['updated']), (5, 0, 0))
+        active_lines = ''.join(bulk.export_subscribers('ndjson', active_only=True, store=self.store)).splitlines()
+        self.assertEqual(len(active_lines), 4)
+
 class TestSubscribersLogic(unittest.TestCase):
     """구독자 로직 테스트 (실제 파일 없이)"""
     
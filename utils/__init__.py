@@ -1,5 +1,6 @@
 # 유틸리티 패키지
 
 from .logger import get_logger, GNLogger
+from .rate_limiter import RateLimiter
 
-__all__ = ['get_logger', 'GNLogger'] 
\ No newline at end of file
+__all__ = ['get_logger', 'GNLogger', 'RateLimiter'] 
\ No newline at end of file
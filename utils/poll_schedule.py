@@ -0,0 +1,69 @@
+# 데몬 모드 폴링 간격 계산
+# 평일 업무 시간과 새 공지사항이 올라온 직후에는 자주, 야간과 주말에는 드물게 확인
+
+from datetime import datetime, timedelta, timezone
+import sys
+import os
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (DAEMON_ACTIVE_INTERVAL, DAEMON_IDLE_INTERVAL, DAEMON_QUIET_INTERVAL, DAEMON_RECENT_INTERVAL,
+                    DAEMON_RECENT_WINDOW, DAEMON_OFFICE_HOURS, DAEMON_NIGHT_HOURS)
+
+# 한국 표준시 (서머타임 없음)
+KST = timezone(timedelta(hours=9), "KST")
+
+def now_kst():
+    """현재 한국 시간"""
+    return datetime.now(KST)
+
+def is_office_hours(now):
+    """평일 업무 시간인지 확인"""
+    start, end = DAEMON_OFFICE_HOURS
+    return now.weekday() < 5 and start <= now.hour < end
+
+def is_quiet_hours(now):
+    """야간 또는 주말인지 확인"""
+    night_start, night_end = DAEMON_NIGHT_HOURS
+    return now.weekday() >= 5 or now.hour >= night_start or now.hour < night_end
+
+def seconds_until_office_hours(now):
+    """
+    다음 평일 업무 시작까지 남은 시간을 계산합니다.
+
+    Returns:
+        float: 초 (업무 시간 중이면 0)
+    """
+    if is_office_hours(now):
+        return 0
+    start = now.replace(hour=DAEMON_OFFICE_HOURS[0], minute=0, second=0, microsecond=0)
+    for days in range(8):
+        candidate = start + timedelta(days=days)
+        if candidate > now and candidate.weekday() < 5:
+            return (candidate - now).total_seconds()
+    return 0
+
+def next_poll_interval(now, last_activity=None, failures=0):
+    """
+    다음 확인까지 기다릴 시간을 계산합니다.
+
+    Args:
+        now (datetime): 현재 시간 (KST)
+        last_activity (datetime): 마지막으로 새 공지사항을 발견한 시간
+        failures (int): 연속 실패 횟수 (실패가 이어지면 간격을 늘림)
+
+    Returns:
+        float: 대기 시간(초)
+    """
+    if failures:
+        return min(DAEMON_ACTIVE_INTERVAL * 2 ** (failures - 1), DAEMON_QUIET_INTERVAL)
+
+    if last_activity and (now - last_activity).total_seconds() < DAEMON_RECENT_WINDOW:
+        return DAEMON_RECENT_INTERVAL
+
+    if is_office_hours(now):
+        return DAEMON_ACTIVE_INTERVAL
+
+    interval = DAEMON_QUIET_INTERVAL if is_quiet_hours(now) else DAEMON_IDLE_INTERVAL
+    # 업무 시작 직후 올라오는 공지사항을 늦게 보지 않도록 업무 시작 시각에 맞춰 깨어남
+    return max(1, min(interval, seconds_until_office_hours(now)))
@@ -0,0 +1,36 @@
+# 전송 속도 제한기
+
+import threading
+import time
+
+class RateLimiter:
+    """초당 허용 횟수를 넘지 않도록 호출 간격을 조절하는 토큰 버킷"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): 초당 허용 횟수 (0 이하이면 제한 없음)
+            burst (int): 한 번에 몰아서 허용할 최대 횟수
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)